@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+성경 전체 grammarAnalysis 자동 생성 (오프라인 일괄 처리)
+
+성경 본문 파일을 한 줄씩 읽어 HuSpaCy 모델(hungarian_nlp_server.load_hungarian_model)로
+형태 분석한 뒤, 형태 자질을 커리큘럼 강의에 연결해 bible-verses-sample.json과 같은 형식의
+구절 레코드를 샤드 파일(JSON Lines)로 기록한다.
+- nlp.pipe(n_process=N)를 전체 입력에 한 번만 호출 (워커 프로세스/모델 로드는 한 번)
+- 파서/NER은 끄고 형태 분석에 필요한 컴포넌트만 실행
+- 샤드(기본 2000구절)마다 임시 파일에 쓴 뒤 교체하고 체크포인트 기록 → 중단 후 재실행하면 이어서 처리
+- 샤드마다 처리량(구절/초)과 남은 시간 출력
+
+입력 형식
+- .jsonl: {"book", "chapter", "verse", "text" 또는 "textHungarian", "textKorean"(선택)}
+- 그 외(.tsv/.txt): book<TAB>chapter<TAB>verse<TAB>text  (# 으로 시작하는 줄은 무시)
+
+사용 예
+    python bible_enrichment.py karoli.tsv enriched/ --processes 8
+    python bible_enrichment.py karoli.tsv enriched/ --merge ../src/data/bible-verses.json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from itertools import groupby
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from loguru import logger
+
+import hungarian_nlp_server as server
+
+CEFR_LEVELS = ("A1", "A2", "B1", "B2")
+CHECKPOINT_FILE = "checkpoint.json"
+SHARD_PATTERN = "verses-{:05d}.jsonl"
+
+# 형태 분석에 필요 없는 컴포넌트 (있으면 끔)
+DISABLED_COMPONENTS = ("parser", "ner", "experimental_arc_predicter", "experimental_arc_labeler")
+
+ANY = None
+
+# (형태 자질 조건, 품사 조건, 문법 주제, 레벨, 강의 제목) - 강의 제목은 "레벨-강의 목차 제목 앞부분" 형식
+MORPH_LESSONS: Tuple[Tuple[Dict[str, Any], Optional[set], str, str, Optional[str]], ...] = (
+    ({"Case": {"Ine", "Ela", "Ill", "Sup", "Del", "Sub", "Ade", "Abl", "All"}}, None, "장소격", "A2", "A2-장소격 3형제"),
+    ({"Case": {"Acc"}}, None, "대격", "A1", "A1-주격과 대격"),
+    ({"Case": {"Dat"}}, None, "여격", "A1", "A1-소유격과 여격"),
+    ({"Case": {"Ins", "Tra"}}, None, "도구격", "A2", "A2-도구격(-val)과 변격(-vá)"),
+    ({"Person[psor]": ANY}, None, "소유형", "A2", "A2-소유격 심화"),
+    ({"Tense": {"Past"}}, {"VERB", "AUX"}, "과거시제", "A2", "A2-과거시제 기본"),
+    ({"Tense": {"Pres"}, "VerbForm": {"Fin"}}, {"VERB"}, "현재시제", "A1", "A1-현재시제 완전 정복"),
+    ({"Mood": {"Cnd"}}, None, "조건법", "A2", "A2-조건법 기초"),
+    ({"Mood": {"Imp"}}, None, "접속법", "A2", "A2-명령형과 청유형"),
+    ({"Mood": {"Pot"}}, None, "가능형", "B1", "B1-가능형"),
+    ({"Definite": {"Def"}}, {"VERB"}, "정활용", "B1", "B1-정관사 활용"),
+    ({"Degree": {"Cmp", "Sup"}}, None, "비교급", "A2", "A2-비교급과 최상급"),
+    ({"VerbForm": {"Inf"}}, None, "부정사", "A2", None),
+    ({"VerbForm": {"Part"}}, None, "분사", "B1", "B1-분사 3총사"),
+    ({"VerbForm": {"Conv"}}, None, "부사분사", "B2", "B2-분사 구문 활용"),
+    ({"PronType": {"Rel"}}, None, "관계대명사", "A2", "A2-관계대명사"),
+    ({"Number": {"Plur"}}, {"NOUN"}, "복수형", "A1", "A1-명사의 기초"),
+    ({"Polarity": {"Neg"}}, None, "부정문", "A1", "A1-부정문 만들기"),
+)
+
+# (품사, 기본형(없으면 모두)) → (문법 주제, 레벨, 강의 제목)
+POS_LESSONS: Dict[Tuple[str, Optional[str]], Tuple[str, str, str]] = {
+    ("DET", "a"): ("관사", "A1", "A1-관사 사용법"),
+    ("DET", "az"): ("관사", "A1", "A1-관사 사용법"),
+    ("CCONJ", None): ("접속사", "A2", "A2-접속사 마스터"),
+    ("SCONJ", None): ("접속사", "A2", "A2-접속사 마스터"),
+    ("NUM", None): ("숫자", "A1", "A1-숫자와 시간 표현"),
+    ("ADP", None): ("후치사", "A1", "A1-위치 전치사"),
+    ("VERB", "van"): ("be동사", "A1", "A1-be 동사"),
+    ("AUX", "van"): ("be동사", "A1", "A1-be 동사"),
+}
+
+POS_LABELS = {
+    "NOUN": "명사", "PROPN": "고유명사", "VERB": "동사", "AUX": "조동사", "ADJ": "형용사",
+    "ADV": "부사", "PRON": "대명사", "DET": "관사", "CCONJ": "접속사", "SCONJ": "접속사",
+    "ADP": "후치사", "NUM": "수사", "PART": "소사", "INTJ": "감탄사",
+}
+
+CASE_LABELS = {
+    "Nom": "주격", "Acc": "대격 (-t)", "Dat": "여격 (-nak/-nek)", "Gen": "소유격",
+    "Ine": "내격 (-ban/-ben)", "Ela": "출격 (-ból/-ből)", "Ill": "입격 (-ba/-be)",
+    "Sup": "상격 (-on/-en/-ön)", "Del": "탈격 (-ról/-ről)", "Sub": "승격 (-ra/-re)",
+    "Ade": "접격 (-nál/-nél)", "Abl": "이격 (-tól/-től)", "All": "향격 (-hoz/-hez/-höz)",
+    "Ins": "도구격 (-val/-vel)", "Tra": "변격 (-vá/-vé)", "Ter": "한계격 (-ig)",
+    "Ess": "양태격 (-ként)", "Cau": "원인격 (-ért)",
+}
+
+FEATURE_LABELS = {
+    ("Tense", "Past"): "과거시제", ("Tense", "Pres"): "현재시제",
+    ("Mood", "Cnd"): "조건법", ("Mood", "Imp"): "명령법/접속법", ("Mood", "Pot"): "가능형 (-hat/-het)",
+    ("Definite", "Def"): "정활용", ("Definite", "Ind"): "부정활용",
+    ("Degree", "Cmp"): "비교급", ("Degree", "Sup"): "최상급",
+    ("VerbForm", "Inf"): "부정사 (-ni)", ("VerbForm", "Part"): "분사", ("VerbForm", "Conv"): "부사분사 (-va/-ve)",
+    ("Number", "Plur"): "복수",
+}
+
+NUMBER_LABELS = {"Sing": "단수", "Plur": "복수"}
+
+# 한 구절의 토큰 수가 이보다 많으면 난이도 한 단계 올림
+LONG_VERSE_TOKENS = 18
+
+
+def read_verses(path: str) -> Iterator[Dict[str, Any]]:
+    """입력 파일을 한 줄씩 읽어 구절 레코드로 (파일 전체를 메모리에 올리지 않음)"""
+    is_jsonl = path.endswith(".jsonl")
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            try:
+                if is_jsonl:
+                    record = json.loads(line)
+                    text = record.get("textHungarian") or record["text"]
+                    book, chapter, verse = record["book"], int(record["chapter"]), int(record["verse"])
+                    korean = record.get("textKorean", "")
+                else:
+                    book, chapter, verse, text = line.split("\t", 3)
+                    chapter, verse, korean = int(chapter), int(verse), ""
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_number}: malformed verse line ({e})") from e
+            yield {
+                "book": book.strip(),
+                "bookHungarian": (record.get("bookHungarian") if is_jsonl else None) or book.strip(),
+                "chapter": chapter,
+                "verse": verse,
+                "textHungarian": text.strip(),
+                "textKorean": korean,
+            }
+
+
+def _morph_matches(morph: Dict[str, List[str]], conditions: Dict[str, Any]) -> bool:
+    for feature, values in conditions.items():
+        present = morph.get(feature)
+        if not present or (values is not ANY and not values.intersection(present)):
+            return False
+    return True
+
+
+def _feature_description(pos: str, morph: Dict[str, List[str]]) -> str:
+    """형태 자질 → 한국어 설명 ("과거시제 3인칭 단수, 정활용")"""
+    parts = [CASE_LABELS[case] for case in morph.get("Case", []) if case in CASE_LABELS and case != "Nom"]
+    for feature in ("Tense", "Mood", "VerbForm", "Degree"):
+        parts.extend(FEATURE_LABELS[(feature, value)] for value in morph.get(feature, []) if (feature, value) in FEATURE_LABELS)
+    if pos in ("VERB", "AUX") and morph.get("Person") and morph.get("Number"):
+        parts.append(f"{morph['Person'][0]}인칭 {NUMBER_LABELS.get(morph['Number'][0], '')}".strip())
+    elif morph.get("Number") == ["Plur"]:
+        parts.append("복수")
+    if morph.get("Person[psor]"):
+        number = NUMBER_LABELS.get((morph.get("Number[psor]") or [""])[0], "")
+        parts.append(f"소유 {morph['Person[psor]'][0]}인칭 {number}".strip())
+    for value in morph.get("Definite", []):
+        if pos == "VERB" and ("Definite", value) in FEATURE_LABELS:
+            parts.append(FEATURE_LABELS[("Definite", value)])
+    return ", ".join(parts) or "기본형"
+
+
+def analyze_token(token) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+    """토큰 하나 → (grammarAnalysis 항목, 문법 주제 목록), 구두점/공백은 None"""
+    if token.is_punct or token.is_space:
+        return None
+    pos = token.pos_
+    lemma = token.lemma_ or token.text
+    morph = token.morph.to_dict()
+    morph = {feature: value.split(",") for feature, value in morph.items()}
+
+    matches = [
+        (topic, level, lesson)
+        for conditions, pos_filter, topic, level, lesson in MORPH_LESSONS
+        if (pos_filter is None or pos in pos_filter) and _morph_matches(morph, conditions)
+    ]
+    pos_match = POS_LESSONS.get((pos, lemma.lower())) or POS_LESSONS.get((pos, None))
+    if pos_match:
+        matches.append(pos_match)
+
+    # 가장 높은 레벨의 강의를 대표 강의로
+    with_lesson = [match for match in matches if match[2]]
+    level, lesson_title = "A1", None
+    if with_lesson:
+        _, level, lesson_title = max(with_lesson, key=lambda match: CEFR_LEVELS.index(match[1]))
+    elif matches:
+        level = max((match[1] for match in matches), key=CEFR_LEVELS.index)
+
+    analysis = {
+        "word": token.text,
+        "lemma": lemma,
+        "pos": POS_LABELS.get(pos, pos),
+        "meaning": "",
+        "grammarFeature": _feature_description(pos, morph),
+        "level": level,
+        "relatedLesson": lesson_title.split("-", 1)[1] if lesson_title else None,
+        "relatedLessonTitle": lesson_title,
+        "morph": str(token.morph),
+    }
+    return analysis, [topic for topic, _, _ in matches]
+
+
+def enrich_verse(record: Dict[str, Any], doc) -> Dict[str, Any]:
+    """구절 레코드 + spaCy Doc → bible-verses-sample.json 형식 레코드"""
+    analysis, topics = [], []
+    for token in doc:
+        result = analyze_token(token)
+        if result is None:
+            continue
+        analysis.append(result[0])
+        topics.extend(topic for topic in result[1] if topic not in topics)
+
+    levels = [CEFR_LEVELS.index(word["level"]) for word in analysis] or [0]
+    difficulty = max(levels) + (1 if len(analysis) > LONG_VERSE_TOKENS else 0)
+    lemmas = {word["lemma"].lower() for word in analysis}
+    theological = sorted(lemmas & server.THEOLOGICAL_TERMS.keys())
+    return {
+        **record,
+        "difficulty": CEFR_LEVELS[min(difficulty, len(CEFR_LEVELS) - 1)],
+        "grammarTopics": topics,
+        "vocabularyCount": len(lemmas),
+        "sermonRelevance": bool(theological),
+        "theologicalTheme": ", ".join(server.THEOLOGICAL_TERMS[term]["korean"] for term in theological),
+        "grammarAnalysis": analysis,
+    }
+
+
+def _shard_files(output_dir: str) -> List[str]:
+    return sorted(name for name in os.listdir(output_dir) if name.startswith("verses-") and name.endswith(".jsonl"))
+
+
+def read_completed(output_dir: str) -> Dict[int, int]:
+    """체크포인트에 기록된 완료 샤드 {샤드 번호: 구절 수} (체크포인트가 없으면 빈 dict)"""
+    path = os.path.join(output_dir, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {int(shard): count for shard, count in json.load(f)["completed"].items()}
+
+
+class Checkpoint:
+    """완료된 샤드 기록 (입력 파일/샤드 크기가 바뀌면 이전 샤드를 지우고 처음부터)"""
+
+    def __init__(self, output_dir: str, input_path: str, shard_size: int):
+        self.path = os.path.join(output_dir, CHECKPOINT_FILE)
+        stat = os.stat(input_path)
+        self.identity = {
+            "input": os.path.abspath(input_path),
+            "input_size": stat.st_size,
+            "input_mtime": int(stat.st_mtime),
+            "shard_size": shard_size,
+        }
+        self.completed: Dict[int, int] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("identity") == self.identity:
+                self.completed = {int(shard): count for shard, count in saved["completed"].items()}
+            else:
+                logger.warning("Input or shard size changed since the last run, starting over")
+                self.reset(output_dir)
+
+    def reset(self, output_dir: str) -> None:
+        """이전 입력으로 만든 샤드 삭제 - 샤드 경계가 달라 새 샤드와 섞이면 구절이 중복/누락됨"""
+        self.completed = {}
+        self.save()
+        for name in _shard_files(output_dir):
+            os.unlink(os.path.join(output_dir, name))
+
+    def is_done(self, shard: int, output_dir: str) -> bool:
+        return shard in self.completed and os.path.exists(os.path.join(output_dir, SHARD_PATTERN.format(shard)))
+
+    def mark(self, shard: int, count: int) -> None:
+        self.completed[shard] = count
+        self.save()
+
+    def save(self) -> None:
+        _atomic_write(self.path, json.dumps({"identity": self.identity, "completed": self.completed}, indent=2))
+
+
+def _atomic_write(path: str, content: str) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_pipeline():
+    """서버와 같은 모델 로드 후 형태 분석에 필요 없는 컴포넌트 비활성화"""
+    server.load_hungarian_model()
+    nlp = server.nlp
+    if not any(name in nlp.pipe_names for name in ("morphologizer", "tagger")):
+        raise RuntimeError("Loaded spaCy model has no morphologizer/tagger - install hu_core_news_lg/md/sm first")
+    disabled = [name for name in DISABLED_COMPONENTS if name in nlp.pipe_names]
+    if disabled:
+        nlp.select_pipes(disable=disabled)
+    logger.info(f"Pipeline: {nlp.pipe_names} (disabled: {disabled})")
+    return nlp
+
+
+def run(input_path: str, output_dir: str, shard_size: int = 2000, processes: int = 0, batch_size: int = 256) -> int:
+    """남은 샤드 처리 - 이번 실행에서 처리한 구절 수 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint = Checkpoint(output_dir, input_path, shard_size)
+    total = sum(1 for _ in read_verses(input_path))
+    pending = sum(
+        min(shard_size, total - shard * shard_size)
+        for shard in range((total + shard_size - 1) // shard_size)
+        if not checkpoint.is_done(shard, output_dir)
+    )
+    logger.info(f"{total} verses, {pending} to process ({len(checkpoint.completed)} shards already done)")
+    if not pending:
+        return 0
+
+    nlp = load_pipeline()
+    processes = processes or os.cpu_count() or 1
+    # 완료된 샤드는 건너뛰고 남은 구절만 한 번의 pipe 호출로 흘려 보냄 (순서 유지)
+    remaining = (
+        (record["textHungarian"], (position // shard_size, record))
+        for position, record in enumerate(read_verses(input_path))
+        if not checkpoint.is_done(position // shard_size, output_dir)
+    )
+    docs = nlp.pipe(remaining, as_tuples=True, n_process=processes, batch_size=batch_size)
+
+    started = time.monotonic()
+    processed = 0
+    for shard, group in groupby(docs, key=lambda item: item[1][0]):
+        lines = [json.dumps(enrich_verse(record, doc), ensure_ascii=False) for doc, (_, record) in group]
+        _atomic_write(os.path.join(output_dir, SHARD_PATTERN.format(shard)), "\n".join(lines) + "\n")
+        checkpoint.mark(shard, len(lines))
+
+        processed += len(lines)
+        elapsed = time.monotonic() - started
+        rate = processed / elapsed if elapsed else 0.0
+        eta = (pending - processed) / rate if rate else 0.0
+        logger.info(f"shard {shard}: {processed}/{pending} verses, {rate:.0f} verses/s, ETA {eta:.0f}s")
+    return processed
+
+
+def merge_shards(output_dir: str, target: str) -> int:
+    """체크포인트에 완료로 기록된 샤드만 하나의 JSON 배열 파일로 합침 (백엔드 구절 저장소 입력 형식)"""
+    completed = read_completed(output_dir)
+    stray = set(_shard_files(output_dir)) - {SHARD_PATTERN.format(shard) for shard in completed}
+    if stray:
+        logger.warning(f"Skipping {len(stray)} shard files not recorded in the checkpoint")
+    count = 0
+    directory = os.path.dirname(os.path.abspath(target))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            out.write("[\n")
+            for shard in sorted(completed):
+                name = SHARD_PATTERN.format(shard)
+                written = 0
+                with open(os.path.join(output_dir, name), "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            out.write((",\n" if count else "") + line.rstrip("\n"))
+                            count += 1
+                            written += 1
+                if written != completed[shard]:
+                    raise ValueError(f"{name}: {written} verses, checkpoint recorded {completed[shard]}")
+            out.write("\n]\n")
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="성경 전체 grammarAnalysis 자동 생성")
+    parser.add_argument("input", help="성경 본문 파일 (.jsonl 또는 TSV)")
+    parser.add_argument("output_dir", help="샤드/체크포인트 디렉토리")
+    parser.add_argument("--shard-size", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=0, help="spaCy 워커 프로세스 수 (0 = CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--merge", help="완료 후 모든 샤드를 합친 JSON 배열 파일 경로")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    processed = run(args.input, args.output_dir, args.shard_size, args.processes, args.batch_size)
+    logger.info(f"Processed {processed} verses in {time.monotonic() - started:.1f}s")
+    if args.merge:
+        logger.info(f"Merged {merge_shards(args.output_dir, args.merge)} verses into {args.merge}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+멀티 워커 실행 설정: gunicorn -c gunicorn.conf.py hungarian_nlp_server:app
+
+- preload_app: 마스터가 앱과 spaCy 모델을 한 번만 로드하고 워커를 fork
+  → 워커들이 모델 메모리를 copy-on-write로 공유 (워커 수만큼 모델을 따로 올리지 않음)
+- 개발 시에는 기존처럼 python hungarian_nlp_server.py (reload 모드)
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('HUNGARIAN_NLP_PORT', '8001')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = 120
+loglevel = "info"
+
+
+def on_starting(server):
+    """워커 fork 전에 마스터에서 모델 로드"""
+    from hungarian_nlp_server import preload_hungarian_model
+    preload_hungarian_model()
@@ -64,6 +64,17 @@ def load_hungarian_model():
                 nlp = spacy.blank("hu")
                 logger.warning("No pre-trained Hungarian model found, using blank model")
 
+def preload_hungarian_model():
+    """멀티 워커 실행 시 마스터 프로세스에서 모델을 미리 로드 (gunicorn.conf.py 참고)
+
+    fork된 워커는 모델 메모리를 copy-on-write로 공유한다. gc.freeze()로 로드된 객체를
+    GC 추적 대상에서 빼 두어야 워커의 GC가 객체 헤더를 건드려 페이지가 복사되지 않는다.
+    """
+    import gc
+    load_hungarian_model()
+    gc.collect()
+    gc.freeze()
+
 # 요청/응답 모델들
 class TextAnalysisRequest(BaseModel):
     text: str
@@ -173,8 +184,9 @@ HUNGARIAN_GRAMMAR_RULES = [
 
 @app.on_event("startup")
 async def startup_event():
-    """서버 시작 시 모델 로드"""
-    load_hungarian_model()
+    """서버 시작 시 모델 로드 (마스터에서 미리 로드된 경우 생략)"""
+    if nlp is None:
+        load_hungarian_model()
     logger.info("Hungarian NLP Server started successfully")
 
 @app.get("/")
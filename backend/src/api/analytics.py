@@ -0,0 +1,199 @@
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
+
+from src.lib.auth import get_user_id, optional_user_id
+from src.services.analytics_store import get_analytics_store
+from src.services.curriculum_graph import get_curriculum_graph, get_lesson_progress_store
+from src.services.session_ingest import IngestError, get_ingest_pipeline, parse_events, validate_event
+from src.services.trend_forecast import get_trend_forecaster, milestone_predictions
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+# 학습 대시보드
+@router.get("/dashboard")
+async def get_analytics_dashboard(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    # 학습 시간/연속 일수/주별 통계/최근 세션은 세션 합계에서 계산
+    store = get_analytics_store()
+    user_id = optional_user_id(credentials)
+    totals = store.summary(user_id)
+    improvements = store.skill_improvements(user_id)
+    dashboard = {
+        "success": True,
+        "data": {
+            "overall_progress": {
+                "current_level": "A2",
+                "level_progress": 68,
+                "total_study_hours": round(totals["minutes"] / 60, 1),
+                "streak_days": store.streak_days(user_id),
+                "vocabulary_mastered": int(totals["vocabulary"]),
+                "grammar_concepts_learned": int(totals["grammar"])
+            },
+            "skill_progress": [
+                {
+                    "skill": "vocabulary",
+                    "current_level": "A2",
+                    "target_level": "B1",
+                    "progress_percentage": 75,
+                    "recent_improvement": 8,
+                    "strength_areas": ["신학 어휘", "일상 표현"],
+                    "weakness_areas": ["추상적 개념", "관용구"]
+                },
+                {
+                    "skill": "grammar",
+                    "current_level": "A1",
+                    "target_level": "A2",
+                    "progress_percentage": 45,
+                    "recent_improvement": -2,
+                    "strength_areas": ["기본 어순", "현재시제"],
+                    "weakness_areas": ["격변화", "과거시제"]
+                },
+                {
+                    "skill": "listening",
+                    "current_level": "A2",
+                    "target_level": "B1",
+                    "progress_percentage": 62,
+                    "recent_improvement": 12,
+                    "strength_areas": ["느린 발음", "짧은 대화"],
+                    "weakness_areas": ["빠른 발음", "방언"]
+                },
+                {
+                    "skill": "speaking",
+                    "current_level": "A1",
+                    "target_level": "A2",
+                    "progress_percentage": 38,
+                    "recent_improvement": 5,
+                    "strength_areas": ["발음", "인사"],
+                    "weakness_areas": ["문법 정확성", "유창성"]
+                },
+                {
+                    "skill": "reading",
+                    "current_level": "A2",
+                    "target_level": "B1",
+                    "progress_percentage": 71,
+                    "recent_improvement": 6,
+                    "strength_areas": ["짧은 텍스트", "신학 문서"],
+                    "weakness_areas": ["긴 문장", "문학적 표현"]
+                },
+                {
+                    "skill": "writing",
+                    "current_level": "A1",
+                    "target_level": "A2",
+                    "progress_percentage": 42,
+                    "recent_improvement": 3,
+                    "strength_areas": ["단문", "기본 표현"],
+                    "weakness_areas": ["복문", "문단 구성"]
+                }
+            ],
+            "recent_sessions": store.recent_sessions(user_id, 3),
+            "learning_goals": [
+                {
+                    "goal_id": "1",
+                    "goal_description": "A2 레벨 달성",
+                    "target_date": "2024-12-31",
+                    "progress_percentage": 68,
+                    "milestones_completed": 8,
+                    "total_milestones": 12,
+                    "estimated_completion_date": "2024-12-28",
+                    "is_on_track": True
+                },
+                {
+                    "goal_id": "2",
+                    "goal_description": "설교문 500단어 작성 능력",
+                    "target_date": "2025-02-01",
+                    "progress_percentage": 35,
+                    "milestones_completed": 2,
+                    "total_milestones": 8,
+                    "estimated_completion_date": "2025-02-15",
+                    "is_on_track": False
+                }
+            ],
+            "weekly_stats": store.weekly_stats(user_id, 4),
+            "performance_insights": {
+                "strongest_skill": "vocabulary",
+                "weakest_skill": "speaking",
+                "optimal_study_time": "오후 2시-4시",
+                "learning_velocity": 1.2,
+                "predicted_next_level_date": "2024-12-28"
+            },
+            "korean_adaptation_analysis": {
+                "interference_score": 65,
+                "common_mistakes": ["격변화 혼동", "어순 오류", "조사 생략"],
+                "improvement_trends": ["발음 정확도 향상", "어휘량 증가"],
+                "cultural_adaptation_level": 78
+            }
+        }
+    }
+    for skill in dashboard["data"]["skill_progress"]:
+        skill["recent_improvement"] = improvements.get(skill["skill"], 0)
+    return dashboard
+
+@router.get("/skill-trends")
+async def get_skill_trends(
+    current_level: str = "A2",
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    # 예측은 백그라운드에서 적합된 캐시만 사용
+    user_id = optional_user_id(credentials)
+    graph = get_curriculum_graph()
+    forecast = get_trend_forecaster().get(user_id)
+    completed = get_lesson_progress_store().completed(user_id) | graph.levels_below(current_level.upper())
+    return {
+        "success": True,
+        "data": {
+            "skill_trends": get_analytics_store().monthly_trends(user_id, 4),
+            "prediction": {
+                "next_month_estimates": forecast["estimates"] if forecast else {},
+                "milestone_predictions": milestone_predictions(forecast, graph, completed, current_level.upper()),
+                "generated_at": forecast["fitted_at"] if forecast else None,
+                "pending_update": forecast["stale"] if forecast else user_id is not None
+            }
+        }
+    }
+
+@router.post("/study-session", status_code=202)
+async def log_study_session(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """세션/하트비트 이벤트 수집 (JSON 객체, JSON 배열 또는 NDJSON) - 로그 기록 후 바로 응답"""
+    user_id = get_user_id(credentials)
+    pipeline = get_ingest_pipeline()
+    try:
+        events = parse_events(await request.body(), request.headers.get("content-type", ""))
+        validated = []
+        for line, event in enumerate(events, start=1):
+            try:
+                validated.append(validate_event(event))
+            except (ValueError, TypeError, OverflowError) as e:
+                raise IngestError(400, f"Event {line}: {e}")
+        accepted = await pipeline.submit(user_id, validated)
+    except IngestError as e:
+        headers = {"Retry-After": "1"} if e.status_code == 429 else None
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=headers)
+    # 통계는 작업자가 반영한 시점 기준 (방금 보낸 이벤트는 아직 포함되지 않을 수 있음)
+    store = get_analytics_store()
+    return {
+        "success": True,
+        "data": {
+            "session_logged": True,
+            "accepted_events": accepted,
+            "queue_depth": pipeline.depth,
+            "updated_statistics": {
+                "total_study_time": f"{store.summary(user_id)['minutes'] / 60:.1f} hours",
+                "streak_days": store.streak_days(user_id),
+                "skill_improvements": [skill for skill, delta in store.skill_improvements(user_id).items() if delta > 0]
+            }
+        }
+    }
+
+@router.get("/ingest-stats")
+async def get_ingest_stats():
+    return {
+        "success": True,
+        "data": get_ingest_pipeline().stats()
+    }
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
+from typing import Optional, List
+
+from src.lib.auth import optional_user_id
+from src.services.adaptive_assessment import AssessmentError, get_assessment_engine
+
+router = APIRouter(prefix="/api/assessment", tags=["assessment"])
+optional_security = HTTPBearer(auto_error=False)
+
+# Request/Response 모델들
+class AssessmentStartRequest(BaseModel):
+    skill_areas: Optional[List[str]] = None
+    starting_level: Optional[str] = None
+
+class AssessmentResponseRequest(BaseModel):
+    question_id: str
+    user_answer: str = ""
+    time_taken_seconds: Optional[float] = None
+
+def run_assessment(action, *args, **kwargs):
+    """평가 엔진 호출 결과를 API 응답 형식으로 변환"""
+    try:
+        return {"success": True, "data": action(*args, **kwargs)}
+    except AssessmentError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+@router.post("/start")
+async def start_assessment(
+    request: Optional[AssessmentStartRequest] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    """평가 시작 - 인증된 사용자의 응답만 문항 난이도 보정에 반영"""
+    request = request or AssessmentStartRequest()
+    return run_assessment(
+        get_assessment_engine().start,
+        skill_areas=request.skill_areas,
+        starting_level=request.starting_level,
+        calibrate=optional_user_id(credentials) is not None
+    )
+
+@router.post("/{session_id}/respond")
+async def submit_response(session_id: str, request: AssessmentResponseRequest):
+    return run_assessment(
+        get_assessment_engine().respond,
+        session_id,
+        request.question_id,
+        request.user_answer,
+        request.time_taken_seconds
+    )
+
+@router.post("/{session_id}/complete")
+async def complete_assessment(session_id: str):
+    return run_assessment(get_assessment_engine().complete, session_id)
@@ -0,0 +1,92 @@
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from typing import Optional, List
+
+from src.lib.data_paths import CEFR_LEVELS
+from src.services.bible_verses import get_bible_verse_store, parse_reference
+from src.services.term_search import get_term_search_index
+from src.services.verse_index import LEMMA, LESSON, TOPIC, get_verse_grammar_index
+
+router = APIRouter(prefix="/api/bible", tags=["bible"])
+
+MAX_REFERENCES = 500
+MAX_EXAMPLES = 100
+
+# Request/Response 모델들
+class ReferenceResolveRequest(BaseModel):
+    references: List[str] = []
+    text: Optional[str] = None  # 설교 원고 등 - 본문 속 참조를 모두 찾아 해석
+    term_id: Optional[str] = None  # 신학 용어의 biblical_references 해석
+
+# 구절 조회
+@router.get("/verses")
+async def get_verses(reference: str):
+    """참조 하나("요 3:16", "Mt 5:1-12", "시 23")에 해당하는 구절"""
+    parsed = parse_reference(reference)
+    if parsed is None:
+        raise HTTPException(status_code=400, detail=f"Unrecognized Bible reference: {reference}")
+    return {
+        "success": True,
+        "data": {
+            **parsed.to_dict(),
+            "verses": get_bible_verse_store().lookup(parsed)
+        }
+    }
+
+# 참조 일괄 해석
+@router.post("/references/resolve")
+async def resolve_references(request: ReferenceResolveRequest):
+    """참조 목록 + 본문 속 참조 + 용어의 참조를 한 번에 해석 (해석 실패는 parsed=false)"""
+    store = get_bible_verse_store()
+    references = list(request.references)
+    if request.term_id:
+        term = get_term_search_index().get(request.term_id)
+        if term is None:
+            raise HTTPException(status_code=404, detail="Term not found")
+        references.extend(term["biblical_references"])
+    if len(references) > MAX_REFERENCES:
+        raise HTTPException(status_code=413, detail=f"Too many references (max {MAX_REFERENCES})")
+
+    resolved = store.resolve(references)
+    if request.text:
+        resolved.extend(store.resolve_text(request.text))
+    return {
+        "success": True,
+        "data": {
+            "references": resolved,
+            "unresolved_count": sum(1 for item in resolved if not item["parsed"])
+        }
+    }
+
+# 문법 예문 구절 검색
+@router.get("/examples")
+async def get_grammar_examples(
+    topic: List[str] = Query([]),
+    lesson: List[str] = Query([]),
+    lemma: List[str] = Query([]),
+    max_level: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=MAX_EXAMPLES)
+):
+    """문법 주제/강의(id 또는 제목)/기본형 조건을 모두 만족하는 구절 (예: topic=과거시제&topic=장소격&max_level=B1)"""
+    if max_level and max_level.upper() not in CEFR_LEVELS:
+        raise HTTPException(status_code=400, detail="유효하지 않은 레벨입니다.")
+    return {
+        "success": True,
+        "data": get_verse_grammar_index().examples(
+            limit, topics=topic, lessons=lesson, lemmas=lemma, max_level=max_level
+        )
+    }
+
+# 예문 검색 키 목록
+@router.get("/examples/facets")
+async def get_grammar_example_facets():
+    """문법 주제/강의/기본형별 구절 수"""
+    index = get_verse_grammar_index()
+    return {
+        "success": True,
+        "data": {
+            "topics": index.facets(TOPIC),
+            "lessons": index.facets(LESSON),
+            "lemmas": index.facets(LEMMA)
+        }
+    }
@@ -1,12 +1,25 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import time
 
+import numpy as np
+
+from src.lib.auth import get_user_id
+from src.services.level_curve import resolve_level, compute_level_profiles
+from src.services.challenge_scheduler import challenge_scheduler, format_timestamp
+from src.lib.response_cache import VersionedResponseCache, StaticJSONResponse
+
 router = APIRouter(prefix="/api/gamification", tags=["gamification"])
 security = HTTPBearer()
 
+# 조회 응답 캐시 - 사용자별 버전은 게임화 상태가 바뀌는 쓰기 요청에서 증가
+response_cache = VersionedResponseCache()
+LEADERBOARD_SCOPE = "__leaderboard__"
+# 진행도 업데이트 한 번에 올릴 수 있는 최대 값
+MAX_PROGRESS_INCREMENT = 1000
+
 # Request/Response 모델들
 class PointsAwardRequest(BaseModel):
     source: str
@@ -16,6 +29,9 @@ class PointsAwardRequest(BaseModel):
 class ChallengeJoinRequest(BaseModel):
     challenge_id: str
 
+class CompetitionJoinRequest(BaseModel):
+    competition_id: str = "weekly_competition"
+
 class GameProfile(BaseModel):
     user_id: str
     total_points: int
@@ -28,19 +44,30 @@ class GameProfile(BaseModel):
 # 게임화 프로필 조회
 @router.get("/profile")
 async def get_gamification_profile(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """사용자의 게임화 프로필 조회"""
-    # TODO: 실제 사용자 인증 및 데이터베이스 조회 구현
+    user_id = get_user_id(credentials)
+    return response_cache.respond(
+        request, ("profile", user_id), response_cache.version(user_id),
+        lambda: build_gamification_profile(user_id)
+    )
+
+def build_gamification_profile(user_id: str) -> Dict[str, Any]:
+    """게임화 프로필 payload 생성"""
+    # TODO: 데이터베이스 조회 구현 (사용자 식별자는 검증된 토큰에서)
+    total_points = 2850
+    level_info = resolve_level(total_points)
     mock_profile = {
         "success": True,
         "data": {
             "user_profile": {
-                "user_id": "user123",
-                "total_points": 2850,
-                "current_level": 6,
-                "points_to_next_level": 650,
-                "level_title": "헝가리어 애호가",
+                "user_id": user_id,
+                "total_points": total_points,
+                "current_level": level_info["current_level"],
+                "points_to_next_level": level_info["points_to_next_level"],
+                "level_title": level_info["level_title"],
                 "badges_earned": [
                     {
                         "badge_id": "streak_7_days",
@@ -99,6 +126,8 @@ async def award_points(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """사용자에게 포인트 지급 및 게임화 이벤트 처리"""
+    response_cache.bump(get_user_id(credentials))
+    response_cache.bump(LEADERBOARD_SCOPE)
     # TODO: GameificationEngine을 사용한 실제 포인트 지급 로직 구현
     mock_response = {
         "success": True,
@@ -128,10 +157,51 @@ async def award_points(
 # 리더보드 조회
 @router.get("/leaderboard")
 async def get_leaderboard(
+    request: Request,
     type: str = "global",
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """리더보드 조회"""
+    return response_cache.respond(
+        request, ("leaderboard", type), response_cache.version(LEADERBOARD_SCOPE),
+        lambda: build_leaderboard(type)
+    )
+
+def build_leaderboard(type: str) -> Dict[str, Any]:
+    """리더보드 payload 생성"""
+    entries = [
+        {
+            "user_id": "user001",
+            "username": "헝가리마스터",
+            "rank": 1,
+            "score": 12500,
+            "badges_count": 24,
+            "country": "KR",
+            "rank_change": 2,
+            "score_change": 850,
+            "streak_days": 45,
+            "achievements": 89
+        },
+        {
+            "user_id": "user002",
+            "username": "설교준비생",
+            "rank": 2,
+            "score": 11800,
+            "badges_count": 21,
+            "country": "KR",
+            "rank_change": -1,
+            "score_change": 650,
+            "streak_days": 28,
+            "achievements": 76
+        }
+    ]
+
+    # 전체 엔트리의 레벨을 한 번에 계산
+    level_profiles = compute_level_profiles(np.array([e["score"] for e in entries]))
+    for entry, level, title in zip(entries, level_profiles["current_level"], level_profiles["level_title"]):
+        entry["level"] = int(level)
+        entry["level_title"] = title
+
     mock_leaderboard = {
         "success": True,
         "data": {
@@ -141,34 +211,7 @@ async def get_leaderboard(
                 "last_updated": "2024-11-26T12:00:00Z",
                 "user_rank": 8,
                 "total_participants": 1247,
-                "entries": [
-                    {
-                        "user_id": "user001",
-                        "username": "헝가리마스터",
-                        "rank": 1,
-                        "score": 12500,
-                        "level": 12,
-                        "badges_count": 24,
-                        "country": "KR",
-                        "rank_change": 2,
-                        "score_change": 850,
-                        "streak_days": 45,
-                        "achievements": 89
-                    },
-                    {
-                        "user_id": "user002",
-                        "username": "설교준비생",
-                        "rank": 2,
-                        "score": 11800,
-                        "level": 11,
-                        "badges_count": 21,
-                        "country": "KR",
-                        "rank_change": -1,
-                        "score_change": 650,
-                        "streak_days": 28,
-                        "achievements": 76
-                    }
-                ]
+                "entries": entries
             }
         }
     }
@@ -177,76 +220,22 @@ async def get_leaderboard(
 # 활성 도전과제 조회
 @router.get("/challenges")
 async def get_active_challenges(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """활성 도전과제 목록 조회"""
-    mock_challenges = {
-        "success": True,
-        "data": {
-            "active_challenges": [
-                {
-                    "id": "daily_vocabulary_challenge",
-                    "title": "오늘의 어휘 마스터",
-                    "description": "하루에 10개의 새로운 단어를 학습하세요",
-                    "type": "daily",
-                    "difficulty": "easy",
-                    "time_remaining_hours": 18,
-                    "objectives": [
-                        {
-                            "id": "learn_words",
-                            "description": "새 단어 10개 학습",
-                            "current_progress": 7,
-                            "target_value": 10,
-                            "is_completed": False
-                        }
-                    ],
-                    "rewards": {
-                        "points": 100,
-                        "badges": ["daily_achiever"]
-                    },
-                    "progress_percentage": 70,
-                    "is_participating": True,
-                    "category": "vocabulary",
-                    "icon": "📚",
-                    "color": "#3b82f6"
-                },
-                {
-                    "id": "weekly_theological",
-                    "title": "신학 어휘 집중 주간",
-                    "description": "일주일 동안 신학 관련 콘텐츠에 집중하세요",
-                    "type": "weekly",
-                    "difficulty": "medium",
-                    "time_remaining_hours": 96,
-                    "objectives": [
-                        {
-                            "id": "theological_lessons",
-                            "description": "신학 레슨 5개 완료",
-                            "current_progress": 2,
-                            "target_value": 5,
-                            "is_completed": False
-                        },
-                        {
-                            "id": "theological_vocabulary",
-                            "description": "신학 어휘 30개 학습",
-                            "current_progress": 18,
-                            "target_value": 30,
-                            "is_completed": False
-                        }
-                    ],
-                    "rewards": {
-                        "points": 500,
-                        "badges": ["theological_focus_master"]
-                    },
-                    "progress_percentage": 45,
-                    "is_participating": True,
-                    "category": "theology",
-                    "icon": "⛪",
-                    "color": "#8b5cf6"
-                }
-            ]
+    user_id = get_user_id(credentials)
+    # 남은 시간은 시간 단위로 표시되므로 현재 시각(시 단위)도 버전에 포함
+    version = (response_cache.version(user_id), challenge_scheduler.version, int(time.time() // 3600))
+    return response_cache.respond(
+        request, ("challenges", user_id), version,
+        lambda: {
+            "success": True,
+            "data": {
+                "active_challenges": challenge_scheduler.active_challenges(user_id)
+            }
         }
-    }
-    return mock_challenges
+    )
 
 # 도전과제 참여
 @router.post("/join-challenge")
@@ -255,41 +244,62 @@ async def join_challenge(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """도전과제 참여"""
-    # TODO: 실제 도전과제 참여 로직 구현
-    mock_response = {
+    if not challenge_scheduler.has_challenge(request.challenge_id):
+        raise HTTPException(status_code=404, detail="Challenge not found")
+
+    user_id = get_user_id(credentials)
+    window = challenge_scheduler.join(request.challenge_id, user_id)
+    response_cache.bump(user_id)
+    return {
         "success": True,
         "data": {
             "challenge_joined": True,
             "challenge_id": request.challenge_id,
             "message": "도전과제에 성공적으로 참여했습니다!",
-            "start_time": "2024-11-26T12:00:00Z"
+            "start_time": format_timestamp(window.opens_at),
+            "participants_count": len(window.participants)
         }
     }
-    return mock_response
 
 # 경쟁 이벤트 참여
 @router.post("/join-competition")
 async def join_competition(
+    request: Optional[CompetitionJoinRequest] = None,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """경쟁 이벤트 참여"""
-    # TODO: 실제 경쟁 이벤트 참여 로직 구현
-    mock_response = {
+    competition_id = request.competition_id if request else CompetitionJoinRequest().competition_id
+    if not challenge_scheduler.has_competition(competition_id):
+        raise HTTPException(status_code=404, detail="Competition not found")
+
+    user_id = get_user_id(credentials)
+    window = challenge_scheduler.join(competition_id, user_id)
+    response_cache.bump(user_id)
+    return {
         "success": True,
         "data": {
             "competition_joined": True,
+            "competition_id": competition_id,
             "message": "경쟁 이벤트에 성공적으로 참여했습니다!",
-            "participants_count": 235
+            "participants_count": len(window.participants)
         }
     }
-    return mock_response
 
 # 배지 목록 조회
 @router.get("/badges")
 async def get_user_badges(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """사용자 배지 목록 조회"""
+    user_id = get_user_id(credentials)
+    return response_cache.respond(
+        request, ("badges", user_id), response_cache.version(user_id),
+        lambda: build_user_badges(user_id)
+    )
+
+def build_user_badges(user_id: str) -> Dict[str, Any]:
+    """사용자 배지 목록 payload 생성"""
     mock_badges = {
         "success": True,
         "data": {
@@ -360,6 +370,124 @@ async def get_user_badges(
     }
     return mock_badges
 
+# 배지 카탈로그 (불변 데이터 - 시작 시 한 번만 직렬화)
+BADGE_CATALOG = {
+    "success": True,
+    "data": {
+        "badge_categories": [
+            {
+                "category": "연속 학습",
+                "badges": [
+                    {
+                        "id": "streak_3_days",
+                        "name": "꾸준한 시작",
+                        "description": "3일 연속으로 학습하였습니다",
+                        "icon": "🔥",
+                        "rarity": "common",
+                        "points_reward": 50,
+                        "is_earned": True,
+                        "earned_at": "2024-11-20T10:00:00Z"
+                    },
+                    {
+                        "id": "streak_7_days",
+                        "name": "한 주의 달인",
+                        "description": "일주일 연속 학습을 완주했습니다",
+                        "icon": "⭐",
+                        "rarity": "uncommon",
+                        "points_reward": 100,
+                        "is_earned": True,
+                        "earned_at": "2024-11-22T10:00:00Z"
+                    },
+                    {
+                        "id": "streak_30_days",
+                        "name": "철의 의지",
+                        "description": "30일 연속 학습의 위업을 달성했습니다",
+                        "icon": "💪",
+                        "rarity": "rare",
+                        "points_reward": 300,
+                        "is_earned": False,
+                        "progress_percentage": 40
+                    }
+                ]
+            },
+            {
+                "category": "어휘 학습",
+                "badges": [
+                    {
+                        "id": "vocab_master_100",
+                        "name": "어휘 수집가",
+                        "description": "100개의 헝가리어 단어를 학습했습니다",
+                        "icon": "📚",
+                        "rarity": "common",
+                        "points_reward": 100,
+                        "is_earned": True,
+                        "earned_at": "2024-11-25T15:30:00Z"
+                    },
+                    {
+                        "id": "vocab_master_500",
+                        "name": "어휘의 제왕",
+                        "description": "500개의 헝가리어 단어를 마스터했습니다",
+                        "icon": "👑",
+                        "rarity": "rare",
+                        "points_reward": 500,
+                        "is_earned": False,
+                        "progress_percentage": 76
+                    }
+                ]
+            },
+            {
+                "category": "신학",
+                "badges": [
+                    {
+                        "id": "theological_scholar",
+                        "name": "신학도",
+                        "description": "50개의 신학 용어를 학습했습니다",
+                        "icon": "⛪",
+                        "rarity": "uncommon",
+                        "points_reward": 200,
+                        "is_earned": True,
+                        "earned_at": "2024-11-26T09:15:00Z"
+                    },
+                    {
+                        "id": "sermon_master",
+                        "name": "설교자의 길",
+                        "description": "설교문 작성에 필요한 모든 기초를 익혔습니다",
+                        "icon": "🙏",
+                        "rarity": "epic",
+                        "points_reward": 1000,
+                        "is_earned": False,
+                        "progress_percentage": 25
+                    }
+                ]
+            },
+            {
+                "category": "특별",
+                "badges": [
+                    {
+                        "id": "night_owl",
+                        "name": "???",
+                        "description": "???",
+                        "icon": "❓",
+                        "rarity": "rare",
+                        "points_reward": 150,
+                        "is_earned": False,
+                        "is_hidden": True,
+                        "unlock_hint": "늦은 밤에도 학습을 게을리하지 않는다면..."
+                    }
+                ]
+            }
+        ]
+    }
+}
+
+_badge_catalog_response = StaticJSONResponse(BADGE_CATALOG)
+
+# 배지 카탈로그 조회
+@router.get("/badge-catalog")
+async def get_badge_catalog(request: Request):
+    """전체 배지 카탈로그 조회"""
+    return _badge_catalog_response.respond(request)
+
 # 성취 피드 조회
 @router.get("/achievements-feed")
 async def get_achievements_feed(
@@ -425,25 +553,28 @@ async def update_learning_progress(
     score: int,
     accuracy: float,
     study_time_minutes: int,
+    objective_id: Optional[str] = None,
+    progress_increment: int = Query(1, ge=1, le=MAX_PROGRESS_INCREMENT),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """학습 진행률 업데이트 및 게임화 이벤트 처리"""
     # TODO: 실제 학습 진행률 업데이트 및 GameificationEngine 연동
+    user_id = get_user_id(credentials)
+    challenge_progress = []
+    if objective_id:
+        challenge_progress = challenge_scheduler.record_progress(
+            user_id, objective_id, progress_increment
+        )
+    response_cache.bump(user_id)
+    response_cache.bump(LEADERBOARD_SCOPE)
+
     mock_response = {
         "success": True,
         "data": {
             "progress_updated": True,
             "points_awarded": 85,
             "new_achievements": [],
-            "challenge_progress": [
-                {
-                    "challenge_id": "daily_vocabulary_challenge",
-                    "objective_id": "learn_words",
-                    "progress_increment": 1,
-                    "new_progress": 8,
-                    "target": 10
-                }
-            ],
+            "challenge_progress": challenge_progress,
             "streak_updated": {
                 "current_streak": 13,
                 "longest_streak": 15,
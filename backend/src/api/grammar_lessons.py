@@ -0,0 +1,128 @@
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
+
+from src.lib.auth import get_user_id
+from src.lib.data_paths import CEFR_LEVELS
+from src.services.corpus_snapshot import LESSON_KEY, TOC_KEY, get_corpus_snapshot
+from src.services.lesson_catalog import get_lesson_catalog
+from src.services.curriculum_graph import get_curriculum_graph, get_lesson_progress_store
+from src.services.verse_index import get_verse_grammar_index
+
+router = APIRouter(prefix="/api/grammar-lessons", tags=["grammar-lessons"])
+security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+def completed_lessons(credentials: Optional[HTTPAuthorizationCredentials], level: Optional[str]) -> int:
+    """완료 강의 비트셋 - 기록 + 현재 레벨 이전 레벨 강의"""
+    graph = get_curriculum_graph()
+    completed = get_lesson_progress_store().completed(get_user_id(credentials) if credentials else None)
+    return completed | (graph.levels_below(level.upper()) if level else 0)
+
+# 문법 강의 목차 조회
+@router.get("")
+async def list_grammar_lessons(request: Request, level: Optional[str] = None):
+    """레벨별 문법 강의 목차 (본문 제외) - 공유 스냅샷 우선"""
+    key = level.upper() if level and level.upper() in CEFR_LEVELS else ""
+    response = get_corpus_snapshot().response(TOC_KEY + key) or get_lesson_catalog().toc(level)
+    return response.respond(request)
+
+# 캐시 상태 조회
+@router.get("/cache-stats")
+async def get_lesson_cache_stats():
+    """강의 본문 LRU 캐시 및 공유 스냅샷 상태"""
+    return {
+        "success": True,
+        "data": {**get_lesson_catalog().stats(), "snapshot": get_corpus_snapshot().stats()}
+    }
+
+# 다음에 학습할 수 있는 강의
+@router.get("/path/next")
+async def get_next_lessons(
+    level: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    """선수 강의를 모두 마친 미완료 강의 (커리큘럼 순서)"""
+    graph = get_curriculum_graph()
+    completed = completed_lessons(credentials, level)
+    return {
+        "success": True,
+        "data": {
+            "lessons": graph.describe(graph.unlocked(completed)),
+            "completed_count": completed.bit_count(),
+            "total_count": len(graph)
+        }
+    }
+
+# 마일스톤까지 남은 강의
+@router.get("/path/gaps")
+async def get_milestone_gaps(
+    milestone: Optional[str] = None,
+    level: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    """마일스톤(레벨명 또는 강의 id, 기본값은 다음 레벨 복습 강의)까지 남은 강의"""
+    graph = get_curriculum_graph()
+    completed = completed_lessons(credentials, level)
+    target = graph.resolve_milestone(milestone) if milestone else graph.next_milestone(completed, (level or "A1").upper())
+    if target is None:
+        if milestone:
+            raise HTTPException(status_code=404, detail="Milestone not found")
+        return {"success": True, "data": {"milestone": None, "ready": [], "blocked": [], "remaining_count": 0}}
+    gaps = graph.gaps(completed, target)
+    ready = gaps & graph.unlocked(completed)
+    return {
+        "success": True,
+        "data": {
+            "milestone": target,
+            "ready": graph.describe(ready),
+            "blocked": graph.describe(gaps & ~ready),
+            "remaining_count": gaps.bit_count()
+        }
+    }
+
+# 문법 강의 상세 조회
+@router.get("/{lesson_id}")
+async def get_grammar_lesson(lesson_id: str, request: Request):
+    """문법 강의 전체 내용 조회 - 공유 스냅샷에 없으면 파싱 후 워커별 LRU"""
+    response = get_corpus_snapshot().response(LESSON_KEY + lesson_id) or get_lesson_catalog().lesson(lesson_id)
+    if response is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    return response.respond(request)
+
+# 강의 문법이 쓰인 성경 구절
+@router.get("/{lesson_id}/verses")
+async def get_lesson_verses(lesson_id: str, max_level: Optional[str] = None, limit: int = Query(20, ge=1, le=100)):
+    """강의와 연결된 단어 분석이 있는 예문 구절 (max_level 이하)"""
+    if max_level and max_level.upper() not in CEFR_LEVELS:
+        raise HTTPException(status_code=400, detail="유효하지 않은 레벨입니다.")
+    if get_lesson_catalog().get_entry(lesson_id) is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    return {
+        "success": True,
+        "data": get_verse_grammar_index().examples(limit, lessons=[lesson_id], max_level=max_level)
+    }
+
+# 문법 강의 완료 기록
+@router.post("/{lesson_id}/complete")
+async def complete_grammar_lesson(
+    lesson_id: str,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """강의 완료 기록 후 새로 열린 강의 반환"""
+    graph = get_curriculum_graph()
+    if lesson_id not in graph:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    store = get_lesson_progress_store()
+    user_id = get_user_id(credentials)
+    before = graph.unlocked(store.completed(user_id))
+    completed = store.complete(user_id, lesson_id)
+    await store.persist()
+    return {
+        "success": True,
+        "data": {
+            "lesson_id": lesson_id,
+            "newly_unlocked": graph.describe(graph.unlocked(completed) & ~before),
+            "completed_count": completed.bit_count()
+        }
+    }
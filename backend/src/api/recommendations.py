@@ -0,0 +1,156 @@
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal
+
+from src.lib.auth import optional_user_id
+from src.lib.response_cache import StaticJSONResponse
+from src.services.curriculum_graph import get_lesson_progress_store
+from src.services.recommendation_engine import get_recommendation_engine, learner_weights
+from src.services.learner_weights import feedback_reward, get_learner_weight_store
+
+router = APIRouter(prefix="/api/recommendations", tags=["recommendations"])
+optional_security = HTTPBearer(auto_error=False)
+
+# Request/Response 모델들
+class LearningStyleWeights(BaseModel):
+    visual: float = Field(25, ge=0, le=100)
+    auditory: float = Field(25, ge=0, le=100)
+    kinesthetic: float = Field(25, ge=0, le=100)
+    reading_writing: float = Field(25, ge=0, le=100)
+
+class RecommendationPreferences(BaseModel):
+    """학습자 추천 설정 (프론트엔드 RecommendationSettings와 동일한 필드)"""
+    preferred_content_types: List[str] = Field(["theological_terms", "grammar"], max_length=20)
+    difficulty_preference: Literal["easy", "appropriate", "challenging"] = "appropriate"
+    theological_focus_level: int = Field(80, ge=0, le=100)
+    learning_style_weights: LearningStyleWeights = LearningStyleWeights()
+    korean_specific_challenges: bool = True
+
+def preference_dict(preferences: Optional[RecommendationPreferences]) -> Optional[Dict[str, Any]]:
+    return preferences.model_dump() if preferences is not None else None
+
+class RecommendationRequest(BaseModel):
+    session_type: str = "intensive_study"
+    time_available_minutes: Optional[int] = None
+    current_level: str = "A2"
+    level_progress: int = 0
+    weak_skills: List[str] = ["grammar", "writing"]
+    preferences: Optional[RecommendationPreferences] = None
+
+class RecommendationFeedbackRequest(BaseModel):
+    feedback_type: str = "content_rating"
+    content_id: Optional[str] = None
+    rating: Optional[float] = None
+    completed: Optional[bool] = None
+    current_level: str = "A2"
+    weak_skills: List[str] = ["grammar", "writing"]
+    preferences: Optional[RecommendationPreferences] = None
+
+@router.post("/personalized")
+async def get_personalized_recommendations(
+    request: Optional[RecommendationRequest] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    request = request or RecommendationRequest()
+    engine = get_recommendation_engine()
+    current_level = request.current_level.upper()
+    user_id = optional_user_id(credentials)
+    # 피드백으로 학습된 가중치가 있으면 요청의 설정/레벨/약점 영역과 혼합
+    weights = get_learner_weight_store().personalized(
+        user_id, learner_weights(current_level, preference_dict(request.preferences), request.weak_skills)
+    )
+    recommendations = engine.recommend(
+        weights,
+        current_level=current_level,
+        weak_skills=request.weak_skills,
+        time_available_minutes=request.time_available_minutes,
+        session_type=request.session_type,
+        completed_lessons=get_lesson_progress_store().completed(user_id)
+    )
+    recommendations["learning_path_integration"]["progress_towards_goal"] = request.level_progress
+    return {
+        "success": True,
+        "data": recommendations
+    }
+
+# 콘텐츠 유형/난이도/세션 유형 카탈로그 (불변 데이터 - 라우터를 처음 불러올 때 한 번만 직렬화)
+CONTENT_TYPES_CATALOG = {
+    "success": True,
+    "data": {
+        "content_types": [
+            {"id": "grammar", "name": "문법", "description": "헝가리어 문법 규칙과 패턴"},
+            {"id": "vocabulary", "name": "어휘", "description": "헝가리어 단어와 표현 학습"},
+            {"id": "writing", "name": "작문", "description": "헝가리어 문장 작성과 표현"},
+            {"id": "reading", "name": "읽기", "description": "헝가리어 텍스트 읽기와 이해"},
+            {"id": "theological_terms", "name": "신학 용어", "description": "설교와 신학 관련 전문 어휘"},
+            {"id": "sermon_writing", "name": "설교문 작성", "description": "헝가리어 설교문 작성 연습"},
+            {"id": "translation", "name": "번역", "description": "한국어-헝가리어 번역 연습"},
+            {"id": "cultural_context", "name": "문화", "description": "헝가리 문화와 맥락 이해"}
+        ],
+        "difficulty_levels": [
+            {"id": "A1", "name": "기초", "description": "헝가리어 입문 수준"},
+            {"id": "A2", "name": "초급", "description": "기본적인 의사소통 가능"},
+            {"id": "B1", "name": "중급", "description": "일상 상황에서 자유로운 소통"},
+            {"id": "B2", "name": "중상급", "description": "복잡한 주제도 이해하고 표현"}
+        ],
+        "session_types": [
+            {"id": "quick_review", "name": "빠른 복습", "duration": "5-15분"},
+            {"id": "intensive_study", "name": "집중 학습", "duration": "30-60분"},
+            {"id": "assessment_prep", "name": "평가 준비", "duration": "20-40분"},
+            {"id": "free_study", "name": "자유 학습", "duration": "사용자 정의"}
+        ]
+    }
+}
+
+_content_types_response = StaticJSONResponse(CONTENT_TYPES_CATALOG)
+
+@router.get("/content-types")
+async def get_content_types(request: Request):
+    return _content_types_response.respond(request)
+
+@router.post("/feedback")
+async def submit_recommendation_feedback(
+    request: RecommendationFeedbackRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    user_id = optional_user_id(credentials)
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Authentication required for feedback")
+
+    store = get_learner_weight_store()
+    current_level = request.current_level.upper()
+    initial = learner_weights(current_level, preference_dict(request.preferences), request.weak_skills)
+    predicted_score = None
+
+    if request.feedback_type == "preferences_update":
+        store.blend(user_id, initial)
+    else:
+        engine = get_recommendation_engine()
+        index = engine.index_of(request.content_id) if request.content_id else None
+        if index is None:
+            raise HTTPException(status_code=404, detail="Content not found")
+        reward = feedback_reward(request.feedback_type, request.rating, request.completed)
+        if reward is None:
+            raise HTTPException(status_code=400, detail=f"Unknown feedback type: {request.feedback_type}")
+        predicted_score = store.update(user_id, engine.features[index], reward, initial)
+
+    await store.persist()
+    adjustment = store.describe(user_id)
+    return {
+        "success": True,
+        "data": {
+            "feedback_recorded": True,
+            "updated_preferences": {
+                "preferred_content_types": adjustment["preferred_content_types"],
+                "theological_focus_level": adjustment["theological_focus_level"]
+            },
+            "algorithm_adjustment": {
+                "learning_style_weights": adjustment["learning_style_weights"],
+                "content_type_preferences": adjustment["content_type_preferences"],
+                "predicted_score": None if predicted_score is None else round(predicted_score * 100),
+                "feedback_count": adjustment["feedback_count"]
+            },
+            "next_recommendation_improvement": "피드백을 반영하여 다음 추천의 정확도가 향상됩니다"
+        }
+    }
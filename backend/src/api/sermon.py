@@ -0,0 +1,204 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
+from typing import Optional
+
+from src.lib.auth import get_user_id
+from src.services.sermon_drafts import META_FIELDS, DraftError, SermonDraft, get_sermon_draft_store
+from src.services.sermon_outline import get_sermon_outliner
+
+router = APIRouter(prefix="/api/sermon", tags=["sermon"])
+security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+MAX_PAGE_SIZE = 100
+
+# Request/Response 모델들
+class DraftCreateRequest(BaseModel):
+    title: str
+    content: str = ""
+    scripture_reference: Optional[str] = None
+
+class DraftDelta(BaseModel):
+    start: int
+    end: int
+    text: str = ""
+
+class DraftSaveRequest(BaseModel):
+    content: Optional[str] = None  # 전체 본문 또는
+    delta: Optional[DraftDelta] = None  # base_revision 기준 한 구간 치환
+    base_revision: Optional[int] = None  # 다른 곳에서 먼저 저장되었으면 409
+    title: Optional[str] = None
+    scripture_reference: Optional[str] = None
+
+class OutlineRequest(BaseModel):
+    content: Optional[str] = None  # 원고 본문 또는
+    draft_id: Optional[str] = None  # 저장된 초안 (인증 필요)
+    revision: Optional[int] = None
+
+def draft_detail(draft: SermonDraft, revision: Optional[int] = None) -> dict:
+    content, meta = draft.at(revision or draft.revision)
+    return {
+        **draft.summary(),
+        **meta,
+        "revision": revision or draft.revision,
+        "latest_revision": draft.revision,
+        "length": len(content),
+        "content": content,
+    }
+
+# 설교 초안 목록
+@router.get("/drafts")
+async def get_sermon_drafts(
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """최근 수정순 초안 목록 (다음 페이지는 next_cursor로 조회)"""
+    user = get_sermon_draft_store().user(get_user_id(credentials))
+    try:
+        drafts, next_cursor = user.page(cursor, limit)
+    except DraftError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    return {
+        "success": True,
+        "data": {
+            "sermons": [draft.summary() for draft in drafts],
+            "total_count": len(user.drafts),
+            "pagination": {
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
+            }
+        }
+    }
+
+# 설교 초안 생성
+@router.post("/drafts")
+async def create_sermon_draft(
+    request: DraftCreateRequest,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """새 초안 (첫 리비전은 전체 스냅샷)"""
+    draft = get_sermon_draft_store().create(
+        get_user_id(credentials),
+        request.content,
+        {field: getattr(request, field) for field in META_FIELDS},
+    )
+    return {
+        "success": True,
+        "data": draft.summary()
+    }
+
+# 설교 초안 조회
+@router.get("/drafts/{draft_id}")
+async def get_sermon_draft(
+    draft_id: str,
+    revision: Optional[int] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """초안 본문 (revision을 주면 해당 리비전 복원)"""
+    try:
+        draft = get_sermon_draft_store().get(get_user_id(credentials), draft_id)
+        return {
+            "success": True,
+            "data": draft_detail(draft, revision)
+        }
+    except DraftError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+# 설교 초안 저장 (자동 저장)
+@router.put("/drafts/{draft_id}")
+async def save_sermon_draft(
+    draft_id: str,
+    request: DraftSaveRequest,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """새 리비전 기록 - 디스크에는 직전 리비전과의 차이만 추가"""
+    delta = (request.delta.start, request.delta.end, request.delta.text) if request.delta else None
+    try:
+        result = get_sermon_draft_store().save(
+            get_user_id(credentials),
+            draft_id,
+            {field: getattr(request, field) for field in META_FIELDS},
+            content=request.content,
+            delta=delta,
+            base_revision=request.base_revision,
+        )
+    except DraftError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    return {
+        "success": True,
+        "data": result
+    }
+
+# 설교 초안 리비전 이력
+@router.get("/drafts/{draft_id}/revisions")
+async def get_sermon_draft_revisions(
+    draft_id: str,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    before: Optional[int] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """리비전 목록 최신순 (다음 페이지는 before=마지막 리비전 번호)"""
+    try:
+        draft = get_sermon_draft_store().get(get_user_id(credentials), draft_id)
+    except DraftError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    revisions = draft.revisions(before, limit)
+    return {
+        "success": True,
+        "data": {
+            "revisions": revisions,
+            "next_before": revisions[-1]["revision"] if revisions and revisions[-1]["revision"] > 1 else None
+        }
+    }
+
+# 설교 초안 삭제
+@router.delete("/drafts/{draft_id}")
+async def delete_sermon_draft(
+    draft_id: str,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """초안과 리비전 이력 삭제"""
+    try:
+        get_sermon_draft_store().delete(get_user_id(credentials), draft_id)
+    except DraftError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    return {"success": True}
+
+# 설교 개요 생성
+@router.post("/generate-outline")
+async def generate_outline(
+    request: Optional[OutlineRequest] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    """문단 분석(캐시) → 어휘 겹침으로 구간 나누기 → 구간별 개요 (바뀐 문단만 다시 분석)"""
+    request = request or OutlineRequest()
+    content = request.content
+    if request.draft_id:
+        if credentials is None:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        try:
+            draft = get_sermon_draft_store().get(get_user_id(credentials), request.draft_id)
+            content, _ = draft.at(request.revision or draft.revision)
+        except DraftError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+    if not content or not content.strip():
+        raise HTTPException(status_code=400, detail="content or draft_id is required")
+    return {
+        "success": True,
+        "data": await get_sermon_outliner().outline(content)
+    }
+
+# 설교 문법 검사
+@router.post("/check-grammar")
+async def check_grammar():
+    return {
+        "success": True,
+        "data": {
+            "suggestions": [],
+            "corrected_text": "문법 검사가 완료되었습니다.",
+            "confidence_score": 0.95
+        }
+    }
@@ -0,0 +1,150 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
+from typing import Optional, List, Dict, Any
+import time
+
+import numpy as np
+
+from src.lib.auth import get_user_id
+from src.services.fsrs_scheduler import ReviewDeck, Rating, get_review_deck_store
+from src.services.vocabulary_store import get_vocabulary_store
+
+router = APIRouter(prefix="/api/srs", tags=["srs"])
+security = HTTPBearer()
+
+MAX_BATCH_REVIEWS = 1000
+MAX_DUE_LIMIT = 500
+MAX_TARGET_MINUTES = 24 * 60
+
+# Request/Response 모델들
+class CardAddRequest(BaseModel):
+    card_ids: List[str]
+
+class CardReview(BaseModel):
+    card_id: str
+    rating: int
+    reviewed_at: Optional[float] = None  # epoch 초, 기본값은 요청 시각 (요청 시각보다 늦으면 요청 시각으로)
+
+class ReviewBatchRequest(BaseModel):
+    reviews: List[CardReview]
+
+def describe_card(deck: ReviewDeck, row: int) -> Dict[str, Any]:
+    """카드 상태 + 어휘 카드면 단어 내용"""
+    card = deck.card(row)
+    word = get_vocabulary_store().get(card["card_id"])
+    card["word"] = word.to_dict() if word else None
+    return card
+
+# 카드 등록
+@router.post("/cards")
+async def add_cards(
+    request: CardAddRequest,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """새 카드 등록 (이미 등록된 카드는 그대로 유지, 어휘 id는 대표 id로 통일)"""
+    store = get_review_deck_store()
+    user_id = get_user_id(credentials)
+    vocabulary = get_vocabulary_store()
+    async with store.editing(user_id) as deck:
+        added = deck.add_cards([vocabulary.canonical_id(card_id) for card_id in request.card_ids])
+        if added:
+            await store.persist(user_id)
+        total_cards = len(deck)
+    return {
+        "success": True,
+        "data": {"added": added, "total_cards": total_cards}
+    }
+
+# 복습 대기열
+@router.get("/due")
+async def get_due_cards(
+    limit: int = 20,
+    target_minutes: Optional[float] = Query(None, gt=0, le=MAX_TARGET_MINUTES),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """기한이 된 카드를 우선순위 순으로 (target_minutes를 주면 학습 시간에 맞는 개수)"""
+    deck = get_review_deck_store().get(get_user_id(credentials))
+    now = time.time()
+    if target_minutes is not None:
+        limit = deck.optimal_batch_size(target_minutes, now)
+    rows, priority = deck.due_queue(now, min(max(limit, 0), MAX_DUE_LIMIT))
+    return {
+        "success": True,
+        "data": {
+            "cards": [
+                {**describe_card(deck, row), "priority": round(float(score), 2) if np.isfinite(score) else None}
+                for row, score in zip(rows.tolist(), priority.tolist())
+            ],
+            "due_count": int((deck.columns["due"] <= now).sum()),
+            "total_cards": len(deck)
+        }
+    }
+
+# 복습 결과 일괄 반영
+@router.post("/review")
+async def review_cards(
+    request: ReviewBatchRequest,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """복습 결과 묶음 반영 (등록되지 않은 카드는 새 카드로 등록 후 반영, 같은 카드는 입력 순서대로)"""
+    if not request.reviews:
+        raise HTTPException(status_code=400, detail="No reviews")
+    if len(request.reviews) > MAX_BATCH_REVIEWS:
+        raise HTTPException(status_code=413, detail=f"Too many reviews (max {MAX_BATCH_REVIEWS})")
+    for review in request.reviews:
+        if review.rating not in Rating._value2member_map_:
+            raise HTTPException(status_code=400, detail=f"Invalid rating: {review.rating}")
+
+    store = get_review_deck_store()
+    user_id = get_user_id(credentials)
+    vocabulary = get_vocabulary_store()
+    card_ids = [vocabulary.canonical_id(review.card_id) for review in request.reviews]
+    async with store.editing(user_id) as deck:
+        now = time.time()
+        deck.add_cards(card_ids, now)
+        rows = np.array([deck.index_of(card_id) for card_id in card_ids])
+        deck.review(
+            rows,
+            np.array([review.rating for review in request.reviews]),
+            np.array([min(review.reviewed_at, now) if review.reviewed_at is not None else now for review in request.reviews]),
+        )
+        await store.persist(user_id)
+        cards = [deck.card(row) for row in dict.fromkeys(rows.tolist())]
+    return {
+        "success": True,
+        "data": {
+            "cards": cards,
+            "reviewed_count": len(request.reviews)
+        }
+    }
+
+# 카드 통계
+@router.get("/stats")
+async def get_srs_stats(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """상태별 카드 수, 평균 안정성/난이도, 성숙 비율"""
+    deck = get_review_deck_store().get(get_user_id(credentials))
+    return {
+        "success": True,
+        "data": deck.stats()
+    }
+
+# 평가별 다음 일정 미리보기
+@router.get("/cards/{card_id}/schedule")
+async def get_card_schedule(
+    card_id: str,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """카드 현재 상태와 평가별 다음 복습 일정"""
+    deck = get_review_deck_store().get(get_user_id(credentials))
+    row = deck.index_of(get_vocabulary_store().canonical_id(card_id))
+    if row is None:
+        raise HTTPException(status_code=404, detail="Card not found")
+    now = time.time()
+    return {
+        "success": True,
+        "data": {
+            "card": describe_card(deck, row),
+            "schedule": deck.preview(row, now)
+        }
+    }
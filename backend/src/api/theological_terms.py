@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Query
+from typing import Optional, List
+
+from src.services.term_search import get_term_search_index
+from src.services.term_sampler import WEAKNESS_BOOST, get_term_sampler
+
+router = APIRouter(prefix="/api/theological-terms", tags=["theological-terms"])
+
+@router.get("/search")
+async def search_theological_terms(
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    difficulty_level: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    terms, total_count = get_term_search_index().search(
+        query=query or "",
+        category=category,
+        difficulty_level=difficulty_level,
+        limit=limit,
+        offset=offset
+    )
+    return {
+        "success": True,
+        "data": {
+            "terms": terms,
+            "total_count": total_count,
+            "pagination": {
+                "limit": limit,
+                "offset": offset,
+                "has_more": offset + len(terms) < total_count
+            }
+        }
+    }
+
+@router.get("/random")
+async def get_random_terms(
+    count: int = Query(1, ge=1, le=100),
+    difficulty: Optional[str] = None,
+    category: Optional[str] = None,
+    weak_categories: List[str] = Query([])
+):
+    terms = get_term_sampler().sample(
+        count,
+        category=category,
+        difficulty_level=difficulty,
+        weakness={weak: WEAKNESS_BOOST for weak in weak_categories}
+    )
+    return {
+        "success": True,
+        "data": {
+            "terms": terms
+        }
+    }
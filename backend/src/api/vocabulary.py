@@ -0,0 +1,66 @@
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Optional
+
+from src.lib.data_paths import CEFR_LEVELS
+from src.lib.response_cache import StaticJSONResponse
+from src.services.corpus_snapshot import VOCABULARY_KEY, get_corpus_snapshot
+from src.services.vocabulary_store import get_vocabulary_store
+
+router = APIRouter(prefix="/api/vocabulary", tags=["vocabulary"])
+
+# 표제어 조회
+@router.get("/lookup")
+async def lookup_word(hungarian: str):
+    """헝가리어 표제어로 단어 조회 (악센트·대소문자 무시)"""
+    word = get_vocabulary_store().lookup(hungarian)
+    if word is None:
+        raise HTTPException(status_code=404, detail="Word not found")
+    return {
+        "success": True,
+        "data": word.to_dict()
+    }
+
+# 단어 퀴즈
+@router.get("/quiz")
+async def get_vocabulary_quiz(
+    count: int = Query(10, ge=1, le=50),
+    level: Optional[str] = None,
+    topic: Optional[str] = None,
+    direction: str = "hu_ko"
+):
+    """객관식 단어 퀴즈 (direction: hu_ko 헝가리어 → 뜻, ko_hu 뜻 → 헝가리어)"""
+    if direction not in ("hu_ko", "ko_hu"):
+        raise HTTPException(status_code=400, detail=f"Unknown direction: {direction}")
+    questions = get_vocabulary_store().quiz(count, level=level, topic=topic, direction=direction)
+    if not questions:
+        raise HTTPException(status_code=404, detail="No words for the given level/topic")
+    return {
+        "success": True,
+        "data": {
+            "questions": questions
+        }
+    }
+
+# 단어 상세
+@router.get("/words/{word_id}")
+async def get_word(word_id: str):
+    """단어 상세 (각 소스의 id 모두 사용 가능)"""
+    word = get_vocabulary_store().get(word_id)
+    if word is None:
+        raise HTTPException(status_code=404, detail="Word not found")
+    return {
+        "success": True,
+        "data": word.to_dict()
+    }
+
+# 레벨별 단어장
+@router.get("/{level}")
+async def get_level_vocabulary(level: str, request: Request):
+    """주제별로 묶은 레벨 단어장 - 공유 스냅샷 우선"""
+    level = level.upper()
+    if level not in CEFR_LEVELS:
+        raise HTTPException(status_code=400, detail="유효하지 않은 레벨입니다.")
+    response = get_corpus_snapshot().response(VOCABULARY_KEY + level) or StaticJSONResponse(
+        get_vocabulary_store().level_topics(level)
+    )
+    return response.respond(request)
@@ -0,0 +1,88 @@
+"""
+Bearer 토큰 → 사용자 식별자
+
+Node 백엔드(src/lib/jwt.ts)와 같은 JWT_SECRET으로 서명한 HS256 액세스 토큰을 검증하고
+페이로드의 userId를 사용자 식별자로 쓴다. 토큰 문자열 자체를 식별자로 쓰지 않는다.
+- 서명, 만료(exp), 토큰 종류(type=access), iss/aud(있을 때) 확인
+- 검증 실패는 401
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import Optional, Dict, Any
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+# jwt.ts와 같은 기본값 - 운영 환경에서는 반드시 JWT_SECRET 설정
+JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
+JWT_EXPIRES_SECONDS = 7 * 24 * 3600
+JWT_ISSUER = "hungarian-learning-platform"
+JWT_AUDIENCE = "hungarian-learner"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _sign(message: bytes, secret: str) -> str:
+    return _b64encode(hmac.new(secret.encode("utf-8"), message, hashlib.sha256).digest())
+
+
+def issue_token(user_id: str, email: str, secret: str = JWT_SECRET, expires_in: int = JWT_EXPIRES_SECONDS) -> str:
+    """액세스 토큰 발급 (jwt.ts generateAccessToken과 같은 페이로드)"""
+    now = int(time.time())
+    header = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode("utf-8"))
+    payload = _b64encode(json.dumps({
+        "userId": user_id, "email": email, "type": "access",
+        "iss": JWT_ISSUER, "aud": JWT_AUDIENCE, "iat": now, "exp": now + expires_in,
+    }, separators=(",", ":")).encode("utf-8"))
+    signing_input = f"{header}.{payload}"
+    return f"{signing_input}.{_sign(signing_input.encode('ascii'), secret)}"
+
+
+def decode_token(token: str, secret: str = JWT_SECRET, now: Optional[float] = None) -> Dict[str, Any]:
+    """서명/만료를 검증한 페이로드 (잘못된 토큰은 ValueError)"""
+    try:
+        header_segment, payload_segment, signature = token.split(".")
+        header = json.loads(_b64decode(header_segment))
+        payload = json.loads(_b64decode(payload_segment))
+    except (ValueError, UnicodeError):
+        raise ValueError("Malformed token")
+    if header.get("alg") != "HS256":
+        raise ValueError("Unsupported token algorithm")
+    expected = _sign(f"{header_segment}.{payload_segment}".encode("ascii"), secret)
+    if not hmac.compare_digest(expected, signature):
+        raise ValueError("Invalid token signature")
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed token")
+    if "exp" in payload and float(payload["exp"]) <= (time.time() if now is None else now):
+        raise ValueError("Token expired")
+    if payload.get("type", "access") != "access":
+        raise ValueError("Not an access token")
+    if payload.get("iss", JWT_ISSUER) != JWT_ISSUER or payload.get("aud", JWT_AUDIENCE) != JWT_AUDIENCE:
+        raise ValueError("Token issuer or audience mismatch")
+    if not isinstance(payload.get("userId"), str) or not payload["userId"]:
+        raise ValueError("Token has no userId")
+    return payload
+
+
+def get_user_id(credentials: HTTPAuthorizationCredentials) -> str:
+    """인증 정보에서 사용자 식별자 추출 (검증 실패는 HTTPException 401)"""
+    try:
+        return decode_token(credentials.credentials)["userId"]
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"})
+
+
+def optional_user_id(credentials: Optional[HTTPAuthorizationCredentials]) -> Optional[str]:
+    """인증 헤더가 있으면 사용자 식별자 반환 (있는데 잘못된 토큰이면 401)"""
+    return get_user_id(credentials) if credentials else None
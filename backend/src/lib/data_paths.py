@@ -0,0 +1,49 @@
+"""
+백엔드 데이터 파일 경로 및 로더
+"""
+
+import json
+import os
+from typing import Any, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(BACKEND_DIR, "src", "data")
+PRISMA_DIR = os.path.join(BACKEND_DIR, "prisma")
+# 데이터 파일로부터 생성되는 빌드 산출물 (git 미추적)
+BUILD_DIR = os.path.join(BACKEND_DIR, "build")
+# 런타임 상태 스냅샷 (git 미추적)
+STATE_DIR = os.environ.get("BACKEND_STATE_DIR", os.path.join(BACKEND_DIR, "var"))
+
+CEFR_LEVELS = ("A1", "A2", "B1", "B2")
+
+# 초기 형식(content 하위 구조)의 문법 강의 디렉토리
+LEGACY_LESSON_DIR = "grammar-lessons"
+
+
+def data_path(*parts: str) -> str:
+    """src/data 기준 경로"""
+    return os.path.join(DATA_DIR, *parts)
+
+
+def lesson_files() -> List[Tuple[str, str]]:
+    """문법 강의 JSON 파일 목록 (lesson_id, 경로)
+
+    lesson_id는 "a1-01-nouns-basics"처럼 레벨 디렉토리와 파일명으로 만들고,
+    초기 형식 강의는 "legacy-01-articles" 형식을 사용한다.
+    """
+    files = []
+    for directory, prefix in [(f"grammar-lessons-{level.lower()}", level.lower()) for level in CEFR_LEVELS] + [
+        (LEGACY_LESSON_DIR, "legacy")
+    ]:
+        path = data_path(directory)
+        if not os.path.isdir(path):
+            continue
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith(".json"):
+                files.append((f"{prefix}-{filename[:-len('.json')]}", os.path.join(path, filename)))
+    return files
+
+
+def load_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,55 @@
+"""
+프로세스 간 파일 잠금 (fcntl advisory lock)
+
+WEB_CONCURRENCY로 워커를 여러 개 띄우면 STATE_DIR 저장소 파일을 여러 프로세스가 함께 쓴다.
+저장소는 읽고-고쳐-쓰기 전에 배타적 잠금을 잡고, 잠금 안에서 다른 프로세스가 기록한 내용을 먼저 따라잡는다.
+- 잠금 파일은 대상 옆의 별도 파일 - 대상을 os.replace로 교체해도 같은 잠금을 계속 씀
+- 잠금은 열린 파일 단위라 같은 프로세스 안에서도 서로 기다림 (이벤트 루프에서는 asyncio.to_thread로 잡기)
+- fcntl이 없는 플랫폼에서는 잠금 없이 동작 (단일 프로세스 전제)
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def acquire_lock(path: str, shared: bool = False, blocking: bool = True) -> Optional[int]:
+    """잠금 파일을 열어 잠금 - 잠금을 유지하는 fd 반환 (blocking=False이고 다른 프로세스가 잡고 있으면 None)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is not None:
+        flags = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | (0 if blocking else fcntl.LOCK_NB)
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+    return fd
+
+
+def release_lock(fd: Optional[int]) -> None:
+    if fd is not None:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False):
+    fd = acquire_lock(path, shared)
+    try:
+        yield
+    finally:
+        release_lock(fd)
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, 수정 시각, 크기) - 다른 프로세스가 파일을 바꿨는지 비교용 (없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,221 @@
+"""
+응답 캐시 및 조건부 GET(ETag / If-None-Match) 지원
+
+- VersionedResponseCache: 사용자별 버전 카운터가 바뀌지 않았다면 payload를 다시
+  만들거나 직렬화하지 않고 캐시된 바이트 또는 304 Not Modified로 응답
+- StaticJSONResponse: 변하지 않는 카탈로그 데이터를 한 번만 직렬화/압축해 두고
+  요청마다 바이트를 그대로 응답
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 프로세스마다 달라지는 값 - 재시작 후 버전 카운터가 0부터 다시 시작해도 ETag가 겹치지 않도록 함
+_BOOT_ID = os.urandom(4).hex()
+
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+
+
+def encode_json(payload: Any) -> bytes:
+    """FastAPI JSONResponse와 동일한 형식으로 직렬화 (orjson이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def make_etag(body: bytes) -> str:
+    """응답 바이트로부터 강한(strong) ETag 생성"""
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q값} 형태로 파싱"""
+    encodings: Dict[str, float] = {}
+    if not accept_encoding:
+        return encodings
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 주어진 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+def not_modified(etag: str, cache_control: str = DEFAULT_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+class VersionedResponseCache:
+    """버전 카운터 기반 렌더링 응답 캐시 (LRU)
+
+    - bump(scope): 사용자(또는 전역 scope)의 상태가 바뀌었을 때 호출
+    - respond(): 버전이 같으면 304 또는 캐시된 바이트, 다르면 render() 후 저장
+    """
+
+    def __init__(self, max_entries: int = 10000, max_scopes: int = 100000):
+        self.max_entries = max_entries
+        self.max_scopes = max_scopes
+        # scope → 버전 (LRU) - 버전 값은 전역 카운터에서 받아 scope 간에도 다시 쓰지 않음
+        self._versions: "OrderedDict[str, int]" = OrderedDict()
+        self._counter = 0
+        # 목록에 없는 scope의 버전 - scope를 밀어낼 때마다 새 값으로 바꿔 밀려난 scope의 옛 ETag와 겹치지 않도록 함
+        self._floor = 0
+        # key → (version, etag, body)
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, str, bytes]]" = OrderedDict()
+
+    def version(self, scope: str) -> int:
+        version = self._versions.get(scope)
+        if version is None:
+            return self._floor
+        self._versions.move_to_end(scope)
+        return version
+
+    def bump(self, scope: str) -> int:
+        """scope 버전 증가 - 이전 버전으로 캐시된 응답은 다음 조회 때 자연히 무효화됨"""
+        self._counter += 1
+        self._versions[scope] = self._counter
+        self._versions.move_to_end(scope)
+        if len(self._versions) > self.max_scopes:
+            self._versions.popitem(last=False)
+            self._counter += 1
+            self._floor = self._counter
+        return self._versions[scope]
+
+    def _etag_for(self, key: Hashable, version: Hashable) -> str:
+        digest = hashlib.blake2b(repr((key, version)).encode("utf-8"), digest_size=12).hexdigest()
+        return f'W/"{_BOOT_ID}-{digest}"'
+
+    def respond(
+        self,
+        request: Request,
+        key: Hashable,
+        version: Hashable,
+        render: Callable[[], Any],
+        cache_control: str = DEFAULT_CACHE_CONTROL,
+    ) -> Response:
+        """조건부 GET 처리 후 캐시된(또는 새로 렌더링한) JSON 응답 반환"""
+        # ETag는 (key, version)만으로 결정되므로 304 판단에 payload가 필요 없음
+        etag = self._etag_for(key, version)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified(etag, cache_control)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            body = entry[2]
+        else:
+            body = encode_json(render())
+            self._entries[key] = (version, etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+
+
+class StaticJSONResponse:
+    """불변 JSON payload를 미리 직렬화/압축해 둔 응답
+
+    요청 시에는 dict 생성이나 jsonable_encoder 인코딩 없이 ETag 비교와
+    Accept-Encoding에 맞는 바이트 선택만 수행한다.
+    """
+
+    def __init__(self, payload: Any, cache_control: str = "public, max-age=3600"):
+        self.body = encode_json(payload)
+        self.etag = make_etag(self.body)
+        self.cache_control = cache_control
+        # 인코딩별로 미리 압축된 변형 (선호 순서)
+        self.variants: Dict[str, bytes] = {}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(self.body, quality=11)
+        self.variants["gzip"] = gzip.compress(self.body, compresslevel=9)
+
+    @classmethod
+    def from_encoded(cls, body: bytes, etag: str, variants: Dict[str, bytes],
+                     cache_control: str = "public, max-age=3600") -> "StaticJSONResponse":
+        """이미 직렬화/압축된 바이트(메모리 맵 memoryview 포함)로 생성"""
+        response = cls.__new__(cls)
+        response.body = body
+        response.etag = etag
+        response.cache_control = cache_control
+        response.variants = variants
+        return response
+
+    def _select(self, accept_encoding: Optional[str]) -> Tuple[Optional[str], Any]:
+        """Accept-Encoding에 맞는 (인코딩, 바이트) - q값이 높은 변형 우선, 같으면 선호 순서, "*"는 나열되지 않은 인코딩"""
+        accepted = accepted_encodings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for encoding, body in self.variants.items():
+            quality = accepted.get(encoding, wildcard)
+            if quality > best_quality and len(body) < len(self.body):
+                best, best_quality = encoding, quality
+        identity = accepted.get("identity", 0.0)
+        if best is None or identity > best_quality:
+            return None, self.body
+        return best, self.variants[best]
+
+    def variant_etag(self, encoding: Optional[str]) -> str:
+        """인코딩별 ETag - 바이트가 다른 표현은 강한 검증자도 달라야 함 (RFC 7232)"""
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def respond(self, request: Request) -> Response:
+        encoding, body = self._select(request.headers.get("accept-encoding"))
+        headers = {
+            "ETag": self.variant_etag(encoding),
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
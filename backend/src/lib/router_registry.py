@@ -0,0 +1,161 @@
+"""
+지연(lazy) 라우터 레지스트리
+
+라우터 모듈을 앱 시작 시점에 모두 임포트하지 않고, 해당 prefix로 첫 요청이
+들어올 때 임포트해서 마운트한다. 서버리스 콜드 스타트에서 사용하지 않는
+서브시스템의 임포트 비용을 내지 않도록 하기 위함.
+- 라우터별 임포트 시간 기록
+- 시작 시 prefix 충돌, 마운트 시 (method, path) 충돌 감지
+- 마운트는 순수 ASGI 미들웨어(LazyRouterMiddleware)에서 - 응답 스트리밍/백그라운드 작업을 감싸지 않음
+"""
+
+import importlib
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+from fastapi.routing import APIRoute
+
+# 문서 요청 시에는 전체 스키마가 필요하므로 모든 라우터를 마운트
+_DOCS_PATHS = ("/docs", "/redoc", "/openapi.json")
+
+
+class RouterSpec(NamedTuple):
+    """레지스트리 항목 선언"""
+    module: str                 # 임포트할 모듈 경로 (예: "src.api.gamification")
+    attribute: str              # 모듈 안의 APIRouter 변수명
+    prefix: str                 # 이 라우터가 담당하는 URL prefix (지연 마운트 기준)
+    include_prefix: str = ""    # include_router에 넘길 prefix (라우터 자체 prefix가 없을 때)
+    tags: Tuple[str, ...] = ()
+
+
+class _RouterState:
+    __slots__ = ("spec", "status", "import_ms", "error", "collisions")
+
+    def __init__(self, spec: RouterSpec):
+        self.spec = spec
+        self.status = "pending"     # pending | mounted | failed
+        self.import_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.collisions: List[str] = []
+
+
+def _route_keys(routes: List[Any], prefix: str = "") -> Dict[Tuple[str, str], str]:
+    """(method, path) → 라우트 이름"""
+    keys = {}
+    for route in routes:
+        if isinstance(route, APIRoute):
+            for method in route.methods:
+                keys[(method, prefix + route.path)] = route.name
+    return keys
+
+
+def _owns(prefix: str, path: str) -> bool:
+    return path == prefix or path.startswith(prefix.rstrip("/") + "/")
+
+
+class LazyRouterRegistry:
+    """prefix 기반 지연 마운트 라우터 레지스트리"""
+
+    def __init__(self, app: FastAPI, specs: List[RouterSpec]):
+        self.app = app
+        self._states = [_RouterState(spec) for spec in specs]
+        # 긴 prefix가 먼저 매칭되도록 정렬
+        self._states.sort(key=lambda state: len(state.spec.prefix), reverse=True)
+        # 레지스트리가 마운트한 라우트 (include_router 구현에 따라 app.routes에 펼쳐지지 않을 수 있음)
+        self._mounted_keys: Dict[Tuple[str, str], str] = {}
+
+    def check_collisions(self) -> List[str]:
+        """시작 시 prefix 중복 및 앱에 직접 등록된 라우트와의 충돌 검사"""
+        problems = []
+        for index, state in enumerate(self._states):
+            for other in self._states[index + 1:]:
+                if _owns(other.spec.prefix, state.spec.prefix) or _owns(state.spec.prefix, other.spec.prefix):
+                    problems.append(
+                        f"prefix overlap: {state.spec.module} ({state.spec.prefix}) "
+                        f"<-> {other.spec.module} ({other.spec.prefix})"
+                    )
+            for (method, path), name in _route_keys(self.app.router.routes).items():
+                if _owns(state.spec.prefix, path):
+                    problems.append(
+                        f"{method} {path} ({name}) is registered on the app but {state.spec.prefix} "
+                        f"belongs to {state.spec.module}"
+                    )
+        return problems
+
+    def mount(self, state: _RouterState) -> bool:
+        """라우터 임포트 및 마운트 (실패 시 다시 시도하지 않음)"""
+        if state.status != "pending":
+            return state.status == "mounted"
+
+        spec = state.spec
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(spec.module)
+            router = getattr(module, spec.attribute)
+        except (ImportError, AttributeError) as e:
+            state.status = "failed"
+            state.error = str(e)
+            print(f"Warning: {spec.module}.{spec.attribute} router could not be loaded: {e}")
+            return False
+        finally:
+            state.import_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        existing = _route_keys(self.app.router.routes)
+        existing.update(self._mounted_keys)
+        router_keys = _route_keys(router.routes, spec.include_prefix)
+        state.collisions = [f"{method} {path}" for method, path in router_keys if (method, path) in existing]
+
+        self.app.include_router(router, prefix=spec.include_prefix, tags=list(spec.tags) or None)
+        self._mounted_keys.update(router_keys)
+        if state.collisions:
+            print(f"Warning: {spec.module} routes shadowed by existing routes: {', '.join(state.collisions)}")
+
+        state.status = "mounted"
+        # 새 라우트가 OpenAPI 스키마에 반영되도록 캐시 초기화
+        self.app.openapi_schema = None
+        return True
+
+    def mount_all(self) -> None:
+        for state in self._states:
+            self.mount(state)
+
+    def mount_for_path(self, path: str) -> None:
+        if path in _DOCS_PATHS:
+            self.mount_all()
+            return
+        for state in self._states:
+            if state.status == "pending" and _owns(state.spec.prefix, path):
+                self.mount(state)
+                return
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "module": state.spec.module,
+                "prefix": state.spec.prefix,
+                "status": state.status,
+                "import_ms": state.import_ms,
+                "error": state.error,
+                "collisions": state.collisions,
+            }
+            for state in self._states
+        ]
+
+
+class LazyRouterMiddleware:
+    """ASGI 미들웨어 - 라우팅 전에 요청 경로에 필요한 라우터를 마운트하고 그대로 다음 앱으로 넘김
+
+    BaseHTTPMiddleware(app.middleware("http"))와 달리 요청/응답을 감싸지 않으므로
+    스트리밍 응답과 백그라운드 작업에 추가 비용이 없다.
+    """
+
+    def __init__(self, app: ASGIApp, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            self.registry.mount_for_path(scope["path"])
+        await self.app(scope, receive, send)
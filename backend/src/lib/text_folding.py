@@ -0,0 +1,12 @@
+"""
+헝가리어/한국어 비교용 문자열 정규화
+"""
+
+import unicodedata
+
+
+def fold(text: str) -> str:
+    """소문자화 + 라틴 문자 악센트 제거 (한글은 NFC로 재조합되어 유지됨)"""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return unicodedata.normalize("NFC", stripped)
@@ -0,0 +1,639 @@
+"""
+적응형 레벨 평가 (Computerized Adaptive Testing)
+
+Rasch(1PL) 모형 기반으로 응답마다 능력치(theta)를 갱신하고,
+현재 능력치에서 정보량이 가장 큰 문항을 다음 문항으로 출제한다.
+- 문항 은행: skill_area별 난이도(logit) 배열
+- 다음 문항 선택: theta 격자점별 상위 K개 최대 정보량 문항표를 미리 계산 - 문항 수와 무관하게 O(K)
+- 능력치 갱신: 응답 1건당 O(1) Newton 단계 (N(0, 1) 사전분포)
+- 문항 난이도: Elo 방식으로 응답 데이터에 따라 조금씩 보정, 주기적으로 정보량표 재계산
+- 세션: TTL 만료가 있는 메모리 세션 저장소 + 세션별 JSON 파일 (워커가 여러 개여도 어느 워커든 이어서 진행)
+"""
+
+import json
+import math
+import os
+import re
+import secrets
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import CEFR_LEVELS, STATE_DIR
+from src.lib.file_lock import file_stamp
+from src.services.question_store import QuestionStore, get_question_store
+from src.services.term_search import fold, get_term_search_index
+
+# CEFR 레벨별 기준 난이도 (logit)와 능력치 → 레벨 경계
+LEVEL_DIFFICULTY = {"A1": -1.5, "A2": -0.5, "B1": 0.5, "B2": 1.5}
+LEVEL_CUTS = (-1.0, 0.0, 1.0)
+
+# 정보량표 theta 격자
+THETA_MIN, THETA_MAX, THETA_STEP = -4.0, 4.0, 0.25
+THETA_GRID = np.arange(THETA_MIN, THETA_MAX + THETA_STEP / 2, THETA_STEP)
+TOP_K = 32
+
+# 같은 문항이 모든 응시자에게 출제되지 않도록 상위 후보 중 무작위 선택 (randomesque)
+EXPOSURE_CANDIDATES = 3
+
+# 능력치 사전분포 N(0, 1)의 정밀도
+PRIOR_PRECISION = 1.0
+
+# 종료 조건
+MIN_QUESTIONS = 10
+MAX_QUESTIONS = 25
+TARGET_STANDARD_ERROR = 0.45
+# 잘 맞는 문항 1개의 평균 정보량 (남은 문항 수 추정용)
+EXPECTED_ITEM_INFORMATION = 0.2
+
+# 문항 난이도 Elo 보정 계수 및 정보량표 재계산 주기 (응답 수)
+ITEM_K = 0.05
+REBUILD_INTERVAL = 500
+# 난이도 보정은 인증된 세션에서, 능력치 추정이 이 응답 수 이상 쌓인 뒤에만 (익명/초반 응답은 반영하지 않음)
+CALIBRATION_MIN_ANSWERS = 3
+
+# 레벨별 권장 주당 학습 시간과 목표 달성 기간 (assessmentEngine.ts와 같은 표), 신뢰도가 낮으면 기간 연장
+STUDY_HOURS_WEEKLY = {"A1": 8, "A2": 10, "B1": 12, "B2": 15}
+TIMELINE_MONTHS = {"A1": 6, "A2": 8, "B1": 10, "B2": 12}
+
+SESSION_TTL_SECONDS = 30 * 60
+MAX_SESSIONS = 10000
+ASSESSMENT_DIR = os.path.join(STATE_DIR, "assessment")
+# 만료된 세션 파일 정리 주기
+SWEEP_INTERVAL_SECONDS = 5 * 60
+SESSION_ID_PATTERN = re.compile(r"^assess_[0-9a-f]{16}$")
+
+
+def logistic(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def update_ability(theta: float, precision: float, difficulty: float, score: float) -> Tuple[float, float]:
+    """사후분포 모드 방향 Newton 1단계: theta += (x - p) / (누적 정보량 + 사전 정밀도)"""
+    probability = float(logistic(theta - difficulty))
+    precision += probability * (1 - probability)
+    theta = min(max(theta + (score - probability) / precision, THETA_MIN), THETA_MAX)
+    return theta, precision
+
+
+def level_for_theta(theta: float) -> str:
+    for level, cut in zip(CEFR_LEVELS, LEVEL_CUTS):
+        if theta < cut:
+            return level
+    return CEFR_LEVELS[-1]
+
+
+def level_confidence(theta: float, standard_error: float) -> int:
+    """추정 레벨 구간 안에 실제 능력치가 있을 확률 (%) - 정규 근사"""
+    level_index = CEFR_LEVELS.index(level_for_theta(theta))
+    lower = LEVEL_CUTS[level_index - 1] if level_index > 0 else -math.inf
+    upper = LEVEL_CUTS[level_index] if level_index < len(LEVEL_CUTS) else math.inf
+
+    def cdf(x: float) -> float:
+        if math.isinf(x):
+            return 0.0 if x < 0 else 1.0
+        return 0.5 * (1 + math.erf((x - theta) / (standard_error * math.sqrt(2))))
+
+    return int(round(100 * (cdf(upper) - cdf(lower))))
+
+
+class Item:
+    """문항 (정답은 응답 payload에 포함하지 않음)"""
+    __slots__ = ("id", "type", "skill_area", "level", "difficulty", "question_text", "options", "answer", "time_limit_seconds")
+
+    def __init__(
+        self,
+        id: str,
+        skill_area: str,
+        level: str,
+        difficulty: float,
+        question_text: str,
+        options: List[str],
+        answer: str,
+        time_limit_seconds: int = 30,
+        type: str = "multiple_choice",
+    ):
+        self.id = id
+        self.type = type
+        self.skill_area = skill_area
+        self.level = level
+        self.difficulty = difficulty
+        self.question_text = question_text
+        self.options = options
+        self.answer = answer
+        self.time_limit_seconds = time_limit_seconds
+
+    def to_question(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "skill_area": self.skill_area,
+            "question_text": self.question_text,
+            "options": self.options,
+            "time_limit_seconds": self.time_limit_seconds,
+        }
+
+
+class ItemBank:
+    """skill_area별 난이도 배열과 최대 정보량 문항표"""
+
+    def __init__(self, items: List[Item]):
+        self.items = items
+        self._by_id = {item.id: index for index, item in enumerate(items)}
+        self.difficulty = np.asarray([item.difficulty for item in items], dtype=np.float64)
+        self._skill_items: Dict[str, np.ndarray] = {}
+        for skill in dict.fromkeys(item.skill_area for item in items):
+            self._skill_items[skill] = np.asarray(
+                [index for index, item in enumerate(items) if item.skill_area == skill], dtype=np.int32
+            )
+        self.average_time_limit = (
+            sum(item.time_limit_seconds for item in items) / len(items) if items else 0.0
+        )
+        self._pending_updates = 0
+        self._tables: Dict[str, np.ndarray] = {}
+        self.rebuild_tables()
+
+    @property
+    def skill_areas(self) -> List[str]:
+        return list(self._skill_items)
+
+    def index_of(self, item_id: str) -> Optional[int]:
+        return self._by_id.get(item_id)
+
+    def rebuild_tables(self) -> None:
+        """격자점별 정보량 상위 K개 문항 (정보량 내림차순) - O(G·N)"""
+        tables = {}
+        for skill, indices in self._skill_items.items():
+            probability = logistic(THETA_GRID[:, None] - self.difficulty[indices][None, :])
+            information = probability * (1 - probability)
+            k = min(TOP_K, len(indices))
+            top = np.argpartition(-information, k - 1, axis=1)[:, :k]
+            order = np.argsort(-np.take_along_axis(information, top, axis=1), axis=1, kind="stable")
+            tables[skill] = indices[np.take_along_axis(top, order, axis=1)]
+        self._tables = tables
+        self._pending_updates = 0
+
+    def select(self, skill: str, theta: float, used: set, rng: np.random.Generator) -> Optional[int]:
+        """theta에서 정보량이 큰 미출제 문항 선택"""
+        table = self._tables.get(skill)
+        if table is None:
+            return None
+        row = int(round((min(max(theta, THETA_MIN), THETA_MAX) - THETA_MIN) / THETA_STEP))
+        candidates = []
+        for index in table[row].tolist():
+            if index not in used:
+                candidates.append(index)
+                if len(candidates) >= EXPOSURE_CANDIDATES:
+                    break
+        if not candidates:
+            # 상위 K개를 모두 사용한 경우 (드묾) - 난이도 차이가 가장 작은 미출제 문항
+            indices = self._skill_items[skill]
+            remaining = [index for index in np.argsort(np.abs(self.difficulty[indices] - theta)).tolist()
+                         if int(indices[index]) not in used]
+            return int(indices[remaining[0]]) if remaining else None
+        return candidates[int(rng.integers(len(candidates)))]
+
+    def record(self, index: int, theta: float, correct: bool) -> None:
+        """응답 결과로 문항 난이도 보정 (Elo)"""
+        expected = float(logistic(theta - self.difficulty[index]))
+        self.difficulty[index] -= ITEM_K * ((1.0 if correct else 0.0) - expected)
+        self.items[index].difficulty = float(self.difficulty[index])
+        self._pending_updates += 1
+        if self._pending_updates >= REBUILD_INTERVAL:
+            self.rebuild_tables()
+
+
+class AssessmentSession:
+    """평가 세션 상태 - skill_area 순서대로 정렬된 고정 길이 리스트"""
+    __slots__ = (
+        "id", "skill_areas", "theta", "precision", "answered", "correct",
+        "overall_theta", "overall_precision", "used", "current", "started_at", "completed", "calibrate",
+    )
+
+    def __init__(self, session_id: str, skill_areas: List[str], starting_theta: float, calibrate: bool = False):
+        self.id = session_id
+        self.skill_areas = skill_areas
+        self.theta = [starting_theta] * len(skill_areas)
+        self.precision = [PRIOR_PRECISION] * len(skill_areas)
+        self.answered = [0] * len(skill_areas)
+        self.correct = [0] * len(skill_areas)
+        self.overall_theta = starting_theta
+        self.overall_precision = PRIOR_PRECISION
+        self.used: set = set()
+        self.current: Optional[int] = None
+        self.started_at = time.time()
+        self.completed = False
+        self.calibrate = calibrate
+
+    @property
+    def questions_completed(self) -> int:
+        return sum(self.answered)
+
+    def standard_error(self, skill_index: Optional[int] = None) -> float:
+        precision = self.overall_precision if skill_index is None else self.precision[skill_index]
+        return 1.0 / math.sqrt(precision)
+
+    def to_dict(self) -> Dict[str, Any]:
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["used"] = sorted(self.used)
+        return state
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "AssessmentSession":
+        session = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(session, name, state[name])
+        session.used = set(state["used"])
+        return session
+
+
+class TTLSessionStore:
+    """마지막 접근 순서로 정렬된 OrderedDict - 앞쪽부터 만료 항목 제거
+
+    directory가 있으면 세션을 세션별 JSON 파일로도 저장한다 (워커 간 공유).
+    - 파일 수정 시각 = 마지막 접근 시각, 수정 시각 + TTL이 지나면 만료 (주기적으로 파일 삭제)
+    - 메모리 항목은 파일이 바뀌었으면(다른 워커가 진행) 다시 읽음
+    - 한 세션의 요청은 순서대로 온다고 가정 (같은 세션 동시 응답은 마지막 저장이 남음)
+    """
+
+    def __init__(self, ttl_seconds: float = SESSION_TTL_SECONDS, max_sessions: int = MAX_SESSIONS,
+                 directory: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.directory = directory
+        # session_id → (만료 시각, 세션)
+        self._sessions: "OrderedDict[str, Tuple[float, AssessmentSession]]" = OrderedDict()
+        # session_id → 마지막으로 읽거나 쓴 파일 상태
+        self._stamps: Dict[str, Any] = {}
+        self._swept_at = 0.0
+
+    def _evict(self, now: float) -> None:
+        while self._sessions:
+            session_id, (expires_at, _) = next(iter(self._sessions.items()))
+            if expires_at > now and len(self._sessions) <= self.max_sessions:
+                break
+            del self._sessions[session_id]
+            self._stamps.pop(session_id, None)
+
+    def _path(self, session_id: str) -> str:
+        return os.path.join(self.directory, session_id + ".json")
+
+    def _sweep(self, now: float) -> None:
+        """수정 시각 + TTL이 지난 세션 파일 삭제 (다른 워커의 세션 포함)"""
+        if not self.directory or now - self._swept_at < SWEEP_INTERVAL_SECONDS:
+            return
+        self._swept_at = now
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            try:
+                if entry.name.endswith(".json") and entry.stat().st_mtime + self.ttl_seconds < now:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def save(self, session: AssessmentSession) -> None:
+        """세션 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(session.to_dict(), f)
+            os.replace(temp_path, self._path(session.id))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._stamps[session.id] = file_stamp(self._path(session.id))
+
+    def put(self, session: AssessmentSession) -> None:
+        now = time.time()
+        self._sessions[session.id] = (now + self.ttl_seconds, session)
+        self._sessions.move_to_end(session.id)
+        self._evict(now)
+        self.save(session)
+        self._sweep(now)
+
+    def _load(self, session_id: str, now: float) -> Optional[AssessmentSession]:
+        """세션 파일 확인 - 없거나 만료되었으면 None, 메모리 항목과 다르면 다시 읽음"""
+        if not SESSION_ID_PATTERN.match(session_id):
+            return None
+        path = self._path(session_id)
+        stamp = file_stamp(path)
+        if stamp is None or stamp[1] / 1e9 + self.ttl_seconds < now:
+            return None
+        entry = self._sessions.get(session_id)
+        if entry is not None and self._stamps.get(session_id) == stamp:
+            session = entry[1]
+        else:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    session = AssessmentSession.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Failed to load assessment session {session_id}: {e}")
+                return None
+        # 접근 시 만료 시각 연장 (파일 수정 시각 갱신)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        self._stamps[session_id] = file_stamp(path)
+        return session
+
+    def get(self, session_id: str) -> Optional[AssessmentSession]:
+        now = time.time()
+        self._evict(now)
+        if self.directory:
+            session = self._load(session_id, now)
+            if session is None:
+                self._sessions.pop(session_id, None)
+                self._stamps.pop(session_id, None)
+                return None
+            self._sessions[session_id] = (now + self.ttl_seconds, session)
+            self._sessions.move_to_end(session_id)
+            self._evict(now)
+            return session
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        # 접근 시 만료 시각 연장
+        self._sessions[session_id] = (now + self.ttl_seconds, entry[1])
+        self._sessions.move_to_end(session_id)
+        return entry[1]
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class AssessmentError(Exception):
+    """세션/응답 검증 실패 (status_code는 HTTP 응답 코드)"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class AdaptiveAssessmentEngine:
+    """적응형 평가 진행 (세션 생성 → 응답 → 결과)"""
+
+    def __init__(self, bank: ItemBank, store: Optional[TTLSessionStore] = None, rng: Optional[np.random.Generator] = None):
+        self.bank = bank
+        self.store = store if store is not None else TTLSessionStore()
+        self.rng = rng or np.random.default_rng()
+
+    def _session(self, session_id: str) -> AssessmentSession:
+        session = self.store.get(session_id)
+        if session is None:
+            raise AssessmentError(404, "Assessment session not found or expired")
+        return session
+
+    def _next_item(self, session: AssessmentSession) -> Optional[int]:
+        """응답 수가 가장 적은 영역부터, 해당 영역 theta에서 정보량 최대 문항"""
+        order = sorted(range(len(session.skill_areas)), key=lambda i: (session.answered[i], -session.standard_error(i)))
+        for skill_index in order:
+            index = self.bank.select(session.skill_areas[skill_index], session.theta[skill_index], session.used, self.rng)
+            if index is not None:
+                return index
+        return None
+
+    def _is_finished(self, session: AssessmentSession) -> bool:
+        completed = session.questions_completed
+        if completed >= MAX_QUESTIONS:
+            return True
+        if completed < MIN_QUESTIONS:
+            return False
+        return all(session.standard_error(i) <= TARGET_STANDARD_ERROR for i in range(len(session.skill_areas)))
+
+    def _estimated_remaining(self, session: AssessmentSession) -> int:
+        if session.completed:
+            return 0
+        target_precision = 1.0 / TARGET_STANDARD_ERROR ** 2
+        needed = sum(
+            max(0, math.ceil((target_precision - precision) / EXPECTED_ITEM_INFORMATION))
+            for precision in session.precision
+        )
+        completed = session.questions_completed
+        return min(MAX_QUESTIONS - completed, max(MIN_QUESTIONS - completed, needed))
+
+    def start(self, skill_areas: Optional[List[str]] = None, starting_level: Optional[str] = None,
+              calibrate: bool = False) -> Dict[str, Any]:
+        """새 세션 (calibrate: 이 세션의 응답으로 문항 난이도 보정 - 인증된 사용자만)"""
+        available = self.bank.skill_areas
+        selected = [skill for skill in (skill_areas or available) if skill in available]
+        if not selected:
+            raise AssessmentError(400, f"No items for the requested skill areas (available: {', '.join(available)})")
+
+        starting_theta = LEVEL_DIFFICULTY.get((starting_level or "").upper(), 0.0)
+        session = AssessmentSession(f"assess_{secrets.token_hex(8)}", selected, starting_theta, calibrate)
+        session.current = self._next_item(session)
+        session.used.add(session.current)
+        self.store.put(session)
+
+        expected_questions = (MIN_QUESTIONS + MAX_QUESTIONS) / 2
+        return {
+            "session_id": session.id,
+            "first_question": self.bank.items[session.current].to_question(),
+            "estimated_duration_minutes": math.ceil(expected_questions * self.bank.average_time_limit / 60),
+            "total_questions_estimate": f"{MIN_QUESTIONS}-{MAX_QUESTIONS}개",
+        }
+
+    def respond(self, session_id: str, question_id: str, user_answer: str, time_taken_seconds: Optional[float] = None) -> Dict[str, Any]:
+        session = self._session(session_id)
+        if session.completed or session.current is None:
+            raise AssessmentError(409, "Assessment session is already finished")
+        item = self.bank.items[session.current]
+        if question_id != item.id:
+            raise AssessmentError(409, f"Expected a response to {item.id}")
+
+        # 제한 시간을 넘긴 응답은 오답 처리
+        timed_out = time_taken_seconds is not None and time_taken_seconds > item.time_limit_seconds
+        is_correct = not timed_out and fold((user_answer or "").strip()) == fold(item.answer)
+        score = 1.0 if is_correct else 0.0
+
+        # 난이도 보정은 이 응답을 반영하기 전 능력치 기준 (반영 후 값을 쓰면 응답 방향으로 치우침)
+        if session.calibrate and session.questions_completed >= CALIBRATION_MIN_ANSWERS:
+            self.bank.record(session.current, session.overall_theta, is_correct)
+
+        skill_index = session.skill_areas.index(item.skill_area)
+        session.theta[skill_index], session.precision[skill_index] = update_ability(
+            session.theta[skill_index], session.precision[skill_index], item.difficulty, score
+        )
+        session.overall_theta, session.overall_precision = update_ability(
+            session.overall_theta, session.overall_precision, item.difficulty, score
+        )
+
+        session.answered[skill_index] += 1
+        session.correct[skill_index] += int(is_correct)
+
+        next_question = None
+        if self._is_finished(session):
+            session.completed = True
+            session.current = None
+        else:
+            session.current = self._next_item(session)
+            if session.current is None:
+                session.completed = True
+            else:
+                session.used.add(session.current)
+                next_question = self.bank.items[session.current].to_question()
+        self.store.save(session)
+
+        return {
+            "response_recorded": True,
+            "is_correct": is_correct,
+            "next_question": next_question,
+            "progress": {
+                "questions_completed": session.questions_completed,
+                "estimated_remaining": self._estimated_remaining(session),
+                "current_level_estimate": level_for_theta(session.overall_theta),
+            },
+        }
+
+    def complete(self, session_id: str) -> Dict[str, Any]:
+        session = self._session(session_id)
+        session.completed = True
+        session.current = None
+        self.store.save(session)
+
+        skill_results = []
+        for index, skill in enumerate(session.skill_areas):
+            answered = session.answered[index]
+            skill_results.append({
+                "skill_area": skill,
+                "estimated_level": level_for_theta(session.theta[index]),
+                "ability_estimate": round(session.theta[index], 2),
+                "confidence_score": level_confidence(session.theta[index], session.standard_error(index)),
+                "accuracy_percentage": round(100 * session.correct[index] / answered) if answered else 0,
+                "questions_answered": answered,
+            })
+
+        overall_level = level_for_theta(session.overall_theta)
+        # 전체 능력치보다 낮은 영역 (없으면 가장 낮은 영역)
+        ranked = sorted(range(len(session.skill_areas)), key=lambda i: session.theta[i])
+        focus_areas = [session.skill_areas[i] for i in ranked if session.theta[i] < session.overall_theta]
+        focus_areas = focus_areas or [session.skill_areas[ranked[0]]]
+        average_confidence = sum(result["confidence_score"] for result in skill_results) / len(skill_results)
+        timeline_factor = 1.3 if average_confidence < 60 else 1.1 if average_confidence < 80 else 1.0
+
+        return {
+            "assessment_id": f"result_{session.id}",
+            "overall_level": overall_level,
+            "ability_estimate": round(session.overall_theta, 2),
+            "overall_confidence": level_confidence(session.overall_theta, session.standard_error()),
+            "questions_completed": session.questions_completed,
+            "duration_seconds": int(time.time() - session.started_at),
+            "skill_results": skill_results,
+            "recommendations": {
+                "suggested_level": overall_level,
+                "focus_areas": focus_areas,
+                "estimated_study_hours_weekly": STUDY_HOURS_WEEKLY[overall_level],
+                "target_timeline_months": round(TIMELINE_MONTHS[overall_level] * timeline_factor),
+            },
+            "korean_interference_analysis": {
+                "severity": "medium",
+                "affected_areas": focus_areas,
+                "specific_challenges": ["헝가리어 격변화 시스템 적응", "한국어에 없는 발음"],
+            },
+        }
+
+
+# ---------------------------------------------------------------------------
+# 기본 문항 은행 - 어휘 문서로 4지선다 뜻 고르기/헝가리어 고르기 문항 생성
+# ---------------------------------------------------------------------------
+
+VOCABULARY_OPTIONS = 4
+# 한국어 → 헝가리어 (산출) 문항은 같은 레벨의 뜻 고르기보다 어려움
+PRODUCTION_OFFSET = 0.3
+
+
+def _vocabulary_items(documents: List[Dict[str, Any]]) -> List[Item]:
+    by_level: Dict[str, List[int]] = {}
+    for doc_id, document in enumerate(documents):
+        level = document["difficulty_level"].upper()
+        if level in LEVEL_DIFFICULTY:
+            by_level.setdefault(level, []).append(doc_id)
+
+    items = []
+    for level, doc_ids in by_level.items():
+        pool = np.asarray(doc_ids)
+        for doc_id in doc_ids:
+            document = documents[doc_id]
+            # 문서별 고정 시드 - 재시작해도 같은 문항은 같은 보기
+            rng = np.random.default_rng(doc_id)
+            distractors = [documents[int(other)] for other in rng.permutation(pool)[:VOCABULARY_OPTIONS * 2]
+                           if int(other) != doc_id]
+            # 단어가 길수록 약간 어렵게 (보정 전 초기값)
+            difficulty = LEVEL_DIFFICULTY[level] + float(np.clip(0.05 * (len(document["hungarian_term"]) - 8), -0.4, 0.4))
+
+            for field, prompt, offset, time_limit in (
+                ("korean_translation", '"{hungarian_term}"의 뜻은?', 0.0, 20),
+                ("hungarian_term", '"{korean_translation}"을(를) 헝가리어로?', PRODUCTION_OFFSET, 25),
+            ):
+                answer = document[field]
+                options = [answer]
+                for other in distractors:
+                    if len(options) >= VOCABULARY_OPTIONS:
+                        break
+                    if other[field] not in options:
+                        options.append(other[field])
+                if len(options) < VOCABULARY_OPTIONS:
+                    continue
+                rng.shuffle(options)
+                items.append(Item(
+                    id=f"vocab_{document['id']}_{'hu' if field == 'hungarian_term' else 'ko'}",
+                    skill_area="vocabulary",
+                    level=level,
+                    difficulty=difficulty + offset,
+                    question_text=prompt.format(**document),
+                    options=options,
+                    answer=answer,
+                    time_limit_seconds=time_limit,
+                ))
+    return items
+
+
+# ---------------------------------------------------------------------------
+# 문법 문항 - 컴파일된 문항 저장소(question_store)에서 생성
+# ---------------------------------------------------------------------------
+
+GRAMMAR_TIME_LIMITS = {"correction": 30, "fill_in": 40}
+
+
+def _grammar_items(store: QuestionStore) -> List[Item]:
+    items = []
+    for index in range(len(store)):
+        question = store.question(index)
+        # 강의 난이도 점수(1~7, 보통 3)로 레벨 안에서 미세 조정
+        difficulty = LEVEL_DIFFICULTY[question["level"]] + float(np.clip(0.1 * (question["difficulty_score"] - 3), -0.4, 0.4))
+        question_text = question["instruction"]
+        if question["prompt"]:
+            question_text = f"{question_text}\n{question['prompt']}" if question_text else question["prompt"]
+        items.append(Item(
+            id=question["id"],
+            skill_area="grammar",
+            level=question["level"],
+            difficulty=difficulty,
+            question_text=question_text,
+            options=question["options"],
+            answer=question["answer"],
+            time_limit_seconds=GRAMMAR_TIME_LIMITS[question["kind"]],
+        ))
+    return items
+
+
+def build_default_item_bank() -> ItemBank:
+    return ItemBank(_grammar_items(get_question_store()) + _vocabulary_items(get_term_search_index().documents))
+
+
+@lru_cache(maxsize=1)
+def get_assessment_engine() -> AdaptiveAssessmentEngine:
+    """프로세스 전역 평가 엔진 (최초 호출 시 문항 은행 생성)"""
+    return AdaptiveAssessmentEngine(build_default_item_bank(), TTLSessionStore(directory=ASSESSMENT_DIR))
@@ -0,0 +1,544 @@
+"""
+학습 세션 분석 저장소
+
+학습 세션을 추가 전용(append-only) 열 배열에 쌓고, 사용자 × 기술 영역별 일/주/월 합계를
+추가 시점에 증분 갱신한다. 대시보드는 원본 세션을 훑지 않고 필요한 구간 수만큼 합계를 읽는다.
+- 원본: 열마다 NumPy 배열 하나 (메모리) + 열마다 추가 전용 바이너리 파일 하나 (디스크)
+- 합계: (사용자, 구간) → (전체 + 기술 영역 수) × 지표 수 배열, 다중 기술 세션의 학습 시간은 영역 수로 나눔
+- 시작 시 열 파일을 읽어 합계를 벡터 연산으로 다시 계산
+- 워커 여러 개: 추가는 잠금 파일의 배타적 잠금 안에서 다른 프로세스가 추가한 행을 먼저 따라잡은 뒤 기록,
+  읽기는 열 파일이 메모리보다 길면 공유 잠금 안에서 새 행만 읽어 합계에 더함
+"""
+
+import datetime
+import json
+import math
+import os
+import time
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Callable
+
+import numpy as np
+
+from src.lib.data_paths import STATE_DIR
+from src.lib.file_lock import file_lock
+from src.services.recommendation_engine import CONTENT_TYPES, SKILLS
+
+ANALYTICS_DIR = os.path.join(STATE_DIR, "analytics")
+# 일/주/월 구간 기준 시간대 (기본값: 한국 표준시)
+UTC_OFFSET_SECONDS = int(float(os.environ.get("ANALYTICS_UTC_OFFSET_HOURS", "9")) * 3600)
+
+# 세션 열 (이름, dtype) - 기술 영역과 콘텐츠 유형은 비트마스크
+SESSION_COLUMNS = (
+    ("user", np.int32),
+    ("started_at", np.int64),
+    ("duration_minutes", np.float32),
+    ("skills", np.uint8),
+    ("content_types", np.uint16),
+    ("completion_rate", np.float32),
+    ("accuracy_score", np.float32),
+    ("engagement_level", np.float32),
+    ("vocabulary_learned", np.int32),
+    ("grammar_concepts", np.int32),
+    # 수집 파이프라인의 멱등 키 (WAL 순번, 직접 추가한 세션은 0) - 재반영 시 이미 들어간 세션 건너뜀
+    ("ingest_key", np.int64),
+)
+INITIAL_CAPACITY = 4096
+# 허용하는 세션 시각 범위 (2000-01-01 ~ 현재 + 1일) - 구간 날짜 계산이 넘치지 않도록
+MIN_TIMESTAMP = 946684800
+MAX_FUTURE_SECONDS = 86400
+
+# 합계 지표 (평균 지표는 세션 수로 나눠 계산)
+ROLLUP_FIELDS = ("minutes", "sessions", "accuracy", "completion", "engagement", "vocabulary", "grammar")
+_FIELD = {name: index for index, name in enumerate(ROLLUP_FIELDS)}
+GRANULARITIES = ("day", "week", "month")
+# 합계 배열의 0번 행은 전체, 1번부터 SKILLS 순서
+ALL_SKILLS = 0
+
+# 기술 영역을 지정하지 않은 세션의 콘텐츠 유형 → 기술 영역
+CONTENT_TYPE_SKILLS = {
+    "grammar": ("grammar",),
+    "vocabulary": ("vocabulary",),
+    "writing": ("writing",),
+    "reading": ("reading",),
+    "theological_terms": ("vocabulary",),
+    "sermon_writing": ("writing",),
+    "translation": ("reading", "writing"),
+    "cultural_context": ("reading",),
+}
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+def _bitmask(values: List[str], vocabulary: Tuple[str, ...], kind: str) -> int:
+    mask = 0
+    for value in values:
+        if value not in vocabulary:
+            raise ValueError(f"Unknown {kind}: {value}")
+        mask |= 1 << vocabulary.index(value)
+    return mask
+
+
+def _names(mask: int, vocabulary: Tuple[str, ...]) -> List[str]:
+    return [name for bit, name in enumerate(vocabulary) if mask >> bit & 1]
+
+
+def unix_timestamp(value: Any, field: str = "started_at") -> float:
+    """유한한 유닉스 시각인지 검증 (허용 범위를 벗어나면 ValueError)"""
+    try:
+        timestamp = float(value)
+    except OverflowError:
+        timestamp = math.inf
+    if not math.isfinite(timestamp) or not MIN_TIMESTAMP <= timestamp <= time.time() + MAX_FUTURE_SECONDS:
+        raise ValueError(f"{field} must be a unix timestamp between 2000-01-01 and now")
+    return timestamp
+
+
+def session_record(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """세션 입력 검증 후 열 값으로 변환 (잘못된 값은 ValueError)"""
+    content_types = list(payload.get("content_types") or [])
+    skills = payload.get("skills")
+    if not skills:
+        skills = sorted({skill for t in content_types for skill in CONTENT_TYPE_SKILLS.get(t, ())}, key=SKILLS.index)
+    duration = float(payload["duration_minutes"])
+    if not 0 < duration <= 24 * 60:
+        raise ValueError("duration_minutes must be between 0 and 1440")
+    started_at = int(unix_timestamp(payload.get("started_at") or time.time()))
+    record = {
+        "started_at": started_at,
+        "duration_minutes": duration,
+        "skills": _bitmask(skills, SKILLS, "skill"),
+        "content_types": _bitmask(content_types, CONTENT_TYPES, "content type"),
+    }
+    for field in ("vocabulary_learned", "grammar_concepts"):
+        value = int(payload.get(field) or 0)
+        if not 0 <= value <= np.iinfo(np.int32).max:
+            raise ValueError(f"{field} must be a non-negative integer")
+        record[field] = value
+    for field in ("completion_rate", "accuracy_score", "engagement_level"):
+        value = float(payload.get(field) or 0)
+        if not 0 <= value <= 100:
+            raise ValueError(f"{field} must be between 0 and 100")
+        record[field] = value
+    return record
+
+
+def bucket_keys(started_at: np.ndarray, granularity: str) -> np.ndarray:
+    """시작 시각(초) → 구간 번호 (일: 1970-01-01 기준 일수, 주: 월요일 기준 주 번호, 월: 1970-01 기준 월수)"""
+    days = (np.asarray(started_at, dtype=np.int64) + UTC_OFFSET_SECONDS) // 86400
+    if granularity == "day":
+        return days
+    if granularity == "week":
+        # 1970-01-01은 목요일
+        return (days + 3) // 7
+    return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+
+
+def bucket_start(key: int, granularity: str) -> datetime.date:
+    if granularity == "day":
+        return _EPOCH + datetime.timedelta(days=key)
+    if granularity == "week":
+        return _EPOCH + datetime.timedelta(days=key * 7 - 3)
+    return datetime.date(1970 + key // 12, key % 12 + 1, 1)
+
+
+def current_bucket(granularity: str, now: Optional[float] = None) -> int:
+    return int(bucket_keys(np.asarray([now if now is not None else time.time()]), granularity)[0])
+
+
+class AnalyticsStore:
+    """추가 전용 세션 열 + 증분 합계"""
+
+    def __init__(self, directory: Optional[str] = ANALYTICS_DIR):
+        self.directory = directory
+        self._users: Dict[str, int] = {}
+        self._user_names: List[str] = []
+        self._columns = {name: np.zeros(INITIAL_CAPACITY, dtype=dtype) for name, dtype in SESSION_COLUMNS}
+        self._size = 0
+        self._user_rows: Dict[int, List[int]] = {}
+        self._totals = np.zeros((0, len(ROLLUP_FIELDS)), dtype=np.float64)
+        self._rollups: Dict[str, Dict[Tuple[int, int], np.ndarray]] = {g: {} for g in GRANULARITIES}
+        # 세션이 추가된 사용자 id 목록을 받는 콜백 (예측 캐시 무효화)
+        self._listeners: List[Callable[[List[str]], None]] = []
+        # users.jsonl에서 읽은 바이트 수 (다른 프로세스가 추가한 사용자만 이어서 읽음)
+        self._users_offset = 0
+        if directory and os.path.isdir(directory):
+            with file_lock(self._lock_path()):
+                self.load(directory)
+
+    def _lock_path(self) -> str:
+        return os.path.join(self.directory, "store.lock")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name][:self._size]
+
+    # -- 쓰기 ---------------------------------------------------------------
+
+    def _user_index(self, user_id: str, new_users: List[str]) -> int:
+        index = self._users.get(user_id)
+        if index is None:
+            index = len(self._user_names)
+            self._users[user_id] = index
+            self._user_names.append(user_id)
+            new_users.append(user_id)
+        return index
+
+    def append(self, user_records: List[Tuple[str, Dict[str, Any]]], keys: Optional[List[int]] = None) -> None:
+        """(user_id, session_record()) 묶음을 한 번에 추가 (열 변환이나 디스크 기록이 실패하면 아무것도 추가하지 않고 예외)"""
+        if not user_records:
+            return
+        if not self.directory:
+            self._append(user_records, keys)
+            return
+        with file_lock(self._lock_path()):
+            # 다른 프로세스가 추가한 사용자/행 뒤에 이어 쓰도록 먼저 따라잡음
+            self._catch_up(repair=True)
+            self._append(user_records, keys)
+
+    def _append(self, user_records: List[Tuple[str, Dict[str, Any]]], keys: Optional[List[int]]) -> None:
+        new_users: List[str] = []
+        users = [self._user_index(user_id, new_users) for user_id, _ in user_records]
+        start, stop = self._size, self._size + len(user_records)
+        try:
+            self._reserve(stop)
+            self._columns["user"][start:stop] = users
+            self._columns["ingest_key"][start:stop] = keys if keys is not None else 0
+            for name, _ in SESSION_COLUMNS[1:-1]:
+                self._columns[name][start:stop] = [record[name] for _, record in user_records]
+            if self.directory:
+                self._persist(start, stop, new_users)
+        except Exception:
+            # [start, stop) 구간은 _size를 넘지 않았으므로 다음 추가가 덮어씀 - 새 사용자만 되돌림
+            for user_id in new_users:
+                del self._users[user_id]
+                self._user_names.pop()
+            raise
+        self._size = stop
+        self._accumulate(start, stop)
+        changed = list(dict.fromkeys(user_id for user_id, _ in user_records))
+        for listener in self._listeners:
+            listener(changed)
+
+    def _reserve(self, stop: int) -> None:
+        if stop > len(self._columns["user"]):
+            capacity = max(stop, 2 * len(self._columns["user"]))
+            for name, values in self._columns.items():
+                grown = np.zeros(capacity, dtype=values.dtype)
+                grown[:self._size] = values[:self._size]
+                self._columns[name] = grown
+
+    def subscribe(self, listener: Callable[[List[str]], None]) -> None:
+        self._listeners.append(listener)
+
+    def _persist(self, start: int, stop: int, new_users: List[str]) -> None:
+        """사용자 목록/열 파일에 추가 - 중간에 실패하면 모든 파일을 추가 전 길이로 되돌림"""
+        os.makedirs(self.directory, exist_ok=True)
+        paths = [os.path.join(self.directory, "users.jsonl")]
+        paths.extend(os.path.join(self.directory, f"{name}.bin") for name, _ in SESSION_COLUMNS)
+        sizes = [os.path.getsize(path) if os.path.exists(path) else 0 for path in paths]
+        try:
+            if new_users:
+                with open(paths[0], "a", encoding="utf-8") as f:
+                    f.writelines(json.dumps(user_id, ensure_ascii=False) + "\n" for user_id in new_users)
+                self._users_offset = os.path.getsize(paths[0])
+            for path, (name, _) in zip(paths[1:], SESSION_COLUMNS):
+                with open(path, "ab") as f:
+                    f.write(self._columns[name][start:stop].tobytes())
+        except OSError:
+            self._users_offset = sizes[0]
+            for path, size in zip(paths, sizes):
+                try:
+                    os.truncate(path, size)
+                except OSError:
+                    pass
+            raise
+
+    def _accumulate(self, start: int, stop: int) -> None:
+        """[start, stop) 세션을 사용자 합계와 일/주/월 합계에 더함"""
+        columns = {name: values[start:stop] for name, values in self._columns.items()}
+        users = columns["user"].astype(np.int64)
+        values = np.zeros((stop - start, len(ROLLUP_FIELDS)), dtype=np.float64)
+        values[:, _FIELD["minutes"]] = columns["duration_minutes"]
+        values[:, _FIELD["sessions"]] = 1
+        values[:, _FIELD["accuracy"]] = columns["accuracy_score"]
+        values[:, _FIELD["completion"]] = columns["completion_rate"]
+        values[:, _FIELD["engagement"]] = columns["engagement_level"]
+        values[:, _FIELD["vocabulary"]] = columns["vocabulary_learned"]
+        values[:, _FIELD["grammar"]] = columns["grammar_concepts"]
+
+        if len(self._totals) < len(self._user_names):
+            grown = np.zeros((len(self._user_names), len(ROLLUP_FIELDS)), dtype=np.float64)
+            grown[:len(self._totals)] = self._totals
+            self._totals = grown
+        np.add.at(self._totals, users, values)
+        for offset, user in enumerate(users.tolist()):
+            self._user_rows.setdefault(user, []).append(start + offset)
+
+        # 합계 행 번호 (전체 + 세션의 각 기술 영역) 와 값 - 기술 영역별 학습 시간은 영역 수로 나눔
+        skill_bits = (columns["skills"][:, None] >> np.arange(len(SKILLS), dtype=np.uint8)) & 1
+        skill_counts = np.maximum(skill_bits.sum(axis=1), 1)
+        session_index, skill = np.nonzero(skill_bits)
+        per_skill = values[session_index].copy()
+        per_skill[:, _FIELD["minutes"]] /= skill_counts[session_index]
+        sessions = np.concatenate([np.arange(stop - start), session_index])
+        slots = np.concatenate([np.full(stop - start, ALL_SKILLS), skill + 1])
+        slot_values = np.vstack([values, per_skill])
+
+        for granularity in GRANULARITIES:
+            # (사용자, 구간) → 정수 키 하나 (구간 번호는 항상 0 이상 2^32 미만)
+            keys = bucket_keys(columns["started_at"], granularity)[sessions]
+            unique, inverse = np.unique((users[sessions] << 32) | keys, return_inverse=True)
+            staged = np.zeros((len(unique), len(SKILLS) + 1, len(ROLLUP_FIELDS)), dtype=np.float64)
+            np.add.at(staged, (inverse.reshape(-1), slots), slot_values)
+            rollups = self._rollups[granularity]
+            groups = zip((unique >> 32).tolist(), (unique & 0xFFFFFFFF).tolist())
+            for g, group in enumerate(groups):
+                table = rollups.get(group)
+                if table is None:
+                    rollups[group] = staged[g]
+                else:
+                    table += staged[g]
+
+    # -- 복원 ---------------------------------------------------------------
+
+    def load(self, directory: str) -> None:
+        """열 파일 복원 - 마지막 쓰기가 중간에 끊겼다면 모든 열(메모리와 파일)을 가장 짧은 열 길이에 맞춤"""
+        users_path = os.path.join(directory, "users.jsonl")
+        if not os.path.exists(users_path):
+            return
+        with open(users_path, "rb") as f:
+            data = f.read()
+        self._user_names = [json.loads(line) for line in data.splitlines() if line.strip()]
+        self._users_offset = len(data)
+        self._users = {user_id: index for index, user_id in enumerate(self._user_names)}
+
+        columns = {}
+        for name, dtype in SESSION_COLUMNS:
+            path = os.path.join(directory, f"{name}.bin")
+            columns[name] = np.fromfile(path, dtype=dtype) if os.path.exists(path) else None
+        size = min((len(values) for values in columns.values() if values is not None), default=0)
+        capacity = max(INITIAL_CAPACITY, size)
+        for name, dtype in SESSION_COLUMNS:
+            if columns[name] is None:
+                # 나중에 추가된 열 - 기존 행은 0으로 채워 파일 생성
+                columns[name] = np.zeros(size, dtype=dtype)
+                columns[name].tofile(os.path.join(directory, f"{name}.bin"))
+            if len(columns[name]) > size:
+                # 남은 꼬리를 잘라내야 다음 추가가 모든 열에서 같은 행 번호에 이어짐
+                os.truncate(os.path.join(directory, f"{name}.bin"), size * np.dtype(dtype).itemsize)
+            self._columns[name] = np.zeros(capacity, dtype=dtype)
+            self._columns[name][:size] = columns[name][:size]
+        self._size = size
+        self._user_rows = {}
+        self._totals = np.zeros((0, len(ROLLUP_FIELDS)), dtype=np.float64)
+        self._rollups = {g: {} for g in GRANULARITIES}
+        if size:
+            self._accumulate(0, size)
+
+    def refresh(self) -> None:
+        """다른 프로세스가 추가한 세션 따라잡기 - 파일 행 수가 메모리와 같으면 stat 한 번으로 끝남"""
+        if not self.directory:
+            return
+        try:
+            rows = os.path.getsize(os.path.join(self.directory, "ingest_key.bin")) // np.dtype(np.int64).itemsize
+        except OSError:
+            return
+        if rows > self._size:
+            with file_lock(self._lock_path(), shared=True):
+                self._catch_up()
+
+    def _catch_up(self, repair: bool = False) -> None:
+        """(잠금 안에서) 파일에만 있는 사용자와 세션 행을 메모리에 추가하고 합계에 더함
+
+        repair: 마지막 쓰기가 중간에 끊겨 열 길이가 다르면 가장 짧은 열에 맞춰 파일을 자름 (배타적 잠금에서만)
+        """
+        users_path = os.path.join(self.directory, "users.jsonl")
+        if not os.path.exists(users_path):
+            return
+        with open(users_path, "rb") as f:
+            f.seek(self._users_offset)
+            data = f.read()
+        # 마지막 줄이 끊겼다면 다음에 다시 읽음
+        data = data[:data.rfind(b"\n") + 1]
+        self._users_offset += len(data)
+        for line in data.splitlines():
+            if line.strip():
+                user_id = json.loads(line)
+                self._users[user_id] = len(self._user_names)
+                self._user_names.append(user_id)
+
+        paths = {name: os.path.join(self.directory, f"{name}.bin") for name, _ in SESSION_COLUMNS}
+        lengths = {
+            name: os.path.getsize(paths[name]) // np.dtype(dtype).itemsize if os.path.exists(paths[name]) else 0
+            for name, dtype in SESSION_COLUMNS
+        }
+        start, stop = self._size, min(lengths.values())
+        if repair:
+            for name, dtype in SESSION_COLUMNS:
+                if lengths[name] > stop:
+                    os.truncate(paths[name], stop * np.dtype(dtype).itemsize)
+        if stop <= start:
+            return
+        self._reserve(stop)
+        for name, dtype in SESSION_COLUMNS:
+            self._columns[name][start:stop] = np.fromfile(
+                paths[name], dtype=dtype, count=stop - start, offset=start * np.dtype(dtype).itemsize,
+            )
+        self._size = stop
+        self._accumulate(start, stop)
+        changed = list(dict.fromkeys(self._user_names[user] for user in self._columns["user"][start:stop].tolist()))
+        for listener in self._listeners:
+            listener(changed)
+
+    # -- 읽기 ---------------------------------------------------------------
+
+    def ingest_keys(self, floor: int) -> set:
+        """floor 이상인 수집 멱등 키 (재반영 중복 확인용)"""
+        self.refresh()
+        keys = self.column("ingest_key")
+        return set(keys[keys >= max(floor, 1)].tolist())
+
+    def user_index(self, user_id: Optional[str]) -> Optional[int]:
+        self.refresh()
+        return self._users.get(user_id) if user_id else None
+
+    def user_ids(self) -> List[str]:
+        self.refresh()
+        return list(self._user_names)
+
+    def history(self, user_ids: List[str], granularity: str, count: int, end: Optional[int] = None) -> np.ndarray:
+        """여러 사용자의 최근 count개 구간 합계 (사용자 × (전체 + 기술 영역) × 구간 × 지표, 오래된 순)"""
+        self.refresh()
+        end = current_bucket(granularity) if end is None else end
+        history = np.zeros((len(user_ids), len(SKILLS) + 1, count, len(ROLLUP_FIELDS)), dtype=np.float64)
+        rollups = self._rollups[granularity]
+        for row, user_id in enumerate(user_ids):
+            user = self._users.get(user_id)
+            if user is None:
+                continue
+            for column, key in enumerate(range(end - count + 1, end + 1)):
+                table = rollups.get((user, key))
+                if table is not None:
+                    history[row, :, column] = table
+        return history
+
+    def rollup(self, user_id: Optional[str], granularity: str, count: int,
+               end: Optional[int] = None) -> List[Tuple[int, Optional[np.ndarray]]]:
+        """end 구간(기본값: 현재)까지 최근 count개 구간의 합계 (오래된 순, 기록 없는 구간은 None)"""
+        user = self.user_index(user_id)
+        end = current_bucket(granularity) if end is None else end
+        rollups = self._rollups[granularity]
+        return [(key, rollups.get((user, key)) if user is not None else None) for key in range(end - count + 1, end + 1)]
+
+    def summary(self, user_id: Optional[str]) -> Dict[str, float]:
+        """전체 기간 합계/평균"""
+        user = self.user_index(user_id)
+        if user is None or user >= len(self._totals):
+            return averages(None)
+        return averages(self._totals[user:user + 1])
+
+    def streak_days(self, user_id: Optional[str], now: Optional[float] = None) -> int:
+        """오늘(오늘 기록이 없으면 어제)부터 거꾸로 연속 학습 일수"""
+        user = self.user_index(user_id)
+        if user is None:
+            return 0
+        days = self._rollups["day"]
+        day = current_bucket("day", now)
+        if (user, day) not in days:
+            day -= 1
+        streak = 0
+        while (user, day) in days:
+            streak += 1
+            day -= 1
+        return streak
+
+    def recent_sessions(self, user_id: Optional[str], count: int) -> List[Dict[str, Any]]:
+        """최근 기록된 세션 (최신 순)"""
+        user = self.user_index(user_id)
+        rows = self._user_rows.get(user, []) if user is not None else []
+        sessions = []
+        for row in reversed(rows[-count:]):
+            day = int(bucket_keys(self._columns["started_at"][row:row + 1], "day")[0])
+            sessions.append({
+                "date": bucket_start(day, "day").isoformat(),
+                "duration_minutes": round(float(self._columns["duration_minutes"][row]), 1),
+                "content_types": _names(int(self._columns["content_types"][row]), CONTENT_TYPES),
+                "completion_rate": round(float(self._columns["completion_rate"][row])),
+                "accuracy_score": round(float(self._columns["accuracy_score"][row])),
+                "engagement_level": round(float(self._columns["engagement_level"][row])),
+            })
+        return sessions
+
+    def weekly_stats(self, user_id: Optional[str], weeks: int = 4) -> List[Dict[str, Any]]:
+        """최근 주별 통계 (대시보드 weekly_stats 형식)"""
+        stats = []
+        for key, table in self.rollup(user_id, "week", weeks):
+            summary = averages(table)
+            stats.append({
+                "week": week_label(key),
+                "study_hours": round(summary["minutes"] / 60, 1),
+                "sessions_completed": int(summary["sessions"]),
+                "average_score": round(summary["accuracy"]),
+                "vocabulary_learned": int(summary["vocabulary"]),
+                "grammar_concepts": int(summary["grammar"]),
+            })
+        return stats
+
+    def monthly_trends(self, user_id: Optional[str], months: int = 4) -> List[Dict[str, Any]]:
+        """기술 영역별 최근 월별 평균 점수/완료율 (기록이 있는 영역만)"""
+        rollups = self.rollup(user_id, "month", months)
+        trends = []
+        for slot, skill in enumerate(SKILLS, start=1):
+            if all(table is None or table[slot, _FIELD["sessions"]] == 0 for _, table in rollups):
+                continue
+            monthly = []
+            for key, table in rollups:
+                summary = averages(table, slot)
+                monthly.append({"month": month_label(key), "score": round(summary["accuracy"]), "progress": round(summary["completion"])})
+            trends.append({"skill": skill, "monthly_data": monthly})
+        return trends
+
+    def skill_improvements(self, user_id: Optional[str]) -> Dict[str, int]:
+        """기술 영역별 이번 주 평균 점수 - 지난주 평균 점수 (두 주 모두 기록이 있는 영역만)"""
+        (_, previous), (_, current) = self.rollup(user_id, "week", 2)
+        improvements = {}
+        for slot, skill in enumerate(SKILLS, start=1):
+            before, after = averages(previous, slot), averages(current, slot)
+            if before["sessions"] and after["sessions"]:
+                improvements[skill] = round(after["accuracy"] - before["accuracy"])
+        return improvements
+
+
+def averages(table: Optional[np.ndarray], slot: int = ALL_SKILLS) -> Dict[str, float]:
+    """합계 행 → 학습 시간/세션 수/평균 점수"""
+    if table is None or table[slot, _FIELD["sessions"]] == 0:
+        return {name: 0.0 for name in ROLLUP_FIELDS}
+    row = table[slot]
+    sessions = row[_FIELD["sessions"]]
+    return {
+        "minutes": float(row[_FIELD["minutes"]]),
+        "sessions": float(sessions),
+        "accuracy": float(row[_FIELD["accuracy"]] / sessions),
+        "completion": float(row[_FIELD["completion"]] / sessions),
+        "engagement": float(row[_FIELD["engagement"]] / sessions),
+        "vocabulary": float(row[_FIELD["vocabulary"]]),
+        "grammar": float(row[_FIELD["grammar"]]),
+    }
+
+
+def week_label(key: int) -> str:
+    monday = bucket_start(key, "week")
+    return f"{monday.month}월 {(monday.day - 1) // 7 + 1}주"
+
+
+def month_label(key: int) -> str:
+    return f"{bucket_start(key, 'month').month}월"
+
+
+@lru_cache(maxsize=1)
+def get_analytics_store() -> AnalyticsStore:
+    """프로세스 전역 분석 저장소 (열 파일이 있으면 복원)"""
+    return AnalyticsStore()
@@ -0,0 +1,321 @@
+"""
+성경 구절 저장소 및 구절 참조 파서
+
+"요 3:16", "요한복음 3장 16절", "János 3:16", "1János 4:8", "Jn 3,16", "Mt 5:1-12",
+"Mt 5:1-6:4", "시 23", "시편 23편" 같은 한국어/헝가리어/약어 참조를 (책, 장, 절) 정수 키로 변환한다.
+- 키 = 책 번호 << 16 | 장 << 8 | 절 (개신교 66권 순서, 장 ≤ 150, 절 ≤ 176이므로 int32에 들어감)
+- 구절은 키 순서로 정렬해 두고 NumPy searchsorted로 단일 구절/범위 조회 (O(log n))
+- 여러 참조(신학 용어의 biblical_references, 설교 본문 속 참조)를 한 번에 해석
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import data_path, load_json
+from src.lib.text_folding import fold
+
+BIBLE_VERSES_FILE = "bible-verses-sample.json"
+
+# (한국어 이름, 한국어 약어, 헝가리어 이름, 헝가리어 약어/별칭...) - 책 번호는 1부터
+BOOKS: Tuple[Tuple[str, ...], ...] = (
+    ("창세기", "창", "Mózes első könyve", "1Móz", "Ter", "Teremtés könyve", "Genezis"),
+    ("출애굽기", "출", "Mózes második könyve", "2Móz", "Kiv", "Kivonulás könyve", "Exodus"),
+    ("레위기", "레", "Mózes harmadik könyve", "3Móz", "Lev", "Leviták könyve", "Leviticus"),
+    ("민수기", "민", "Mózes negyedik könyve", "4Móz", "Szám", "Számok könyve", "Numeri"),
+    ("신명기", "신", "Mózes ötödik könyve", "5Móz", "MTörv", "Második Törvénykönyv", "Deuteronómium"),
+    ("여호수아", "수", "Józsué könyve", "Józs", "Józsué"),
+    ("사사기", "삿", "Bírák könyve", "Bír", "Bírák"),
+    ("룻기", "룻", "Ruth könyve", "Ruth", "Rut"),
+    ("사무엘상", "삼상", "Sámuel első könyve", "1Sám"),
+    ("사무엘하", "삼하", "Sámuel második könyve", "2Sám"),
+    ("열왕기상", "왕상", "Királyok első könyve", "1Kir"),
+    ("열왕기하", "왕하", "Királyok második könyve", "2Kir"),
+    ("역대상", "대상", "Krónikák első könyve", "1Krón"),
+    ("역대하", "대하", "Krónikák második könyve", "2Krón"),
+    ("에스라", "스", "Ezsdrás könyve", "Ezsd", "Ezsdrás"),
+    ("느헤미야", "느", "Nehémiás könyve", "Neh", "Nehémiás"),
+    ("에스더", "에", "Eszter könyve", "Eszt", "Eszter"),
+    ("욥기", "욥", "Jób könyve", "Jób"),
+    ("시편", "시", "Zsoltárok könyve", "Zsolt", "Zsoltárok"),
+    ("잠언", "잠", "Példabeszédek könyve", "Péld", "Példabeszédek"),
+    ("전도서", "전", "Prédikátor könyve", "Préd", "Prédikátor"),
+    ("아가", "아", "Énekek éneke", "Énekek", "Én"),
+    ("이사야", "사", "Ézsaiás próféta könyve", "Ézs", "Ézsaiás", "Iz", "Izajás"),
+    ("예레미야", "렘", "Jeremiás próféta könyve", "Jer", "Jeremiás"),
+    ("예레미야애가", "애", "Jeremiás siralmai", "JSir", "Siralm"),
+    ("에스겔", "겔", "Ezékiel próféta könyve", "Ez", "Ezékiel"),
+    ("다니엘", "단", "Dániel próféta könyve", "Dán", "Dániel"),
+    ("호세아", "호", "Hóseás próféta könyve", "Hós", "Hóseás"),
+    ("요엘", "욜", "Jóel próféta könyve", "Jóel"),
+    ("아모스", "암", "Ámósz próféta könyve", "Ám", "Ámósz"),
+    ("오바댜", "옵", "Abdiás próféta könyve", "Abd", "Abdiás"),
+    ("요나", "욘", "Jónás próféta könyve", "Jón", "Jónás"),
+    ("미가", "미", "Mikeás próféta könyve", "Mik", "Mikeás"),
+    ("나훔", "나", "Náhum próféta könyve", "Náh", "Náhum"),
+    ("하박국", "합", "Habakuk próféta könyve", "Hab", "Habakuk"),
+    ("스바냐", "습", "Sofóniás próféta könyve", "Sof", "Sofóniás", "Szof"),
+    ("학개", "학", "Haggeus próféta könyve", "Hag", "Haggeus", "Agg"),
+    ("스가랴", "슥", "Zakariás próféta könyve", "Zak", "Zakariás"),
+    ("말라기", "말", "Malakiás próféta könyve", "Mal", "Malakiás"),
+    ("마태복음", "마", "Máté evangéliuma", "Mt", "Máté"),
+    ("마가복음", "막", "Márk evangéliuma", "Mk", "Márk"),
+    ("누가복음", "눅", "Lukács evangéliuma", "Lk", "Lukács"),
+    ("요한복음", "요", "János evangéliuma", "Jn", "Ján", "János"),
+    ("사도행전", "행", "Apostolok cselekedetei", "ApCsel"),
+    ("로마서", "롬", "Rómaiakhoz írt levél", "Róm"),
+    ("고린도전서", "고전", "Korinthusiakhoz írt első levél", "1Kor"),
+    ("고린도후서", "고후", "Korinthusiakhoz írt második levél", "2Kor"),
+    ("갈라디아서", "갈", "Galatákhoz írt levél", "Gal"),
+    ("에베소서", "엡", "Efezusiakhoz írt levél", "Ef"),
+    ("빌립보서", "빌", "Filippiekhez írt levél", "Fil"),
+    ("골로새서", "골", "Kolosséiakhoz írt levél", "Kol"),
+    ("데살로니가전서", "살전", "Thesszalonikaiakhoz írt első levél", "1Thessz", "1Tessz", "1Tesz"),
+    ("데살로니가후서", "살후", "Thesszalonikaiakhoz írt második levél", "2Thessz", "2Tessz", "2Tesz"),
+    ("디모데전서", "딤전", "Timóteushoz írt első levél", "1Tim"),
+    ("디모데후서", "딤후", "Timóteushoz írt második levél", "2Tim"),
+    ("디도서", "딛", "Tituszhoz írt levél", "Tit"),
+    ("빌레몬서", "몬", "Filemonhoz írt levél", "Filem"),
+    ("히브리서", "히", "Zsidókhoz írt levél", "Zsid"),
+    ("야고보서", "약", "Jakab levele", "Jak"),
+    ("베드로전서", "벧전", "Péter első levele", "1Pt", "1Pét", "1Péter"),
+    ("베드로후서", "벧후", "Péter második levele", "2Pt", "2Pét", "2Péter"),
+    ("요한일서", "요일", "János első levele", "1Jn", "1Ján", "1János"),
+    ("요한이서", "요이", "János második levele", "2Jn", "2Ján", "2János"),
+    ("요한삼서", "요삼", "János harmadik levele", "3Jn", "3Ján", "3János"),
+    ("유다서", "유", "Júdás levele", "Júd", "Júdás"),
+    ("요한계시록", "계", "Jelenések könyve", "Jel", "Jelenések"),
+)
+
+MAX_CHAPTER = 150
+MAX_VERSE = 255
+
+
+def pack_key(book: int, chapter: int, verse: int) -> int:
+    return (book << 16) | (chapter << 8) | verse
+
+
+def unpack_key(key: int) -> Tuple[int, int, int]:
+    return key >> 16, (key >> 8) & 0xFF, key & 0xFF
+
+
+def _alias_key(name: str) -> str:
+    """비교용 책 이름 (악센트·대소문자·공백·마침표 무시)"""
+    return re.sub(r"[\s.]+", "", fold(name))
+
+
+# 별칭 → 책 번호
+BOOK_ALIASES: Dict[str, int] = {}
+for _number, _names in enumerate(BOOKS, start=1):
+    for _name in _names:
+        BOOK_ALIASES.setdefault(_alias_key(_name), _number)
+
+
+# 일반 단어와 겹치는 별칭 - 본문 검색에서는 "장:절"(또는 "3장 5절") 표기일 때만 참조로 인정
+# ("Ez 3,5 millió forint"의 ez = 이것, "약 3,150명"의 약 = 대략)
+# 헝가리어: ez(이것), én(나), ám(그러나), szám(숫자), bír(견디다) - 뒤에 소수("3,5")가 자주 오는 단어
+# 한국어: 한 글자 약어 전부 (나, 약, 신, 말, 시 등 - 한국어 본문의 쉼표는 천 단위 구분)
+AMBIGUOUS_ALIASES = frozenset(
+    [_alias_key(name) for name in ("Ez", "Én", "Ám", "Szám", "Bír")]
+    + [_alias_key(names[1]) for names in BOOKS if len(names[1]) == 1]
+)
+
+
+def _alias_pattern(alias: str) -> str:
+    """별칭 키 → 정규식 ("1janos" → "1\\.?\\s*janos", 글자 사이 공백 허용은 원래 공백 위치만)"""
+    match = re.match(r"^([1-3])(.+)$", alias)
+    if match:
+        return re.escape(match.group(1)) + r"\.?\s*" + re.escape(match.group(2))
+    return re.escape(alias)
+
+
+def _book_pattern() -> str:
+    # 여러 단어로 된 이름("mate evangeliuma")은 접힌 원문 그대로 공백을 \s+로 허용
+    alternatives = {_alias_pattern(_alias_key(name)) for names in BOOKS for name in names}
+    alternatives.update(
+        r"\s+".join(re.escape(part) for part in fold(name).split())
+        for names in BOOKS for name in names if " " in name
+    )
+    return "|".join(sorted(alternatives, key=len, reverse=True))
+
+
+# 장:절 / 장,절(헝가리어 표기) / 3장 16절 (시편은 23편), 범위는 "-", "–", "~"
+_CHAPTER_VERSE_SEPARATOR = r"\s*(?:[:,]|[장편])\s*"
+_REFERENCE_RE = re.compile(
+    rf"(?<!\w)(?P<book>{_book_pattern()})\.?\s*(?P<chapter>\d{{1,3}})"
+    rf"(?:{_CHAPTER_VERSE_SEPARATOR}(?P<verse>\d{{1,3}})(?:\s*절)?"
+    rf"(?:\s*[-–~]\s*(?:(?P<end_chapter>\d{{1,3}}){_CHAPTER_VERSE_SEPARATOR})?(?P<end_verse>\d{{1,3}})(?:\s*절)?)?"
+    rf"|\s*[장편])?(?!\d)"
+)
+
+
+class VerseReference:
+    """해석된 참조 - [start, end] 키 범위 (장 전체는 절 0~255)"""
+    __slots__ = ("text", "book", "chapter", "verse", "end_chapter", "end_verse")
+
+    def __init__(self, text: str, book: int, chapter: int, verse: Optional[int],
+                 end_chapter: int, end_verse: Optional[int]):
+        self.text = text
+        self.book = book
+        self.chapter = chapter
+        self.verse = verse
+        self.end_chapter = end_chapter
+        self.end_verse = end_verse
+
+    @property
+    def start(self) -> int:
+        return pack_key(self.book, self.chapter, self.verse or 0)
+
+    @property
+    def end(self) -> int:
+        return pack_key(self.book, self.end_chapter, self.end_verse if self.end_verse is not None else MAX_VERSE)
+
+    @property
+    def label(self) -> str:
+        """표준 표기 ("요한복음 3:16", "마태복음 5:1-12", "시편 23")"""
+        label = f"{BOOKS[self.book - 1][0]} {self.chapter}"
+        if self.verse is None:
+            return label if self.end_chapter == self.chapter else f"{label}-{self.end_chapter}"
+        label += f":{self.verse}"
+        if self.end_chapter != self.chapter:
+            return f"{label}-{self.end_chapter}:{self.end_verse}"
+        if self.end_verse != self.verse:
+            return f"{label}-{self.end_verse}"
+        return label
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "reference": self.text,
+            "normalized": self.label,
+            "book": BOOKS[self.book - 1][0],
+            "book_hungarian": BOOKS[self.book - 1][2],
+            "chapter": self.chapter,
+            "verse": self.verse,
+            "end_chapter": self.end_chapter,
+            "end_verse": self.end_verse,
+        }
+
+
+def _reference_from_match(match: "re.Match[str]", text: str) -> Optional[VerseReference]:
+    book = BOOK_ALIASES.get(_alias_key(match.group("book")))
+    if book is None:
+        return None
+    chapter = int(match.group("chapter"))
+    verse = int(match.group("verse")) if match.group("verse") else None
+    end_chapter = int(match.group("end_chapter")) if match.group("end_chapter") else chapter
+    end_verse = int(match.group("end_verse")) if match.group("end_verse") else verse
+    if not (1 <= chapter <= end_chapter <= MAX_CHAPTER):
+        return None
+    if verse is not None and not (1 <= verse <= MAX_VERSE and 1 <= end_verse <= MAX_VERSE):
+        return None
+    reference = VerseReference(text, book, chapter, verse, end_chapter, end_verse)
+    return reference if reference.start <= reference.end else None
+
+
+@lru_cache(maxsize=4096)
+def parse_reference(text: str) -> Optional[VerseReference]:
+    """참조 문자열 하나를 해석 (해석할 수 없으면 None) - 용어/설교마다 같은 참조가 반복되므로 캐시"""
+    folded = fold(text.strip())
+    match = _REFERENCE_RE.fullmatch(folded)
+    return _reference_from_match(match, text.strip()) if match else None
+
+
+def find_references(text: str) -> List[VerseReference]:
+    """본문(설교 원고 등) 속의 장:절 참조를 모두 찾음
+
+    장만 적힌 경우("Ez 3")와 일반 단어와 겹치는 별칭의 "장,절" 표기("Ez 3,5")는 숫자 표현과 구별할 수 없어 제외
+    (책 이름 전체는 "Ezékiel 3,5"처럼 쉼표 표기도 인정)
+    """
+    folded = fold(text)
+    # fold()는 보통 길이를 유지하므로 원문 위치를 그대로 사용, 아니면 접힌 문자열을 표기로 사용
+    source = text if len(folded) == len(text) else folded
+    references = []
+    for match in _REFERENCE_RE.finditer(folded):
+        if match.group("verse") is None:
+            continue
+        if _alias_key(match.group("book")) in AMBIGUOUS_ALIASES and "," in folded[match.end("chapter"):match.start("verse")]:
+            continue
+        reference = _reference_from_match(match, source[match.start():match.end()])
+        if reference is not None:
+            references.append(reference)
+    return references
+
+
+class BibleVerseStore:
+    """키 순서로 정렬된 구절 목록과 키 배열 (행 번호 = 구절 번호)"""
+
+    def __init__(self, verses: List[Dict[str, Any]]):
+        keyed = []
+        for verse in verses:
+            book = BOOK_ALIASES.get(_alias_key(verse["book"])) or BOOK_ALIASES.get(_alias_key(verse["bookHungarian"]))
+            if book is None:
+                raise ValueError(f"Unknown Bible book: {verse['book']}")
+            keyed.append((pack_key(book, verse["chapter"], verse["verse"]), verse))
+        keyed.sort(key=lambda item: item[0])
+
+        self.keys = np.array([key for key, _ in keyed], dtype=np.int32)
+        self.verses: List[Dict[str, Any]] = []
+        for key, verse in keyed:
+            book, chapter, number = unpack_key(key)
+            self.verses.append({
+                "id": f"{book}-{chapter}-{number}",
+                "key": key,
+                "reference": f"{BOOKS[book - 1][0]} {chapter}:{number}",
+                **verse,
+            })
+
+    def __len__(self) -> int:
+        return len(self.verses)
+
+    def get(self, book: int, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """단일 구절"""
+        key = pack_key(book, chapter, verse)
+        row = int(np.searchsorted(self.keys, key))
+        return self.verses[row] if row < len(self.keys) and self.keys[row] == key else None
+
+    def rows(self, reference: VerseReference) -> range:
+        """참조 범위에 들어가는 행 번호"""
+        start, end = np.searchsorted(self.keys, [reference.start, reference.end + 1])
+        return range(int(start), int(end))
+
+    def lookup(self, reference: VerseReference) -> List[Dict[str, Any]]:
+        return [self.verses[row] for row in self.rows(reference)]
+
+    def resolve(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """참조 문자열 목록을 한 번에 해석/조회 (시작·끝 키를 모아 searchsorted 한 번씩)"""
+        references = [parse_reference(text) for text in texts]
+        parsed = [reference for reference in references if reference is not None]
+        return self._describe(texts, references, parsed)
+
+    def resolve_text(self, text: str) -> List[Dict[str, Any]]:
+        """본문 속 참조를 모두 찾아 해석/조회"""
+        references = find_references(text)
+        return self._describe([reference.text for reference in references], references, references)
+
+    def _describe(self, texts: List[str], references: List[Optional[VerseReference]],
+                  parsed: List[VerseReference]) -> List[Dict[str, Any]]:
+        if parsed:
+            bounds = np.array([(reference.start, reference.end + 1) for reference in parsed], dtype=np.int64)
+            starts = np.searchsorted(self.keys, bounds[:, 0]).tolist()
+            ends = np.searchsorted(self.keys, bounds[:, 1]).tolist()
+        results, position = [], 0
+        for text, reference in zip(texts, references):
+            if reference is None:
+                results.append({"reference": text, "parsed": False, "verses": []})
+                continue
+            verses = self.verses[starts[position]:ends[position]]
+            position += 1
+            results.append({**reference.to_dict(), "parsed": True, "verses": verses})
+        return results
+
+
+def load_bible_verse_store() -> BibleVerseStore:
+    return BibleVerseStore(load_json(data_path(BIBLE_VERSES_FILE)))
+
+
+@lru_cache(maxsize=1)
+def get_bible_verse_store() -> BibleVerseStore:
+    """프로세스 전역 구절 저장소 (최초 호출 시 한 번만 생성)"""
+    return load_bible_verse_store()
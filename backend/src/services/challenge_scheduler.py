@@ -0,0 +1,232 @@
+"""
+도전과제 스케줄러
+
+일일/주간 도전과제의 진행 기간(윈도우)을 마감 시각 기준 힙으로 관리한다.
+- 윈도우는 조회 시점에 지연(lazy) 방식으로 마감/개설 (전체 사용자 cron 스윕 없음)
+- 사용자별 목표 진행도는 윈도우마다 작은 카운터 배열로 보관
+- 참여자 인덱스는 윈도우별 집합이므로 참여 처리는 O(1)
+"""
+
+import heapq
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Set, Tuple
+
+# 윈도우 경계는 한국 시간(UTC+9) 자정 기준
+WINDOW_TZ_OFFSET_SECONDS = 9 * 3600
+
+DAY_SECONDS = 24 * 3600
+WEEK_SECONDS = 7 * DAY_SECONDS
+
+# 1970-01-01은 목요일이므로 주간 윈도우를 월요일 시작으로 맞추기 위한 보정값
+_WEEK_ALIGN_SECONDS = 3 * DAY_SECONDS
+
+PERIOD_SECONDS = {
+    "daily": DAY_SECONDS,
+    "weekly": WEEK_SECONDS,
+}
+
+CHALLENGE_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "id": "daily_vocabulary_challenge",
+        "title": "오늘의 어휘 마스터",
+        "description": "하루에 10개의 새로운 단어를 학습하세요",
+        "type": "daily",
+        "difficulty": "easy",
+        "objectives": [
+            {"id": "learn_words", "description": "새 단어 10개 학습", "target_value": 10}
+        ],
+        "rewards": {"points": 100, "badges": ["daily_achiever"]},
+        "category": "vocabulary",
+        "icon": "📚",
+        "color": "#3b82f6"
+    },
+    {
+        "id": "weekly_theological",
+        "title": "신학 어휘 집중 주간",
+        "description": "일주일 동안 신학 관련 콘텐츠에 집중하세요",
+        "type": "weekly",
+        "difficulty": "medium",
+        "objectives": [
+            {"id": "theological_lessons", "description": "신학 레슨 5개 완료", "target_value": 5},
+            {"id": "theological_vocabulary", "description": "신학 어휘 30개 학습", "target_value": 30}
+        ],
+        "rewards": {"points": 500, "badges": ["theological_focus_master"]},
+        "category": "theology",
+        "icon": "⛪",
+        "color": "#8b5cf6"
+    },
+]
+
+# 경쟁 이벤트 (주간 단위 참여자 집계만 수행)
+COMPETITION_DEFINITIONS: List[Dict[str, Any]] = [
+    {"id": "weekly_competition", "title": "주간 학습 경쟁", "type": "weekly"},
+]
+
+
+def window_bounds(period_type: str, now: float) -> Tuple[float, float]:
+    """현재 시각이 속한 윈도우의 (시작, 마감) 시각 계산"""
+    period = PERIOD_SECONDS[period_type]
+    align = WINDOW_TZ_OFFSET_SECONDS + (_WEEK_ALIGN_SECONDS if period_type == "weekly" else 0)
+    opens_at = ((now + align) // period) * period - align
+    return opens_at, opens_at + period
+
+
+class ChallengeWindow:
+    """도전과제 하나의 현재 진행 기간과 참여자/진행도 상태"""
+
+    __slots__ = ("challenge_id", "opens_at", "closes_at", "participants", "counters")
+
+    def __init__(self, challenge_id: str, opens_at: float, closes_at: float):
+        self.challenge_id = challenge_id
+        self.opens_at = opens_at
+        self.closes_at = closes_at
+        self.participants: Set[str] = set()
+        # user_id → 목표별 진행도 카운터 (목표 순서와 동일)
+        self.counters: Dict[str, array] = {}
+
+
+class ChallengeScheduler:
+    """마감 시각 힙 기반 도전과제/경쟁 이벤트 스케줄러"""
+
+    def __init__(
+        self,
+        challenges: List[Dict[str, Any]] = CHALLENGE_DEFINITIONS,
+        competitions: List[Dict[str, Any]] = COMPETITION_DEFINITIONS,
+    ):
+        self._definitions: Dict[str, Dict[str, Any]] = {}
+        self._windows: Dict[str, ChallengeWindow] = {}
+        self._heap: List[Tuple[float, str]] = []
+        # objective_id → [(challenge_id, 카운터 인덱스)]
+        self._objective_index: Dict[str, List[Tuple[str, int]]] = {}
+        # 참여자 수나 윈도우가 바뀔 때마다 증가 (응답 캐시 무효화용)
+        self.version = 0
+
+        for definition in list(challenges) + list(competitions):
+            self._definitions[definition["id"]] = definition
+        for definition in challenges:
+            for position, objective in enumerate(definition["objectives"]):
+                self._objective_index.setdefault(objective["id"], []).append(
+                    (definition["id"], position)
+                )
+
+        self._challenge_ids = [d["id"] for d in challenges]
+        self._competition_ids = [d["id"] for d in competitions]
+
+    def has_challenge(self, challenge_id: str) -> bool:
+        return challenge_id in self._challenge_ids
+
+    def has_competition(self, competition_id: str) -> bool:
+        return competition_id in self._competition_ids
+
+    def _advance(self, now: float) -> None:
+        """마감된 윈도우를 닫고 다음 윈도우를 연다 (조회 시점에만 실행)"""
+        while self._heap and self._heap[0][0] <= now:
+            _, challenge_id = heapq.heappop(self._heap)
+            # 지난 윈도우의 참여자/카운터는 참조를 버리는 것으로 함께 만료
+            self._windows.pop(challenge_id, None)
+            self.version += 1
+
+    def _window(self, challenge_id: str, now: float) -> ChallengeWindow:
+        self._advance(now)
+        window = self._windows.get(challenge_id)
+        if window is None:
+            opens_at, closes_at = window_bounds(self._definitions[challenge_id]["type"], now)
+            window = ChallengeWindow(challenge_id, opens_at, closes_at)
+            self._windows[challenge_id] = window
+            heapq.heappush(self._heap, (closes_at, challenge_id))
+        return window
+
+    def join(self, challenge_id: str, user_id: str, now: Optional[float] = None) -> ChallengeWindow:
+        """참여자 인덱스에 사용자 추가"""
+        window = self._window(challenge_id, time.time() if now is None else now)
+        if user_id not in window.participants:
+            window.participants.add(user_id)
+            self.version += 1
+        return window
+
+    def participants_count(self, challenge_id: str, now: Optional[float] = None) -> int:
+        return len(self._window(challenge_id, time.time() if now is None else now).participants)
+
+    def record_progress(
+        self,
+        user_id: str,
+        objective_id: str,
+        amount: int = 1,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """목표 진행도 증가 - 해당 목표를 가진 진행 중 도전과제 중 사용자가 참여한 것에만 반영"""
+        if amount < 1:
+            raise ValueError("amount must be a positive integer")
+        now = time.time() if now is None else now
+        updates = []
+        for challenge_id, position in self._objective_index.get(objective_id, []):
+            window = self._window(challenge_id, now)
+            if user_id not in window.participants:
+                continue
+            counters = window.counters.get(user_id)
+            if counters is None:
+                objectives = self._definitions[challenge_id]["objectives"]
+                counters = array("I", [0] * len(objectives))
+                window.counters[user_id] = counters
+
+            target = self._definitions[challenge_id]["objectives"][position]["target_value"]
+            counters[position] = min(counters[position] + amount, target)
+            updates.append({
+                "challenge_id": challenge_id,
+                "objective_id": objective_id,
+                "progress_increment": amount,
+                "new_progress": counters[position],
+                "target": target
+            })
+        return updates
+
+    def active_challenges(self, user_id: str, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """사용자 기준 활성 도전과제 목록 (남은 시간/진행률은 조회 시 계산)"""
+        now = time.time() if now is None else now
+        result = []
+        for challenge_id in self._challenge_ids:
+            definition = self._definitions[challenge_id]
+            window = self._window(challenge_id, now)
+            counters = window.counters.get(user_id)
+
+            objectives = []
+            ratios = []
+            for position, objective in enumerate(definition["objectives"]):
+                progress = counters[position] if counters is not None else 0
+                target = objective["target_value"]
+                objectives.append({
+                    "id": objective["id"],
+                    "description": objective["description"],
+                    "current_progress": progress,
+                    "target_value": target,
+                    "is_completed": progress >= target
+                })
+                ratios.append(min(progress / target, 1.0))
+
+            result.append({
+                "id": challenge_id,
+                "title": definition["title"],
+                "description": definition["description"],
+                "type": definition["type"],
+                "difficulty": definition["difficulty"],
+                "time_remaining_hours": int((window.closes_at - now) // 3600),
+                "objectives": objectives,
+                "rewards": definition["rewards"],
+                "progress_percentage": round(sum(ratios) / len(ratios) * 100) if ratios else 0,
+                "is_participating": user_id in window.participants,
+                "participants_count": len(window.participants),
+                "category": definition["category"],
+                "icon": definition["icon"],
+                "color": definition["color"]
+            })
+        return result
+
+
+def format_timestamp(timestamp: float) -> str:
+    """API 응답용 ISO 8601 (UTC) 문자열"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+challenge_scheduler = ChallengeScheduler()
@@ -0,0 +1,196 @@
+"""
+읽기 전용 코퍼스 응답 스냅샷 (메모리 맵 바이너리, 워커 간 공유)
+
+변하지 않는 코퍼스 응답(문법 강의 본문, 강의 목차, 레벨별 단어장)을 미리 직렬화/압축해
+하나의 파일에 기록하고, 각 uvicorn 워커는 mmap으로 열어 memoryview를 그대로 응답한다.
+- 페이지 캐시를 모든 워커가 공유하므로 워커를 늘려도 워커별 메모리(RSS 중 private)가 늘지 않음
+- 워커마다 JSON 파싱/brotli 압축/LRU 보관을 반복하지 않음
+- 마스터 프로세스가 워커를 띄우기 전에 한 번 컴파일 (main.py 참고), 워커는 최신 파일이면 열기만 함
+- 파일이 없거나 원본 JSON보다 오래되면 처음 열 때 다시 컴파일
+
+빌드만 따로 실행: python -m src.services.corpus_snapshot
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from functools import lru_cache
+from typing import Optional, List, Dict, Iterator, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import BUILD_DIR, CEFR_LEVELS, data_path, lesson_files
+from src.lib.response_cache import StaticJSONResponse
+from src.services.lesson_catalog import lesson_payload, scan_lesson, toc_payload
+from src.services.vocabulary_store import CORE_VOCABULARY_FILES, get_vocabulary_store
+
+CORPUS_SNAPSHOT_PATH = os.path.join(BUILD_DIR, "corpus_snapshot.bin")
+
+MAGIC = b"HLCORPUS"
+FORMAT_VERSION = 2
+
+# 응답 종류별 키 접두사
+LESSON_KEY = "lesson:"
+TOC_KEY = "toc:"
+VOCABULARY_KEY = "vocabulary:"
+
+BLOB_REF = [("offset", "<u8"), ("length", "<u4")]
+ENTRY_DTYPE = np.dtype([
+    ("key", BLOB_REF),
+    ("body", BLOB_REF),
+    ("br", BLOB_REF),
+    ("gzip", BLOB_REF),
+    ("etag", BLOB_REF),
+])
+
+# magic, version, 항목 수, 항목 배열 offset, 바이트 테이블 (offset, length)
+_HEADER = struct.Struct("<8sIIQQQ")
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def snapshot_sources() -> List[str]:
+    """스냅샷에 포함되는 원본 파일 (오래됨 판단용)"""
+    return [path for _, path in lesson_files()] + [
+        data_path("vocabulary", f"{level.lower()}.json") for level in CEFR_LEVELS
+    ] + [data_path(filename) for filename in CORE_VOCABULARY_FILES]
+
+
+def snapshot_responses() -> Iterator[Tuple[str, StaticJSONResponse]]:
+    """(키, 직렬화/압축된 응답) - 키 형식은 LESSON_KEY + 강의 id 등"""
+    entries = sorted(
+        (scan_lesson(lesson_id, path) for lesson_id, path in lesson_files()),
+        key=lambda entry: (
+            CEFR_LEVELS.index(entry.level) if entry.level in CEFR_LEVELS else len(CEFR_LEVELS),
+            entry.order_index,
+            entry.id,
+        ),
+    )
+    for entry in entries:
+        yield LESSON_KEY + entry.id, StaticJSONResponse(lesson_payload(entry))
+    for level in ("",) + CEFR_LEVELS:
+        yield TOC_KEY + level, StaticJSONResponse(toc_payload(entries, level))
+    vocabulary = get_vocabulary_store()
+    for level in CEFR_LEVELS:
+        yield VOCABULARY_KEY + level, StaticJSONResponse(vocabulary.level_topics(level))
+
+
+def compile_corpus_snapshot(path: str = CORPUS_SNAPSHOT_PATH) -> int:
+    """스냅샷 파일 생성 (임시 파일에 쓴 뒤 교체) - 응답 수 반환"""
+    blob = bytearray()
+
+    def add(data: bytes) -> Tuple[int, int]:
+        ref = (len(blob), len(data))
+        blob.extend(data)
+        return ref
+
+    rows = []
+    for key, response in snapshot_responses():
+        rows.append((
+            add(key.encode("utf-8")),
+            add(response.body),
+            add(response.variants.get("br", b"")),
+            add(response.variants["gzip"]),
+            add(response.etag.encode("ascii")),
+        ))
+    entries = np.array(rows, dtype=ENTRY_DTYPE)
+
+    entries_offset = _aligned(_HEADER.size)
+    blob_offset = _aligned(entries_offset + entries.nbytes)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), entries_offset, blob_offset, len(blob)))
+            f.write(b"\0" * (entries_offset - f.tell()))
+            f.write(entries.tobytes())
+            f.write(b"\0" * (blob_offset - f.tell()))
+            f.write(blob)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return len(entries)
+
+
+class CorpusSnapshot:
+    """mmap으로 연 응답 스냅샷 (읽기 전용, 프로세스 간 페이지 공유)"""
+
+    def __init__(self, path: str = CORPUS_SNAPSHOT_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, entries_offset, blob_offset, blob_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} corpus snapshot")
+        self._entries = np.frombuffer(self._mmap, dtype=ENTRY_DTYPE, count=count, offset=entries_offset)
+        self._blob = memoryview(self._mmap)[blob_offset:blob_offset + blob_length]
+        self._index = {bytes(self._bytes(entry["key"])).decode("utf-8"): row for row, entry in enumerate(self._entries)}
+        self._responses: Dict[str, StaticJSONResponse] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def _bytes(self, ref) -> memoryview:
+        start = int(ref["offset"])
+        return self._blob[start:start + int(ref["length"])]
+
+    def response(self, key: str) -> Optional[StaticJSONResponse]:
+        """키에 해당하는 응답 (본문/압축 변형은 복사 없이 mmap을 가리킴)"""
+        response = self._responses.get(key)
+        if response is None:
+            row = self._index.get(key)
+            if row is None:
+                return None
+            entry = self._entries[row]
+            variants = {"br": self._bytes(entry["br"])} if entry["br"]["length"] else {}
+            variants["gzip"] = self._bytes(entry["gzip"])
+            response = StaticJSONResponse.from_encoded(
+                self._bytes(entry["body"]), bytes(self._bytes(entry["etag"])).decode("ascii"), variants
+            )
+            self._responses[key] = response
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "responses": len(self._entries),
+            "file_bytes": len(self._mmap),
+            "opened_responses": len(self._responses),
+        }
+
+
+def _is_stale(path: str) -> bool:
+    if not os.path.exists(path):
+        return True
+    built_at = os.path.getmtime(path)
+    return any(os.path.getmtime(source) > built_at for source in snapshot_sources())
+
+
+def open_corpus_snapshot(path: str = CORPUS_SNAPSHOT_PATH) -> CorpusSnapshot:
+    """스냅샷 열기 (없거나 오래되었거나 형식이 다르면 먼저 컴파일)"""
+    if _is_stale(path):
+        compile_corpus_snapshot(path)
+    try:
+        return CorpusSnapshot(path)
+    except ValueError:
+        compile_corpus_snapshot(path)
+        return CorpusSnapshot(path)
+
+
+@lru_cache(maxsize=1)
+def get_corpus_snapshot() -> CorpusSnapshot:
+    """프로세스 전역 코퍼스 스냅샷"""
+    return open_corpus_snapshot()
+
+
+if __name__ == "__main__":
+    count = compile_corpus_snapshot()
+    print(f"{count} responses -> {CORPUS_SNAPSHOT_PATH} ({os.path.getsize(CORPUS_SNAPSHOT_PATH)} bytes)")
@@ -0,0 +1,323 @@
+"""
+문법 강의 선수 관계 그래프 (커리큘럼 DAG)
+
+강의 JSON의 prerequisites("A1-1", "A2-All", "01-nouns-basics")와 레벨/순서로 시작 시 한 번 생성한다.
+- 노드 번호 = 위상 정렬 순서 (동순위는 레벨, orderIndex 순) → 비트 i가 노드 i
+- 선수 강의 집합과 전체 선행 강의(도달 가능성) 집합을 정수 비트셋으로 보관
+- 레벨 복습 강의("15-a1-review")는 같은 레벨의 모든 강의를 선수로 두고 마일스톤으로 사용
+- 사용자별 완료 강의도 비트셋 하나 → "다음 열린 강의", "마일스톤까지 남은 강의"를 비트 연산으로 계산
+- 완료 기록은 늘기만 하므로 워커가 여러 개면 저장 파일과 합집합으로 합침 (저장은 파일 잠금 안에서)
+"""
+
+import asyncio
+import heapq
+import json
+import os
+import re
+import tempfile
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator
+
+from src.lib.data_paths import CEFR_LEVELS, STATE_DIR, LEGACY_LESSON_DIR, lesson_files, load_json
+from src.lib.file_lock import acquire_lock, file_lock, file_stamp, release_lock
+
+PROGRESS_PATH = os.path.join(STATE_DIR, "lesson_progress.json")
+
+_LEVEL_ORDER_REF = re.compile(r"^(A1|A2|B1|B2)-(\d+)$", re.IGNORECASE)
+_LEVEL_ALL_REF = re.compile(r"^(A1|A2|B1|B2)-all$", re.IGNORECASE)
+REVIEW_SUFFIX = "-review"
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """설정된 비트 번호를 오름차순(= 위상 순서)으로"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CurriculumNode:
+    __slots__ = ("lesson_id", "level", "order_index", "title", "is_review")
+
+    def __init__(self, lesson_id: str, level: str, order_index: int, title: str):
+        self.lesson_id = lesson_id
+        self.level = level
+        self.order_index = order_index
+        self.title = title
+        self.is_review = lesson_id.endswith(REVIEW_SUFFIX)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.lesson_id,
+            "level": self.level,
+            "orderIndex": self.order_index,
+            "title": self.title,
+            "isReview": self.is_review,
+        }
+
+
+class CurriculumGraph:
+    """위상 순서로 번호를 매긴 강의 DAG"""
+
+    def __init__(self, lessons: List[Dict[str, Any]]):
+        """lessons: {"id", "level", "orderIndex", "title", "prerequisites"} 목록"""
+        by_id = {lesson["id"]: lesson for lesson in lessons}
+        by_order = {(lesson["level"], lesson["orderIndex"]): lesson["id"] for lesson in lessons}
+        by_level: Dict[str, List[str]] = {}
+        for lesson in lessons:
+            by_level.setdefault(lesson["level"], []).append(lesson["id"])
+
+        # 선수 참조 → 강의 id
+        prerequisites: Dict[str, set] = {}
+        self.unresolved: List[str] = []
+        for lesson in lessons:
+            lesson_id, level = lesson["id"], lesson["level"]
+            resolved = set()
+            if lesson_id.endswith(REVIEW_SUFFIX):
+                resolved.update(by_level[level])
+            for ref in lesson.get("prerequisites") or []:
+                match = _LEVEL_ORDER_REF.match(ref)
+                if match:
+                    target = by_order.get((match.group(1).upper(), int(match.group(2))))
+                    targets = [target] if target else []
+                elif _LEVEL_ALL_REF.match(ref):
+                    targets = by_level.get(ref[:2].upper(), [])
+                else:
+                    # 같은 레벨 디렉토리의 파일명
+                    target = f"{level.lower()}-{ref}"
+                    targets = [target] if target in by_id else []
+                if not targets:
+                    self.unresolved.append(f"{lesson_id}: {ref}")
+                resolved.update(targets)
+            resolved.discard(lesson_id)
+            prerequisites[lesson_id] = resolved
+
+        # 위상 정렬 (Kahn) - 진입 가능한 강의 중 레벨, 순서가 앞선 것부터
+        rank = lambda lesson_id: (CEFR_LEVELS.index(by_id[lesson_id]["level"]), by_id[lesson_id]["orderIndex"], lesson_id)
+        dependents: Dict[str, List[str]] = {lesson_id: [] for lesson_id in by_id}
+        pending = {lesson_id: len(required) for lesson_id, required in prerequisites.items()}
+        for lesson_id, required in prerequisites.items():
+            for prerequisite in required:
+                dependents[prerequisite].append(lesson_id)
+        ready = [rank(lesson_id) for lesson_id, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+        order: List[str] = []
+        while ready:
+            lesson_id = heapq.heappop(ready)[2]
+            order.append(lesson_id)
+            for dependent in dependents[lesson_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    heapq.heappush(ready, rank(dependent))
+        if len(order) != len(by_id):
+            cyclic = sorted(lesson_id for lesson_id, count in pending.items() if count > 0)
+            raise ValueError(f"curriculum prerequisites contain a cycle: {', '.join(cyclic)}")
+
+        self.nodes = [
+            CurriculumNode(lesson_id, by_id[lesson_id]["level"], by_id[lesson_id]["orderIndex"], by_id[lesson_id]["title"])
+            for lesson_id in order
+        ]
+        self.index = {lesson_id: i for i, lesson_id in enumerate(order)}
+
+        # 직접 선수 비트셋과 전체 선행 비트셋 (위상 순서라 선수는 항상 먼저 계산됨)
+        self.requires: List[int] = []
+        self.ancestors: List[int] = []
+        for lesson_id in order:
+            requires = 0
+            ancestors = 0
+            for prerequisite in prerequisites[lesson_id]:
+                bit = self.index[prerequisite]
+                requires |= 1 << bit
+                ancestors |= self.ancestors[bit] | (1 << bit)
+            self.requires.append(requires)
+            self.ancestors.append(ancestors)
+
+        self.level_masks = {level: 0 for level in CEFR_LEVELS}
+        for i, node in enumerate(self.nodes):
+            self.level_masks[node.level] |= 1 << i
+        self.milestones = {node.level: i for i, node in enumerate(self.nodes) if node.is_review}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, lesson_id: str) -> bool:
+        return lesson_id in self.index
+
+    def ids(self, mask: int) -> List[str]:
+        return [self.nodes[i].lesson_id for i in iter_bits(mask)]
+
+    def mask_of(self, lesson_ids) -> int:
+        mask = 0
+        for lesson_id in lesson_ids:
+            bit = self.index.get(lesson_id)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def levels_below(self, level: str) -> int:
+        """해당 레벨 이전 레벨의 모든 강의 (레벨만 알고 기록이 없는 학습자의 완료 추정)"""
+        mask = 0
+        for lower in CEFR_LEVELS[:CEFR_LEVELS.index(level)] if level in CEFR_LEVELS else ():
+            mask |= self.level_masks[lower]
+        return mask
+
+    def unlocked(self, completed: int) -> int:
+        """선수 강의를 모두 마쳤지만 아직 완료하지 않은 강의"""
+        mask = 0
+        for i, requires in enumerate(self.requires):
+            if requires & ~completed == 0:
+                mask |= 1 << i
+        return mask & ~completed
+
+    def gaps(self, completed: int, target: str) -> int:
+        """target 강의(자신 포함)까지 남은 강의"""
+        bit = self.index[target]
+        return (self.ancestors[bit] | (1 << bit)) & ~completed
+
+    def next_milestone(self, completed: int, level: str = CEFR_LEVELS[0]) -> Optional[str]:
+        """level부터 찾은 첫 미완료 레벨 복습 강의"""
+        start = CEFR_LEVELS.index(level) if level in CEFR_LEVELS else 0
+        for milestone_level in CEFR_LEVELS[start:]:
+            bit = self.milestones.get(milestone_level)
+            if bit is not None and not completed >> bit & 1:
+                return self.nodes[bit].lesson_id
+        return None
+
+    def resolve_milestone(self, milestone: str) -> Optional[str]:
+        """레벨명("B1") 또는 강의 id → 마일스톤 강의 id"""
+        level = milestone.upper()
+        if level in self.milestones:
+            return self.nodes[self.milestones[level]].lesson_id
+        return milestone if milestone in self.index else None
+
+    def describe(self, mask: int) -> List[Dict[str, Any]]:
+        return [self.nodes[i].to_dict() for i in iter_bits(mask)]
+
+
+def load_curriculum_lessons() -> List[Dict[str, Any]]:
+    """레벨 디렉토리의 강의(초기 형식 제외)에서 그래프 입력 추출"""
+    lessons = []
+    for lesson_id, path in lesson_files():
+        if os.path.basename(os.path.dirname(path)) == LEGACY_LESSON_DIR:
+            continue
+        lesson = load_json(path)
+        level = (lesson.get("level") or "").upper()
+        if level not in CEFR_LEVELS:
+            continue
+        lessons.append({
+            "id": lesson_id,
+            "level": level,
+            "orderIndex": lesson.get("orderIndex") or lesson.get("order") or 0,
+            "title": lesson.get("titleKorean") or lesson.get("title", ""),
+            "prerequisites": lesson.get("prerequisites") or [],
+        })
+    return lessons
+
+
+class LessonProgressStore:
+    """사용자별 완료 강의 비트셋 (저장 파일에는 그래프 변경에 안전하도록 강의 id로 기록)"""
+
+    def __init__(self, graph: CurriculumGraph, path: Optional[str] = PROGRESS_PATH):
+        self.graph = graph
+        self.path = path
+        self._completed: Dict[str, int] = {}
+        self._dirty = False
+        self._save_lock = asyncio.Lock()
+        # 마지막으로 읽거나 쓴 저장 파일 상태 (다른 프로세스가 저장했는지 비교)
+        self._stamp = None
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def completed(self, user_id: Optional[str]) -> int:
+        self.refresh()
+        return self._completed.get(user_id, 0) if user_id else 0
+
+    def complete(self, user_id: str, lesson_id: str) -> int:
+        previous = self._completed.get(user_id, 0)
+        mask = previous | self.graph.mask_of([lesson_id])
+        if mask != previous:
+            self._completed[user_id] = mask
+            self._dirty = True
+        return mask
+
+    def _serialize(self) -> str:
+        return json.dumps({user_id: self.graph.ids(mask) for user_id, mask in self._completed.items()}, ensure_ascii=False)
+
+    @staticmethod
+    def _write(path: str, data: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if not path:
+            return
+        with file_lock(path + ".lock"):
+            if path == self.path:
+                self._merge(self._read_changed())
+            self._write(path, self._serialize())
+            if path == self.path:
+                self._stamp = file_stamp(path)
+        self._dirty = False
+
+    async def persist(self) -> None:
+        """완료 기록이 바뀌었으면 스레드에서 저장 - 저장은 한 번에 하나씩, 항상 최신 상태를 기록
+        (파일 잠금 안에서 다른 프로세스가 저장한 완료 기록을 먼저 합침)
+        """
+        async with self._save_lock:
+            if not self.path or not self._dirty:
+                return
+            fd = await asyncio.to_thread(acquire_lock, self.path + ".lock")
+            try:
+                self._merge(await asyncio.to_thread(self._read_changed))
+                data, self._dirty = self._serialize(), False
+                try:
+                    await asyncio.to_thread(self._write, self.path, data)
+                except BaseException:
+                    self._dirty = True
+                    raise
+                self._stamp = file_stamp(self.path)
+            finally:
+                release_lock(fd)
+
+    def refresh(self) -> None:
+        """저장 파일이 마지막으로 읽거나 쓴 뒤 바뀌었으면 합침 - 평소에는 stat 한 번"""
+        if self.path and file_stamp(self.path) != self._stamp:
+            self._merge(self._read_changed())
+
+    def _read_changed(self) -> Optional[Dict[str, Any]]:
+        stamp = file_stamp(self.path)
+        if stamp is None or stamp == self._stamp:
+            return None
+        return {"completed": load_json(self.path), "stamp": stamp}
+
+    def _merge(self, saved: Optional[Dict[str, Any]]) -> None:
+        if saved is None:
+            return
+        for user_id, lesson_ids in saved["completed"].items():
+            self._completed[user_id] = self._completed.get(user_id, 0) | self.graph.mask_of(lesson_ids)
+        self._stamp = saved["stamp"]
+
+    def load(self, path: str) -> None:
+        self._completed = {user_id: self.graph.mask_of(lesson_ids) for user_id, lesson_ids in load_json(path).items()}
+        if path == self.path:
+            self._stamp = file_stamp(path)
+
+
+@lru_cache(maxsize=1)
+def get_curriculum_graph() -> CurriculumGraph:
+    """프로세스 전역 커리큘럼 그래프"""
+    return CurriculumGraph(load_curriculum_lessons())
+
+
+@lru_cache(maxsize=1)
+def get_lesson_progress_store() -> LessonProgressStore:
+    """프로세스 전역 강의 완료 기록 (저장 파일이 있으면 복원)"""
+    return LessonProgressStore(get_curriculum_graph())
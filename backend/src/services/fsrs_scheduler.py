@@ -0,0 +1,409 @@
+"""
+FSRS 간격 반복 스케줄러 (src/lib/fsrsAlgorithm.ts 포팅)
+
+사용자 한 명의 어휘 카드 전체를 카드별 열(NumPy 배열)로 보관하고,
+기억 가능성/우선순위/복습 대기열과 복습 결과 반영을 카드 수와 무관하게 벡터 연산 한 번으로 계산한다.
+- 새 카드 초기값, 성공 복습, 간격(JS 반올림), 통계는 TS 구현과 같은 값
+- 우선순위는 TS 점수(기한 초과·망각일수록 큼)를 뒤집어 테스트 기대대로 낮을수록 먼저 복습
+- TS 구현이 발산하는 경우(실패 시 안정성 증가, 0/0, 늦은 복습의 음수 안정성)는
+  tests/unit/fsrsAlgorithm.test.ts의 기대 동작에 맞게 보정 (next_stability 참고)
+- 시각은 epoch 초 (TS Date의 밀리초 / 1000), 마지막 복습이 없으면 NaN
+- 사용자별 카드 묶음은 변경 시 스레드에서 npz 파일로 저장하고 처음 접근할 때 읽음
+  (워커가 여러 개면 변경은 사용자별 파일 잠금 안에서, 파일이 바뀌었으면 다시 읽음)
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import STATE_DIR
+from src.lib.file_lock import acquire_lock, file_stamp, release_lock
+
+DECK_DIR = os.path.join(STATE_DIR, "srs")
+DAY_SECONDS = 24 * 60 * 60
+MAX_CACHED_DECKS = 256
+
+
+class CardState(IntEnum):
+    NEW = 0
+    LEARNING = 1
+    REVIEW = 2
+    RELEARNING = 3
+
+
+class Rating(IntEnum):
+    AGAIN = 1
+    HARD = 2
+    GOOD = 3
+    EASY = 4
+
+
+class FSRSParameters:
+    __slots__ = ("request_retention", "maximum_interval", "w")
+
+    def __init__(self, request_retention: float = 0.9, maximum_interval: int = 36500, w: Optional[Iterable[float]] = None):
+        self.request_retention = request_retention
+        self.maximum_interval = maximum_interval
+        self.w = np.asarray(w if w is not None else DEFAULT_WEIGHTS, dtype=np.float64)
+
+
+DEFAULT_WEIGHTS = (
+    0.4, 0.6, 2.4, 5.8, 4.93, 0.94, 0.86, 0.01, 1.49, 0.14, 0.94,
+    2.18, 0.05, 0.34, 1.26, 0.29, 2.61,
+)
+
+# 카드 열 (이름, dtype, 새 카드 기본값)
+CARD_COLUMNS = (
+    ("due", np.float64, 0.0),
+    ("stability", np.float64, 0.0),
+    ("difficulty", np.float64, 0.0),
+    ("elapsed_days", np.float64, 0.0),
+    ("scheduled_days", np.float64, 0.0),
+    ("reps", np.int32, 0),
+    ("lapses", np.int32, 0),
+    ("state", np.int8, CardState.NEW),
+    ("last_review", np.float64, np.nan),
+)
+
+# 최적 묶음 크기 계산용 카드당 평균 복습 시간 (초)
+AVERAGE_REVIEW_SECONDS = 30
+NEW_CARDS_PER_BATCH = 5
+NEW_CARD_PRIORITY = 1000
+# 복습 카드 긴급도 최댓값 (망각 100 + 기한 초과 50) - 우선순위 = 최댓값 - 긴급도
+MAX_REVIEW_URGENCY = 150
+# 이 안정성(일)에 도달하면 성숙한 카드로 봄
+MATURE_STABILITY_DAYS = 21
+
+
+def js_round(values: np.ndarray) -> np.ndarray:
+    """JavaScript Math.round (0.5는 항상 올림) - np.round는 짝수 반올림"""
+    return np.floor(values + 0.5)
+
+
+class FSRSScheduler:
+    """카드 열에 대한 FSRS 수식 (fsrsAlgorithm.ts의 FSRS 클래스)"""
+
+    def __init__(self, parameters: Optional[FSRSParameters] = None):
+        self.parameters = parameters or FSRSParameters()
+
+    def init_stability(self, ratings: np.ndarray) -> np.ndarray:
+        return np.maximum(self.parameters.w[ratings - 1], 0.1)
+
+    def init_difficulty(self, ratings: np.ndarray) -> np.ndarray:
+        w = self.parameters.w
+        return np.clip(w[4] - (ratings - 3) * w[5], 1, 10)
+
+    def next_stability(self, stability: np.ndarray, difficulty: np.ndarray, elapsed_days: np.ndarray,
+                       scheduled_days: np.ndarray, ratings: np.ndarray) -> np.ndarray:
+        """복습 후 안정성
+
+        성공: TS와 같은 식이지만 증가분 하한 0 (예정보다 늦은 복습에서 음수 안정성이 되지 않도록),
+        예정 간격이 0인 카드는 1일로 계산 (TS는 0/0 → NaN)
+        실패: TS 식은 안정성을 오히려 키우므로 FSRS v4 망각 후 안정성 식 사용, 현재 안정성을 넘지 않음
+        """
+        w = self.parameters.w
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            safe_stability = np.maximum(stability, 0.1)
+            retention = self.retention(safe_stability, elapsed_days)
+            forgotten = np.minimum(
+                w[11] * np.power(np.maximum(difficulty, 1), -w[12])
+                * (np.power(safe_stability + 1, w[13]) - 1)
+                * np.exp((1 - retention) * w[14]),
+                safe_stability,
+            )
+            penalty = np.where(ratings == Rating.HARD, w[13], 1.0) * np.where(ratings == Rating.EASY, w[14], 1.0)
+            growth = np.maximum(np.exp((1 - elapsed_days / np.maximum(scheduled_days, 1)) * w[10]) - 1, 0)
+            recalled = safe_stability * (
+                1 + np.exp(w[8])
+                * (11 - difficulty)
+                * np.power(safe_stability, -w[9])
+                * growth
+                * penalty
+            )
+        return np.where(ratings == Rating.AGAIN, forgotten, recalled)
+
+    def next_difficulty(self, difficulty: np.ndarray, ratings: np.ndarray) -> np.ndarray:
+        return np.clip(difficulty - self.parameters.w[6] * (ratings - 3), 1, 10)
+
+    def interval(self, stability: np.ndarray) -> np.ndarray:
+        factor = np.log(self.parameters.request_retention) / np.log(0.9)
+        return np.minimum(np.maximum(js_round(stability * factor), 1), self.parameters.maximum_interval)
+
+    def review(self, cards: Dict[str, np.ndarray], ratings: np.ndarray, review_times: np.ndarray) -> Dict[str, np.ndarray]:
+        """카드 열 묶음에 복습 결과를 반영한 새 열 반환 (각 카드는 한 번씩만 포함)"""
+        ratings = np.asarray(ratings, dtype=np.int64)
+        review_times = np.asarray(review_times, dtype=np.float64)
+        state = cards["state"]
+        last_review = cards["last_review"]
+
+        reviewed = np.isfinite(last_review)
+        elapsed_days = np.where(
+            reviewed,
+            np.maximum(0, np.floor((review_times - np.where(reviewed, last_review, 0)) / DAY_SECONDS)),
+            cards["elapsed_days"],
+        )
+        is_new = state == CardState.NEW
+        again = ratings == Rating.AGAIN
+
+        stability = np.where(
+            is_new,
+            self.init_stability(ratings),
+            self.next_stability(cards["stability"], cards["difficulty"], elapsed_days, cards["scheduled_days"], ratings),
+        )
+        difficulty = np.where(is_new, self.init_difficulty(ratings), self.next_difficulty(cards["difficulty"], ratings))
+        failed_state = np.where(state == CardState.REVIEW, CardState.RELEARNING, CardState.LEARNING)
+        scheduled_days = self.interval(stability)
+        return {
+            "due": review_times + scheduled_days * DAY_SECONDS,
+            "stability": stability,
+            "difficulty": difficulty,
+            "elapsed_days": elapsed_days,
+            "scheduled_days": scheduled_days,
+            "reps": cards["reps"] + 1,
+            "lapses": cards["lapses"] + again,
+            "state": np.where(again, failed_state, CardState.REVIEW).astype(np.int8),
+            "last_review": review_times,
+        }
+
+    @staticmethod
+    def retention(stability: np.ndarray, days: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.power(0.9, days / stability)
+
+    def priority(self, cards: Dict[str, np.ndarray], now: float) -> np.ndarray:
+        """복습 우선순위 (낮을수록 먼저) - 기한 초과 일수가 길고 기억 가능성이 낮을수록 낮음, 새 카드는 맨 뒤"""
+        overdue = now - cards["due"]
+        overdue_days = np.where(overdue >= 0, np.floor(overdue / DAY_SECONDS), 0)
+        retention = self.retention(cards["stability"], np.maximum(0, overdue / DAY_SECONDS))
+        urgency = (1 - retention) * 100 + np.minimum(overdue_days * 2, 50)
+        return np.where(cards["state"] == CardState.NEW, NEW_CARD_PRIORITY, MAX_REVIEW_URGENCY - urgency)
+
+    @staticmethod
+    def maturity(cards: Dict[str, np.ndarray]) -> np.ndarray:
+        state = cards["state"]
+        learning = (state == CardState.LEARNING) | (state == CardState.RELEARNING)
+        return np.where(
+            state == CardState.NEW, 0.0,
+            np.where(learning, np.minimum(cards["stability"] / MATURE_STABILITY_DAYS, 1), 1.0),
+        )
+
+
+class ReviewDeck:
+    """사용자 한 명의 카드 열 (card_id → 행 번호)"""
+
+    def __init__(self, scheduler: FSRSScheduler, card_ids: Optional[List[str]] = None,
+                 columns: Optional[Dict[str, np.ndarray]] = None):
+        self.scheduler = scheduler
+        self.card_ids: List[str] = list(card_ids or [])
+        self._index = {card_id: row for row, card_id in enumerate(self.card_ids)}
+        self.columns = columns or {name: np.zeros(0, dtype=dtype) for name, dtype, _ in CARD_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
+
+    def index_of(self, card_id: str) -> Optional[int]:
+        return self._index.get(card_id)
+
+    def add_cards(self, card_ids: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """새 카드 추가 (이미 있는 카드는 무시) - 추가된 id 반환"""
+        now = time.time() if now is None else now
+        added = [card_id for card_id in dict.fromkeys(card_ids) if card_id not in self._index]
+        if not added:
+            return added
+        for card_id in added:
+            self._index[card_id] = len(self.card_ids)
+            self.card_ids.append(card_id)
+        for name, dtype, default in CARD_COLUMNS:
+            fill = np.full(len(added), now if name == "due" else default, dtype=dtype)
+            self.columns[name] = np.concatenate([self.columns[name], fill])
+        return added
+
+    def rows(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        return {name: values[indices] for name, values in self.columns.items()}
+
+    def review(self, rows: np.ndarray, ratings: np.ndarray, review_times: np.ndarray) -> None:
+        """복습 결과 묶음 반영 - 같은 카드가 여러 번 있으면 입력 순서대로 차례로 적용
+
+        복습 시각이 그 카드의 마지막 복습보다 이르면 마지막 복습 시각으로 올림 (경과 일수가 음수가 되지 않도록)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=np.int64)
+        review_times = np.asarray(review_times, dtype=np.float64)
+        # 같은 카드의 n번째 복습끼리 한 번에 처리
+        occurrence = np.zeros(len(rows), dtype=np.int64)
+        seen: Dict[int, int] = {}
+        for i, row in enumerate(rows.tolist()):
+            occurrence[i] = seen.get(row, 0)
+            seen[row] = occurrence[i] + 1
+        for round_index in range(int(occurrence.max()) + 1 if len(rows) else 0):
+            selected = occurrence == round_index
+            batch_rows = rows[selected]
+            last_review = self.columns["last_review"][batch_rows]
+            times = np.where(np.isfinite(last_review), np.maximum(review_times[selected], last_review), review_times[selected])
+            updated = self.scheduler.review(self.rows(batch_rows), ratings[selected], times)
+            for name, values in updated.items():
+                self.columns[name][batch_rows] = values
+
+    def due_queue(self, now: float, limit: int) -> Tuple[np.ndarray, np.ndarray]:
+        """기한이 된 카드 중 우선순위가 높은 limit개 (행 번호, 우선순위)"""
+        due = np.flatnonzero(self.columns["due"] <= now)
+        if len(due) == 0 or limit <= 0:
+            return due[:0], np.zeros(0)
+        priority = self.scheduler.priority(self.rows(due), now)
+        # NaN 우선순위(안정성 0인 복습 카드 등)는 가장 뒤로
+        priority = np.where(np.isnan(priority), np.inf, priority)
+        k = min(limit, len(due))
+        top = np.argpartition(priority, k - 1)[:k]
+        top = top[np.argsort(priority[top], kind="stable")]
+        return due[top], priority[top]
+
+    def optimal_batch_size(self, target_minutes: float, now: float) -> int:
+        """학습 시간에 맞는 카드 수 - 기한이 된 카드 + 아직 기한 전인 새 카드 최대 NEW_CARDS_PER_BATCH개 (카드 수를 넘지 않음)"""
+        max_cards = int(target_minutes * 60 // AVERAGE_REVIEW_SECONDS)
+        due = self.columns["due"] <= now
+        overdue = int(due.sum())
+        new_count = int(((self.columns["state"] == CardState.NEW) & ~due).sum())
+        return min(max_cards, overdue + min(NEW_CARDS_PER_BATCH, new_count))
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.columns["state"]
+        studied = state != CardState.NEW
+        total = len(state)
+        return {
+            "total": total,
+            "new": int((state == CardState.NEW).sum()),
+            "learning": int(((state == CardState.LEARNING) | (state == CardState.RELEARNING)).sum()),
+            "review": int((state == CardState.REVIEW).sum()),
+            "averageStability": float(self.columns["stability"][studied].mean()) if studied.any() else 0,
+            "averageDifficulty": float(self.columns["difficulty"][studied].mean()) if studied.any() else 0,
+            "maturityRate": float((self.scheduler.maturity(self.columns) >= 0.8).sum() / total) if total else 0,
+        }
+
+    def card(self, row: int) -> Dict[str, Any]:
+        """카드 한 장을 API 응답 형식으로"""
+        values = {name: values[row] for name, values in self.columns.items()}
+        last_review = float(values["last_review"])
+        return {
+            "card_id": self.card_ids[row],
+            "due": _isoformat(float(values["due"])),
+            "stability": float(values["stability"]),
+            "difficulty": float(values["difficulty"]),
+            "elapsed_days": int(values["elapsed_days"]) if np.isfinite(values["elapsed_days"]) else None,
+            "scheduled_days": int(values["scheduled_days"]) if np.isfinite(values["scheduled_days"]) else None,
+            "reps": int(values["reps"]),
+            "lapses": int(values["lapses"]),
+            "state": CardState(int(values["state"])).name.lower(),
+            "last_review": _isoformat(last_review) if np.isfinite(last_review) else None,
+        }
+
+    def preview(self, row: int, now: float) -> Dict[str, Dict[str, Any]]:
+        """평가별 다음 일정 미리보기 (scheduleCard)"""
+        cards = self.rows(np.full(len(Rating), row))
+        updated = self.scheduler.review(cards, np.asarray([int(r) for r in Rating]), np.full(len(Rating), now))
+        return {
+            rating.name.lower(): {
+                "scheduled_days": int(updated["scheduled_days"][i]) if np.isfinite(updated["scheduled_days"][i]) else None,
+                "due": _isoformat(float(updated["due"][i])),
+                "stability": float(updated["stability"][i]),
+                "difficulty": float(updated["difficulty"][i]),
+            }
+            for i, rating in enumerate(Rating)
+        }
+
+
+def _isoformat(timestamp: float) -> Optional[str]:
+    if not np.isfinite(timestamp):
+        return None
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+class ReviewDeckStore:
+    """사용자별 카드 묶음 (최근 사용한 묶음만 메모리에 유지, 변경 시 파일 저장)"""
+
+    def __init__(self, directory: Optional[str] = DECK_DIR, scheduler: Optional[FSRSScheduler] = None,
+                 max_cached: int = MAX_CACHED_DECKS):
+        self.directory = directory
+        self.scheduler = scheduler or FSRSScheduler()
+        self.max_cached = max_cached
+        self._decks: "OrderedDict[str, ReviewDeck]" = OrderedDict()
+        # 사용자 → 마지막으로 읽거나 쓴 파일 상태 (다른 프로세스가 저장했으면 다시 읽음)
+        self._stamps: Dict[str, Any] = {}
+        self._save_lock = asyncio.Lock()
+
+    def _path(self, user_id: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(user_id.encode("utf-8")).hexdigest() + ".npz")
+
+    def get(self, user_id: str) -> ReviewDeck:
+        deck = self._decks.get(user_id)
+        stamp = file_stamp(self._path(user_id)) if self.directory else None
+        if deck is not None and self._stamps.get(user_id) == stamp:
+            self._decks.move_to_end(user_id)
+            return deck
+        deck = ReviewDeck(self.scheduler)
+        if stamp is not None:
+            with np.load(self._path(user_id)) as snapshot:
+                columns = {name: snapshot[name].astype(dtype) for name, dtype, _ in CARD_COLUMNS}
+                deck = ReviewDeck(self.scheduler, snapshot["card_ids"].tolist(), columns)
+        self._decks[user_id] = deck
+        self._decks.move_to_end(user_id)
+        self._stamps[user_id] = stamp
+        while len(self._decks) > self.max_cached:
+            evicted, _ = self._decks.popitem(last=False)
+            self._stamps.pop(evicted, None)
+        return deck
+
+    @asynccontextmanager
+    async def editing(self, user_id: str):
+        """카드 묶음을 바꾸는 동안 사용자별 파일 잠금 유지 (다른 워커의 변경과 섞이지 않도록) - 최신 묶음을 넘김"""
+        fd = await asyncio.to_thread(acquire_lock, self._path(user_id) + ".lock") if self.directory else None
+        try:
+            yield self.get(user_id)
+        finally:
+            release_lock(fd)
+
+    def _arrays(self, user_id: str) -> Optional[Dict[str, np.ndarray]]:
+        """저장할 카드 열의 복사본 (저장 중에 복습이 반영되어도 파일 내용이 섞이지 않도록)"""
+        deck = self._decks.get(user_id)
+        if deck is None or not self.directory:
+            return None
+        return {"card_ids": np.asarray(deck.card_ids, dtype=str), **{name: values.copy() for name, values in deck.columns.items()}}
+
+    def _write(self, user_id: str, arrays: Dict[str, np.ndarray]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, self._path(user_id))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        if user_id in self._decks:
+            self._stamps[user_id] = file_stamp(self._path(user_id))
+
+    def save(self, user_id: str) -> None:
+        arrays = self._arrays(user_id)
+        if arrays is not None:
+            self._write(user_id, arrays)
+
+    async def persist(self, user_id: str) -> None:
+        """카드 묶음을 스레드에서 저장 (이벤트 루프를 막지 않음) - 저장은 한 번에 하나씩, 항상 최신 상태를 기록"""
+        async with self._save_lock:
+            arrays = self._arrays(user_id)
+            if arrays is not None:
+                await asyncio.to_thread(self._write, user_id, arrays)
+
+
+@lru_cache(maxsize=1)
+def get_review_deck_store() -> ReviewDeckStore:
+    """프로세스 전역 카드 묶음 저장소"""
+    return ReviewDeckStore()
@@ -0,0 +1,292 @@
+"""
+사용자별 추천 가중치 온라인 학습
+
+추천 피드백이 들어올 때마다 해당 사용자의 가중치 벡터만 O(특성 수)로 갱신한다.
+- 콘텐츠 피드백: 보상(완료/평점/건너뜀)과 예측 점수의 차이로 확률적 경사 하강 1단계
+- 설정 변경: 설정에서 만든 가중치 쪽으로 혼합
+- 추천 요청: 학습된 가중치에 요청의 설정/레벨/약점 영역 가중치를 섞어 사용 (저장하지 않음)
+- 저장소: 사용자 × 특성 float32 행렬 하나 (용량이 차면 2배로 확장)
+- 스냅샷: 일정 횟수/시간마다 복사본을 스레드에서 np.savez로 저장 (임시 파일에 쓴 뒤 교체), 시작 시 복원
+- 워커 여러 개: 저장은 잠금 파일의 배타적 잠금 안에서 다른 프로세스의 스냅샷을 먼저 합친 뒤 기록
+  (이 프로세스가 저장 후 바꾼 사용자는 유지), 조회 시 스냅샷 파일이 바뀌었으면 같은 방식으로 합침
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+from src.lib.data_paths import STATE_DIR
+from src.lib.file_lock import acquire_lock, file_stamp, release_lock
+from src.services.recommendation_engine import (
+    COLUMN_GROUP, COLUMN_INDEX, COLUMNS, CONTENT_TYPES, GROUP_WEIGHTS, LEARNING_STYLES,
+)
+
+SNAPSHOT_PATH = os.path.join(STATE_DIR, "recommendation_weights.npz")
+SNAPSHOT_EVERY_UPDATES = 100
+SNAPSHOT_EVERY_SECONDS = 300
+
+INITIAL_CAPACITY = 1024
+
+# 학습률 (피드백 수가 늘수록 1/sqrt로 감소)
+LEARNING_RATE = 0.5
+LEARNING_RATE_DECAY = 0.1
+# 설정 변경 시 새 설정 가중치의 반영 비율
+PREFERENCE_BLEND = 0.7
+# 추천 요청 시 요청 설정 가중치의 반영 비율 (저장된 가중치는 바꾸지 않음)
+REQUEST_BLEND = 0.5
+
+# 피드백 종류별 보상 (평점 피드백은 rating으로 계산)
+FEEDBACK_REWARDS = {
+    "completed": 1.0,
+    "bookmarked": 0.9,
+    "clicked": 0.7,
+    "skipped": 0.1,
+    "dismissed": 0.0,
+}
+
+# RecommendationEngine.score()와 같은 특성별 점수 배율
+_SCORE_SCALE = (GROUP_WEIGHTS / GROUP_WEIGHTS.sum())[COLUMN_GROUP]
+# 그룹 가중치가 큰 특성일수록 점수에 대한 기여가 커지므로 경사도 그만큼 크게 반영
+_GRADIENT_SCALE = (GROUP_WEIGHTS / GROUP_WEIGHTS.max())[COLUMN_GROUP]
+# 요청의 현재 레벨은 학습자의 현재 상태이므로 학습된 값 대신 그대로 사용
+_REQUEST_STATE_COLUMNS = np.asarray([name.startswith("level:") for _, name in COLUMNS])
+
+
+def feedback_reward(feedback_type: str, rating: Optional[float] = None, completed: Optional[bool] = None) -> Optional[float]:
+    """피드백 → [0, 1] 보상 (보상을 정할 수 없으면 None)"""
+    if rating is not None:
+        return min(max((rating - 1) / 4, 0.0), 1.0)
+    if completed is not None:
+        return 1.0 if completed else FEEDBACK_REWARDS["skipped"]
+    return FEEDBACK_REWARDS.get(feedback_type)
+
+
+class LearnerWeightStore:
+    """사용자별 가중치 벡터 저장소"""
+
+    def __init__(self, path: Optional[str] = SNAPSHOT_PATH, capacity: int = INITIAL_CAPACITY):
+        self.path = path
+        self._users: Dict[str, int] = {}
+        self._weights = np.zeros((capacity, len(COLUMNS)), dtype=np.float32)
+        self._counts = np.zeros(capacity, dtype=np.int32)
+        self._dirty = 0
+        self._snapshot_at = time.time()
+        self._saving = False
+        # 마지막 저장 이후 바뀐 사용자 → 변경 횟수 (다른 프로세스의 스냅샷을 합칠 때 덮어쓰지 않음)
+        self._touched: Dict[str, int] = {}
+        # 마지막으로 읽거나 쓴 스냅샷 파일 상태
+        self._stamp = None
+        if path and os.path.exists(path):
+            self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _row(self, user_id: str, initial: np.ndarray) -> int:
+        row = self._users.get(user_id)
+        if row is None:
+            row = len(self._users)
+            if row >= len(self._weights):
+                self._weights = np.concatenate([self._weights, np.zeros_like(self._weights)])
+                self._counts = np.concatenate([self._counts, np.zeros_like(self._counts)])
+            self._users[user_id] = row
+            self._weights[row] = initial
+        return row
+
+    def get(self, user_id: str) -> Optional[np.ndarray]:
+        self.refresh()
+        row = self._users.get(user_id)
+        return None if row is None else self._weights[row].astype(np.float64)
+
+    def personalized(self, user_id: Optional[str], request_weights: np.ndarray) -> np.ndarray:
+        """추천에 쓸 가중치 - 학습된 가중치가 있으면 요청 가중치와 혼합, 없으면 요청 가중치 그대로"""
+        learned = self.get(user_id) if user_id else None
+        if learned is None:
+            return request_weights
+        w = (1 - REQUEST_BLEND) * learned + REQUEST_BLEND * request_weights
+        w[_REQUEST_STATE_COLUMNS] = request_weights[_REQUEST_STATE_COLUMNS]
+        return w
+
+    def feedback_count(self, user_id: str) -> int:
+        row = self._users.get(user_id)
+        return 0 if row is None else int(self._counts[row])
+
+    def update(self, user_id: str, features: np.ndarray, reward: float, initial: np.ndarray) -> float:
+        """콘텐츠 피드백 1건 반영 - 반환값은 갱신 전 예측 점수"""
+        self.refresh()
+        row = self._row(user_id, initial)
+        w = self._weights[row]
+        predicted = float(features @ (w * _SCORE_SCALE))
+        rate = LEARNING_RATE / np.sqrt(1.0 + LEARNING_RATE_DECAY * self._counts[row])
+        w += (rate * (reward - predicted) * features * _GRADIENT_SCALE).astype(np.float32)
+        np.clip(w, 0.0, 1.0, out=w)
+        self._counts[row] += 1
+        self._touch(user_id)
+        return predicted
+
+    def blend(self, user_id: str, target: np.ndarray) -> None:
+        """설정 변경 반영 - 학습된 값과 새 설정 가중치의 가중 평균"""
+        self.refresh()
+        row = self._users.get(user_id)
+        if row is None:
+            self._row(user_id, target)
+        else:
+            self._weights[row] = (1 - PREFERENCE_BLEND) * self._weights[row] + PREFERENCE_BLEND * target
+        self._touch(user_id)
+
+    def _touch(self, user_id: str) -> None:
+        self._dirty += 1
+        self._touched[user_id] = self._touched.get(user_id, 0) + 1
+
+    def _saved(self, touched: Dict[str, int]) -> None:
+        """저장한 복사본에 들어간 변경 표시 해제 (저장하는 동안 다시 바뀐 사용자는 유지)"""
+        for user_id, count in touched.items():
+            if self._touched.get(user_id) == count:
+                del self._touched[user_id]
+        self._stamp = file_stamp(self.path)
+
+    def snapshot_due(self) -> bool:
+        return bool(self.path) and self._dirty > 0 and (
+            self._dirty >= SNAPSHOT_EVERY_UPDATES or time.time() - self._snapshot_at >= SNAPSHOT_EVERY_SECONDS
+        )
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """저장할 배열의 복사본 (저장 중에 갱신이 들어와도 스냅샷이 섞이지 않도록)"""
+        count = len(self._users)
+        return {
+            "users": np.asarray(list(self._users), dtype=str),
+            "weights": self._weights[:count].copy(),
+            "counts": self._counts[:count].copy(),
+            "columns": np.asarray([name for _, name in COLUMNS], dtype=str),
+        }
+
+    @staticmethod
+    def _write(path: str, arrays: Dict[str, np.ndarray]) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _lock_path(self, path: str) -> str:
+        return path + ".lock"
+
+    def snapshot(self, path: Optional[str] = None) -> None:
+        """현재 가중치를 파일로 저장 (동기 - 종료 시 사용)"""
+        path = path or self.path
+        if not path:
+            return
+        fd = acquire_lock(self._lock_path(path))
+        try:
+            if path == self.path:
+                self._merge(self._read_changed())
+            touched = dict(self._touched)
+            self._write(path, self._arrays())
+            if path == self.path:
+                self._saved(touched)
+        finally:
+            release_lock(fd)
+        self._dirty = 0
+        self._snapshot_at = time.time()
+
+    async def persist(self) -> None:
+        """스냅샷 주기가 되었으면 복사본을 스레드에서 저장 (이벤트 루프를 막지 않음, 동시에 하나만)"""
+        if self._saving or not self.snapshot_due():
+            return
+        self._saving = True
+        dirty = self._dirty
+        fd = None
+        try:
+            fd = await asyncio.to_thread(acquire_lock, self._lock_path(self.path))
+            # 잠금 안에서 다른 프로세스가 저장한 스냅샷을 먼저 합침
+            self._merge(await asyncio.to_thread(self._read_changed))
+            arrays, touched = self._arrays(), dict(self._touched)
+            await asyncio.to_thread(self._write, self.path, arrays)
+        except OSError as e:
+            print(f"⚠️ 추천 가중치 스냅샷 저장 실패: {e}")
+        else:
+            self._saved(touched)
+            # 저장하는 동안 들어온 갱신은 다음 스냅샷 대상으로 남김
+            self._dirty -= dirty
+            self._snapshot_at = time.time()
+        finally:
+            release_lock(fd)
+            self._saving = False
+
+    def refresh(self) -> None:
+        """스냅샷 파일이 마지막으로 읽거나 쓴 뒤 바뀌었으면(다른 프로세스가 저장) 합침 - 평소에는 stat 한 번"""
+        if self.path and file_stamp(self.path) != self._stamp:
+            self._merge(self._read_changed())
+
+    def _read_changed(self) -> Optional[Dict[str, Any]]:
+        """스냅샷 파일이 바뀌었으면 읽은 배열 (블로킹)"""
+        stamp = file_stamp(self.path)
+        if stamp is None or stamp == self._stamp:
+            return None
+        return self._read(self.path, stamp)
+
+    @staticmethod
+    def _read(path: str, stamp=None) -> Dict[str, Any]:
+        with np.load(path) as snapshot:
+            return {
+                "users": snapshot["users"].tolist(),
+                "weights": snapshot["weights"],
+                "counts": snapshot["counts"],
+                "columns": snapshot["columns"].tolist(),
+                "stamp": stamp,
+            }
+
+    def _merge(self, snapshot: Optional[Dict[str, Any]]) -> None:
+        """스냅샷 값으로 사용자 가중치 교체 - 마지막 저장 이후 이 프로세스에서 바뀐 사용자는 유지
+        (특성 열 구성이 바뀐 경우 이름이 같은 열만 복원, 나머지는 0.5)
+        """
+        if snapshot is None:
+            return
+        columns = snapshot["columns"]
+        source = [columns.index(name) if name in columns else -1 for _, name in COLUMNS]
+        weights = np.full((len(snapshot["users"]), len(COLUMNS)), 0.5, dtype=np.float32)
+        for target, column in enumerate(source):
+            if column >= 0:
+                weights[:, target] = snapshot["weights"][:, column]
+        for index, user_id in enumerate(snapshot["users"]):
+            if user_id in self._touched:
+                continue
+            row = self._row(user_id, weights[index])
+            self._weights[row] = weights[index]
+            self._counts[row] = snapshot["counts"][index]
+        self._stamp = snapshot["stamp"]
+
+    def load(self, path: str) -> None:
+        """스냅샷 복원 (특성 열 구성이 바뀐 경우 이름이 같은 열만 복원)"""
+        self._merge(self._read(path, file_stamp(path) if path == self.path else self._stamp))
+
+    def describe(self, user_id: str) -> Dict[str, Any]:
+        """가중치를 사람이 읽을 수 있는 설정 형태로 변환"""
+        w = self.get(user_id)
+        if w is None:
+            return {}
+        styles = np.asarray([w[COLUMN_INDEX[f"style:{style}"]] for style in LEARNING_STYLES])
+        styles = styles / styles.sum() if styles.sum() > 0 else np.full(len(styles), 1 / len(styles))
+        type_preferences = {content_type: round(float(w[COLUMN_INDEX[f"type:{content_type}"]]), 2) for content_type in CONTENT_TYPES}
+        return {
+            "learning_style_weights": {style: round(float(value), 2) for style, value in zip(LEARNING_STYLES, styles)},
+            "content_type_preferences": dict(sorted(type_preferences.items(), key=lambda item: -item[1])),
+            "preferred_content_types": [t for t, value in type_preferences.items() if value >= 0.75],
+            "theological_focus_level": int(round(w[COLUMN_INDEX["theological"]] * 100)),
+            "feedback_count": self.feedback_count(user_id),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_learner_weight_store() -> LearnerWeightStore:
+    """프로세스 전역 가중치 저장소 (스냅샷이 있으면 복원)"""
+    return LearnerWeightStore()
@@ -0,0 +1,152 @@
+"""
+문법 강의 목차 및 지연 로딩
+
+시작 시에는 각 강의 JSON 앞부분만 읽어 level/orderIndex/제목으로 목차를 만들고,
+본문(explanationKorean, grammarRules 등)은 처음 조회될 때 파싱한다.
+- 파싱한 강의는 미리 직렬화/압축한 응답(StaticJSONResponse)으로 LRU에 보관
+- 커리큘럼이 늘어도 시작 시간과 메모리가 강의 수에 비례해 커지지 않음
+"""
+
+import json
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any
+
+from src.lib.data_paths import CEFR_LEVELS, lesson_files, load_json
+from src.lib.response_cache import StaticJSONResponse
+
+# 목차 필드는 파일 앞쪽에 있으므로 앞부분만 읽음 (없으면 전체 파싱으로 대체)
+HEAD_BYTES = 2048
+MAX_CACHED_LESSONS = 32
+
+# 현재 형식 필드명 → 초기 형식 필드명
+_TOC_FIELDS = {
+    "level": ("level",),
+    "orderIndex": ("orderIndex", "order"),
+    "titleKorean": ("titleKorean", "title"),
+    "titleHungarian": ("titleHungarian",),
+}
+
+
+def _scan_field(head: str, name: str) -> Any:
+    """JSON 앞부분에서 최상위 스칼라 필드 값 추출 (없으면 None)"""
+    match = re.search(r'"%s"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+)' % re.escape(name), head)
+    return json.loads(match.group(1)) if match else None
+
+
+class LessonEntry:
+    """목차 항목"""
+    __slots__ = ("id", "path", "level", "order_index", "title_korean", "title_hungarian")
+
+    def __init__(self, lesson_id: str, path: str, fields: Dict[str, Any]):
+        self.id = lesson_id
+        self.path = path
+        self.level = (fields.get("level") or "").upper()
+        self.order_index = fields.get("orderIndex") or 0
+        self.title_korean = fields.get("titleKorean") or ""
+        self.title_hungarian = fields.get("titleHungarian")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "level": self.level,
+            "orderIndex": self.order_index,
+            "titleKorean": self.title_korean,
+            "titleHungarian": self.title_hungarian,
+        }
+
+
+def scan_lesson(lesson_id: str, path: str) -> LessonEntry:
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(HEAD_BYTES)
+
+    fields: Dict[str, Any] = {}
+    for field, candidates in _TOC_FIELDS.items():
+        for candidate in candidates:
+            value = _scan_field(head, candidate)
+            if value is not None:
+                fields[field] = value
+                break
+
+    if "level" not in fields or "orderIndex" not in fields:
+        # 필드 순서가 다른 파일 - 전체 파싱
+        lesson = load_json(path)
+        fields = {field: next((lesson[c] for c in candidates if c in lesson), None)
+                  for field, candidates in _TOC_FIELDS.items()}
+    return LessonEntry(lesson_id, path, fields)
+
+
+def lesson_payload(entry: LessonEntry) -> Dict[str, Any]:
+    """강의 본문 응답 payload (파일 전체 파싱)"""
+    return {"success": True, "data": {**load_json(entry.path), "id": entry.id}}
+
+
+def toc_payload(entries: List[LessonEntry], level: str = "") -> Dict[str, Any]:
+    """레벨별(빈 문자열이면 전체) 목차 응답 payload"""
+    lessons = [entry.to_dict() for entry in entries if not level or entry.level == level]
+    return {"success": True, "data": lessons, "count": len(lessons)}
+
+
+class LessonCatalog:
+    """목차 + 강의 본문 응답 LRU"""
+
+    def __init__(self, max_cached: int = MAX_CACHED_LESSONS):
+        self.max_cached = max_cached
+        entries = [scan_lesson(lesson_id, path) for lesson_id, path in lesson_files()]
+        entries.sort(key=lambda entry: (
+            CEFR_LEVELS.index(entry.level) if entry.level in CEFR_LEVELS else len(CEFR_LEVELS),
+            entry.order_index,
+            entry.id,
+        ))
+        self.entries = entries
+        self._by_id = {entry.id: entry for entry in entries}
+        self._toc_responses: Dict[str, StaticJSONResponse] = {}
+        self._lessons: "OrderedDict[str, StaticJSONResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_entry(self, lesson_id: str) -> Optional[LessonEntry]:
+        return self._by_id.get(lesson_id)
+
+    def toc(self, level: Optional[str] = None) -> StaticJSONResponse:
+        """레벨별(또는 전체) 목차 응답 - 필터 값마다 한 번만 직렬화"""
+        level = level.upper() if level and level.upper() in CEFR_LEVELS else ""
+        response = self._toc_responses.get(level)
+        if response is None:
+            response = StaticJSONResponse(toc_payload(self.entries, level))
+            self._toc_responses[level] = response
+        return response
+
+    def lesson(self, lesson_id: str) -> Optional[StaticJSONResponse]:
+        """강의 본문 응답 (처음 조회 시 파싱/압축 후 LRU에 보관)"""
+        response = self._lessons.get(lesson_id)
+        if response is not None:
+            self.hits += 1
+            self._lessons.move_to_end(lesson_id)
+            return response
+
+        entry = self._by_id.get(lesson_id)
+        if entry is None:
+            return None
+        self.misses += 1
+        response = StaticJSONResponse(lesson_payload(entry))
+        self._lessons[lesson_id] = response
+        while len(self._lessons) > self.max_cached:
+            self._lessons.popitem(last=False)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "lessons": len(self.entries),
+            "cached": len(self._lessons),
+            "cached_bytes": sum(len(r.body) + sum(map(len, r.variants.values())) for r in self._lessons.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_lesson_catalog() -> LessonCatalog:
+    """프로세스 전역 강의 목차"""
+    return LessonCatalog()
@@ -0,0 +1,78 @@
+"""
+레벨/경험치 곡선 테이블
+
+gamificationEngine.ts의 레벨 정의를 누적 포인트 임계값 배열로 미리 계산해 두고,
+이진 탐색으로 레벨을 결정한다.
+- 단일 사용자: resolve_level()
+- 대량 계산 (리더보드, 주간 재계산 작업): compute_level_profiles()
+"""
+
+from bisect import bisect_right
+from typing import List, Dict, Any
+
+import numpy as np
+
+# 레벨 정의 (gamificationEngine.ts initializeLevelDefinitions와 동일)
+LEVEL_DEFINITIONS: List[Dict[str, Any]] = [
+    {'level': 1, 'required_points': 0, 'title': '새싹 학습자', 'description': '헝가리어 여행의 시작', 'icon': '🌱', 'color': '#22c55e'},
+    {'level': 2, 'required_points': 100, 'title': '호기심 많은 탐험가', 'description': '첫 걸음을 뗀 당신', 'icon': '🌿', 'color': '#3b82f6'},
+    {'level': 3, 'required_points': 300, 'title': '열정적인 학생', 'description': '꾸준함이 빛나기 시작', 'icon': '🌳', 'color': '#8b5cf6'},
+    {'level': 4, 'required_points': 600, 'title': '성실한 수행자', 'description': '실력이 눈에 띄게 향상', 'icon': '⭐', 'color': '#f59e0b'},
+    {'level': 5, 'required_points': 1000, 'title': '노련한 학습자', 'description': '기초를 탄탄히 다진 상태', 'icon': '🏆', 'color': '#ef4444'},
+    {'level': 6, 'required_points': 1500, 'title': '헝가리어 애호가', 'description': '언어에 대한 사랑이 깊어짐', 'icon': '💎', 'color': '#06b6d4'},
+    {'level': 7, 'required_points': 2100, 'title': '실력있는 화자', 'description': '일상 대화가 자유로워짐', 'icon': '👑', 'color': '#84cc16'},
+    {'level': 8, 'required_points': 2800, 'title': '능숙한 의사소통자', 'description': '복잡한 주제도 표현 가능', 'icon': '🦅', 'color': '#f97316'},
+    {'level': 9, 'required_points': 3600, 'title': '헝가리어 전문가', 'description': '전문적 수준에 도달', 'icon': '🔥', 'color': '#a855f7'},
+    {'level': 10, 'required_points': 4500, 'title': '언어의 마스터', 'description': '원어민 수준의 실력', 'icon': '🌟', 'color': '#dc2626'},
+]
+
+MAX_LEVEL = LEVEL_DEFINITIONS[-1]['level']
+
+# 누적 포인트 임계값 (오름차순) - 인덱스 i는 레벨 i+1의 시작 포인트
+LEVEL_THRESHOLDS: List[int] = [d['required_points'] for d in LEVEL_DEFINITIONS]
+_THRESHOLD_ARRAY = np.asarray(LEVEL_THRESHOLDS, dtype=np.int64)
+
+# 다음 레벨 시작 포인트 (최대 레벨은 자기 자신의 임계값으로 채워 0이 되도록 함)
+_NEXT_THRESHOLD_ARRAY = np.append(_THRESHOLD_ARRAY[1:], _THRESHOLD_ARRAY[-1])
+
+# 레벨 인덱스 → 타이틀 (벡터 인덱싱용)
+_TITLE_ARRAY = np.asarray([d['title'] for d in LEVEL_DEFINITIONS], dtype=object)
+
+
+def resolve_level(total_points: int) -> Dict[str, Any]:
+    """총 포인트로 현재 레벨 정보 계산"""
+    index = max(0, bisect_right(LEVEL_THRESHOLDS, total_points) - 1)
+    definition = LEVEL_DEFINITIONS[index]
+
+    if definition['level'] == MAX_LEVEL:
+        next_required = None
+        points_to_next = 0
+    else:
+        next_required = LEVEL_THRESHOLDS[index + 1]
+        points_to_next = next_required - total_points
+
+    return {
+        "current_level": definition['level'],
+        "level_title": definition['title'],
+        "level_icon": definition['icon'],
+        "level_color": definition['color'],
+        "points_to_next_level": points_to_next,
+        "next_level_required_points": next_required,
+    }
+
+
+def compute_level_profiles(total_points: np.ndarray) -> Dict[str, np.ndarray]:
+    """여러 사용자의 레벨, 타이틀, 다음 레벨까지 남은 포인트를 한 번에 계산
+
+    total_points는 사용자별 총 포인트 1차원 배열이며, 반환되는 배열들은
+    입력과 같은 순서를 유지한다.
+    """
+    totals = np.asarray(total_points, dtype=np.int64)
+    indices = np.searchsorted(_THRESHOLD_ARRAY, totals, side='right') - 1
+    np.clip(indices, 0, len(LEVEL_THRESHOLDS) - 1, out=indices)
+
+    return {
+        "current_level": indices + 1,
+        "level_title": _TITLE_ARRAY[indices],
+        "points_to_next_level": np.maximum(_NEXT_THRESHOLD_ARRAY[indices] - totals, 0),
+    }
@@ -0,0 +1,367 @@
+"""
+문법 강의 문항 저장소 (메모리 맵 바이너리)
+
+grammar-lessons*/ JSON의 연습문제(practiceExercises)와 흔한 실수(commonMistakes)를
+4지선다 문항으로 컴파일해 하나의 바이너리 파일로 저장하고, 런타임에는 mmap으로 연다.
+- 고정 폭 레코드 배열 + UTF-8 문자열 테이블 (요청 시 JSON 파싱 없음)
+- 레코드는 (레벨, orderIndex, 강의) 순으로 정렬 - 레벨/강의별 조회는 구간 계산만으로 처리
+- 문법 주제(tags)별 레코드 번호 목록 (postings)
+- 파일이 없거나 강의 JSON보다 오래되면 처음 열 때 다시 컴파일
+
+빌드만 따로 실행: python -m src.services.question_store
+"""
+
+import mmap
+import os
+import re
+import struct
+import tempfile
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import BUILD_DIR, CEFR_LEVELS, lesson_files, load_json
+
+QUESTION_STORE_PATH = os.path.join(BUILD_DIR, "question_store.bin")
+
+MAGIC = b"HLQSTORE"
+FORMAT_VERSION = 1
+
+# 문항 종류
+KIND_CORRECTION = 0     # 흔한 실수 → 올바른 문장 고르기
+KIND_FILL_IN = 1        # 연습문제 → 빈칸/변형 정답 고르기
+KIND_NAMES = ("correction", "fill_in")
+
+OPTION_COUNT = 4
+MIN_OPTION_COUNT = 3
+CORRECTION_INSTRUCTION = "올바른 문장을 고르세요."
+
+STRING_REF = [("offset", "<u4"), ("length", "<u4")]
+RECORD_DTYPE = np.dtype([
+    ("id", STRING_REF),
+    ("lesson_id", STRING_REF),
+    ("instruction", STRING_REF),
+    ("prompt", STRING_REF),
+    ("answer", STRING_REF),
+    ("explanation", STRING_REF),
+    ("options_start", "<u4"),
+    ("option_count", "u1"),
+    ("level", "u1"),                # CEFR_LEVELS 인덱스
+    ("kind", "u1"),
+    ("difficulty_score", "u1"),
+    ("order_index", "<u2"),
+])
+OPTION_DTYPE = np.dtype(STRING_REF)
+TOPIC_DTYPE = np.dtype([("name", STRING_REF), ("postings_start", "<u4"), ("postings_count", "<u4")])
+POSTING_DTYPE = np.dtype("<u4")
+
+# magic, version, 레코드 수, 레벨별 시작 위치(레벨 수 + 1),
+# (offset, count) × 4 섹션 (records, options, topics, postings), 문자열 테이블 (offset, length)
+_HEADER = struct.Struct(f"<8sII{len(CEFR_LEVELS) + 1}I" + "QQ" * 5)
+
+_MARKER_RE = re.compile(r"^[❌✅\s]+")
+_TRAILING_NOTE_RE = re.compile(r"\s*\([^)]*\)[.\s]*$")
+_ALTERNATIVES_RE = re.compile(r"\s+/\s+|\s+또는\s+")
+
+
+def _clean(text: str) -> str:
+    """초기 형식 강의의 ❌/✅ 표시, 끝의 괄호 설명, 복수 정답(A / B, A 또는 B) 정리"""
+    text = _MARKER_RE.sub("", text or "").strip()
+    text = _TRAILING_NOTE_RE.sub("", text)
+    return _ALTERNATIVES_RE.split(text)[0].strip()
+
+
+# ---------------------------------------------------------------------------
+# 컴파일
+# ---------------------------------------------------------------------------
+
+def _lesson_questions(lesson_id: str, lesson: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """강의 하나의 문항 목록 (보기는 아직 정답 + 강의 내 오답만 포함)"""
+    content = lesson.get("content") or {}
+    questions = []
+
+    mistakes = lesson.get("commonMistakes") or content.get("commonMistakes") or []
+    for position, mistake in enumerate(mistakes):
+        wrong = _clean(mistake.get("mistake", ""))
+        correct = _clean(mistake.get("correct") or mistake.get("correction") or "")
+        if not wrong or not correct or wrong == correct:
+            continue
+        questions.append({
+            "id": f"{lesson_id}-m{position + 1:02d}",
+            "kind": KIND_CORRECTION,
+            "instruction": CORRECTION_INSTRUCTION,
+            "prompt": "",
+            "answer": correct,
+            "explanation": mistake.get("explanation", ""),
+            "distractors": [wrong],
+        })
+
+    exercises = lesson.get("practiceExercises") or content.get("practiceExercises") or []
+    for group_index, group in enumerate(exercises):
+        items = group.get("questions", [])
+        answers = [_clean(item.get("answer", "")) for item in items]
+        for position, item in enumerate(items):
+            prompt = item.get("question") or item.get("statement") or ""
+            if not prompt or not answers[position]:
+                continue
+            questions.append({
+                "id": f"{lesson_id}-e{group_index + 1}{position + 1:02d}",
+                "kind": KIND_FILL_IN,
+                "instruction": group.get("instruction", ""),
+                "prompt": prompt,
+                "answer": answers[position],
+                "explanation": item.get("explanation", ""),
+                # 같은 연습 그룹의 다른 정답이 가장 그럴듯한 오답
+                "distractors": [answer for answer in answers if answer and answer != answers[position]],
+            })
+    return questions
+
+
+def load_lesson_questions() -> List[Dict[str, Any]]:
+    """모든 강의 JSON → 정렬된 문항 목록 (보기 완성 포함)"""
+    questions = []
+    for lesson_id, path in lesson_files():
+        lesson = load_json(path)
+        level = lesson.get("level", "").upper()
+        if level not in CEFR_LEVELS:
+            continue
+        # 초기 형식은 difficulty(1~3), 현재 형식은 difficultyScore(1~7)
+        difficulty_score = lesson.get("difficultyScore") or (lesson.get("difficulty") or 2) * 2
+        for question in _lesson_questions(lesson_id, lesson):
+            question.update({
+                "lesson_id": lesson_id,
+                "level": CEFR_LEVELS.index(level),
+                "order_index": lesson.get("orderIndex") or lesson.get("order") or 0,
+                "difficulty_score": int(difficulty_score),
+                "topics": list(dict.fromkeys(lesson.get("tags") or [])),
+            })
+            questions.append(question)
+
+    questions.sort(key=lambda q: (q["level"], q["order_index"], q["lesson_id"], q["id"]))
+
+    # 같은 레벨/종류의 다른 문항 정답(교정 문항은 다른 실수 문장)으로 보기 채우기
+    pools: Dict[Tuple[int, int], List[str]] = {}
+    for question in questions:
+        pool = pools.setdefault((question["level"], question["kind"]), [])
+        pool.extend(question["distractors"] if question["kind"] == KIND_CORRECTION else [question["answer"]])
+
+    for index, question in enumerate(questions):
+        rng = np.random.default_rng(index)
+        options = [question["answer"]]
+        pool = pools[(question["level"], question["kind"])]
+        for candidate in question["distractors"] + [pool[i] for i in rng.permutation(len(pool))[:OPTION_COUNT * 2]]:
+            if len(options) >= OPTION_COUNT:
+                break
+            if candidate not in options:
+                options.append(candidate)
+        rng.shuffle(options)
+        question["options"] = options
+
+    return [question for question in questions if len(question["options"]) >= MIN_OPTION_COUNT]
+
+
+class _StringTable:
+    def __init__(self):
+        self.blob = bytearray()
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, text: str) -> Tuple[int, int]:
+        ref = self._offsets.get(text)
+        if ref is None:
+            encoded = text.encode("utf-8")
+            ref = (len(self.blob), len(encoded))
+            self.blob.extend(encoded)
+            self._offsets[text] = ref
+        return ref
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def compile_question_store(path: str = QUESTION_STORE_PATH) -> int:
+    """문항 저장소 파일 생성 (임시 파일에 쓴 뒤 교체) - 문항 수 반환"""
+    questions = load_lesson_questions()
+    strings = _StringTable()
+
+    records = np.zeros(len(questions), dtype=RECORD_DTYPE)
+    options: List[Tuple[int, int]] = []
+    postings_by_topic: Dict[str, List[int]] = {}
+    level_offsets = [0] * (len(CEFR_LEVELS) + 1)
+
+    for index, question in enumerate(questions):
+        record = records[index]
+        for field in ("id", "lesson_id", "instruction", "prompt", "answer", "explanation"):
+            record[field] = strings.add(question[field])
+        record["options_start"] = len(options)
+        record["option_count"] = len(question["options"])
+        options.extend(strings.add(option) for option in question["options"])
+        record["level"] = question["level"]
+        record["kind"] = question["kind"]
+        record["difficulty_score"] = question["difficulty_score"]
+        record["order_index"] = question["order_index"]
+        level_offsets[question["level"] + 1] = index + 1
+        for topic in question["topics"]:
+            postings_by_topic.setdefault(topic, []).append(index)
+
+    # 문항이 없는 레벨은 이전 레벨의 끝 위치를 이어받음
+    for level in range(1, len(level_offsets)):
+        level_offsets[level] = max(level_offsets[level], level_offsets[level - 1])
+
+    topic_names = sorted(postings_by_topic)
+    topics = np.zeros(len(topic_names), dtype=TOPIC_DTYPE)
+    postings: List[int] = []
+    for index, name in enumerate(topic_names):
+        topics[index] = (strings.add(name), len(postings), len(postings_by_topic[name]))
+        postings.extend(postings_by_topic[name])
+
+    sections = [
+        records.tobytes(),
+        np.asarray(options, dtype=OPTION_DTYPE).tobytes(),
+        topics.tobytes(),
+        np.asarray(postings, dtype=POSTING_DTYPE).tobytes(),
+        bytes(strings.blob),
+    ]
+    counts = [len(records), len(options), len(topics), len(postings), len(strings.blob)]
+
+    layout = []
+    offset = _aligned(_HEADER.size)
+    for section in sections:
+        layout.extend([offset, 0])
+        offset = _aligned(offset + len(section))
+    for position, count in enumerate(counts):
+        layout[position * 2 + 1] = count
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(records), *level_offsets, *layout))
+            for position, section in enumerate(sections):
+                f.write(b"\0" * (layout[position * 2] - f.tell()))
+                f.write(section)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return len(records)
+
+
+# ---------------------------------------------------------------------------
+# 런타임 조회
+# ---------------------------------------------------------------------------
+
+class QuestionStore:
+    """mmap으로 연 문항 저장소 (읽기 전용, 프로세스 간 페이지 공유)"""
+
+    def __init__(self, path: str = QUESTION_STORE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = _HEADER.unpack_from(self._mmap, 0)
+        magic, version, count = header[:3]
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} question store")
+        self._level_offsets = header[3:3 + len(CEFR_LEVELS) + 1]
+        layout = header[3 + len(CEFR_LEVELS) + 1:]
+
+        def section(position: int, dtype: np.dtype) -> np.ndarray:
+            return np.frombuffer(self._mmap, dtype=dtype, count=layout[position * 2 + 1], offset=layout[position * 2])
+
+        self.records = section(0, RECORD_DTYPE)
+        self._options = section(1, OPTION_DTYPE)
+        self._topics = section(2, TOPIC_DTYPE)
+        self._postings = section(3, POSTING_DTYPE)
+        self._strings_offset = layout[8]
+        self._topic_index: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def string(self, ref) -> str:
+        start = self._strings_offset + int(ref["offset"])
+        return self._mmap[start:start + int(ref["length"])].decode("utf-8")
+
+    def question(self, index: int) -> Dict[str, Any]:
+        record = self.records[index]
+        start = int(record["options_start"])
+        return {
+            "id": self.string(record["id"]),
+            "lesson_id": self.string(record["lesson_id"]),
+            "level": CEFR_LEVELS[record["level"]],
+            "order_index": int(record["order_index"]),
+            "kind": KIND_NAMES[record["kind"]],
+            "difficulty_score": int(record["difficulty_score"]),
+            "instruction": self.string(record["instruction"]),
+            "prompt": self.string(record["prompt"]),
+            "answer": self.string(record["answer"]),
+            "explanation": self.string(record["explanation"]),
+            "options": [self.string(option) for option in self._options[start:start + int(record["option_count"])]],
+        }
+
+    def level_indices(self, level: str) -> np.ndarray:
+        position = CEFR_LEVELS.index(level.upper())
+        return np.arange(self._level_offsets[position], self._level_offsets[position + 1])
+
+    def lesson_indices(self, level: str, order_index: int) -> np.ndarray:
+        """레벨 + orderIndex에 해당하는 문항 (레벨 구간 안에서 orderIndex는 정렬되어 있음)"""
+        position = CEFR_LEVELS.index(level.upper())
+        start, end = self._level_offsets[position], self._level_offsets[position + 1]
+        orders = self.records["order_index"][start:end]
+        return np.arange(
+            start + int(np.searchsorted(orders, order_index, side="left")),
+            start + int(np.searchsorted(orders, order_index, side="right")),
+        )
+
+    def topics(self) -> List[str]:
+        return [self.string(topic["name"]) for topic in self._topics]
+
+    def topic_indices(self, topic: str) -> np.ndarray:
+        if self._topic_index is None:
+            self._topic_index = {name: index for index, name in enumerate(self.topics())}
+        index = self._topic_index.get(topic)
+        if index is None:
+            return np.empty(0, dtype=POSTING_DTYPE)
+        entry = self._topics[index]
+        start = int(entry["postings_start"])
+        return self._postings[start:start + int(entry["postings_count"])]
+
+    def close(self) -> None:
+        # numpy 뷰가 버퍼를 참조하는 동안에는 mmap을 닫을 수 없으므로 먼저 해제
+        self.records = self._options = self._topics = self._postings = None
+        self._mmap.close()
+
+
+def _is_stale(path: str) -> bool:
+    if not os.path.exists(path):
+        return True
+    built_at = os.path.getmtime(path)
+    return any(os.path.getmtime(lesson_path) > built_at for _, lesson_path in lesson_files())
+
+
+def open_question_store(path: str = QUESTION_STORE_PATH) -> QuestionStore:
+    """저장소 열기 (없거나 오래되었거나 형식이 다르면 먼저 컴파일)"""
+    if _is_stale(path):
+        compile_question_store(path)
+    try:
+        return QuestionStore(path)
+    except ValueError:
+        compile_question_store(path)
+        return QuestionStore(path)
+
+
+@lru_cache(maxsize=1)
+def get_question_store() -> QuestionStore:
+    """프로세스 전역 문항 저장소"""
+    return open_question_store()
+
+
+if __name__ == "__main__":
+    count = compile_question_store()
+    store = QuestionStore()
+    print(f"{count} questions, {len(store.topics())} topics -> {QUESTION_STORE_PATH} ({os.path.getsize(QUESTION_STORE_PATH)} bytes)")
+    for level in CEFR_LEVELS:
+        print(f"  {level}: {len(store.level_indices(level))}")
@@ -0,0 +1,497 @@
+"""
+개인화 콘텐츠 추천 점수 계산
+
+모든 콘텐츠(문법 강의, 어휘 주제, 신학 용어 묶음)를 하나의 특성 행렬 X로,
+학습자를 가중치 벡터 w로 표현한다.
+- 전체 점수: 행렬-벡터 곱 한 번 (X @ v, v = w × 그룹 가중치)
+- 상위 k개: argpartition 후 k개만 정렬
+- 세부 점수/추천 이유 문자열은 반환하는 항목에 대해서만 계산
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import CEFR_LEVELS, data_path, lesson_files, load_json
+from src.services.curriculum_graph import CurriculumGraph, get_curriculum_graph, iter_bits
+from src.services.session_planner import SessionPlanner, state_hash
+from src.services.term_search import fold, get_term_search_index
+
+CONTENT_TYPES = (
+    "grammar", "vocabulary", "writing", "reading",
+    "theological_terms", "sermon_writing", "translation", "cultural_context",
+)
+SKILLS = ("grammar", "vocabulary", "reading", "writing", "listening", "speaking")
+LEARNING_STYLES = ("visual", "auditory", "kinesthetic", "reading_writing")
+GOALS = ("sermon", "daily")
+
+# 점수 그룹 → 응답 필드명, 기본 그룹 가중치
+SCORE_GROUPS = (
+    ("relevance", "relevance_score", 0.20),
+    ("difficulty_match", "difficulty_match_score", 0.20),
+    ("learning_style", "learning_style_match", 0.10),
+    ("goal_alignment", "goal_alignment", 0.15),
+    ("korean_adaptation", "korean_adaptation", 0.10),
+    ("theological_focus", "theological_focus", 0.15),
+    ("predicted_engagement", "predicted_engagement", 0.10),
+)
+GROUP_NAMES = tuple(name for name, _, _ in SCORE_GROUPS)
+GROUP_WEIGHTS = np.asarray([weight for _, _, weight in SCORE_GROUPS], dtype=np.float64)
+
+# 특성 열 (그룹별로 연속 배치 - reduceat으로 그룹 합계 계산)
+COLUMNS: List[Tuple[str, str]] = (
+    [("relevance", f"type:{t}") for t in CONTENT_TYPES]
+    + [("relevance", f"skill:{s}") for s in SKILLS]
+    + [("difficulty_match", f"level:{level}") for level in CEFR_LEVELS]
+    + [("learning_style", f"style:{s}") for s in LEARNING_STYLES]
+    + [("goal_alignment", f"goal:{g}") for g in GOALS]
+    + [("korean_adaptation", "korean")]
+    + [("theological_focus", "theological")]
+    + [("predicted_engagement", "engagement")]
+)
+COLUMN_INDEX = {name: index for index, (_, name) in enumerate(COLUMNS)}
+COLUMN_GROUP = np.asarray([GROUP_NAMES.index(group) for group, _ in COLUMNS], dtype=np.int64)
+GROUP_STARTS = np.asarray([int(np.argmax(COLUMN_GROUP == g)) for g in range(len(GROUP_NAMES))], dtype=np.int64)
+
+# 그룹 점수가 이 값 이상일 때 추천 이유로 표시
+REASON_THRESHOLD = 0.6
+MAX_REASONS = 3
+GROUP_REASONS = {
+    "relevance": "선호 콘텐츠 유형 및 보완이 필요한 영역과 일치",
+    "difficulty_match": "현재 레벨에 적합한 난이도",
+    "learning_style": "학습 스타일에 맞는 구성",
+    "goal_alignment": "설교 목표와 높은 일치도",
+    "korean_adaptation": "한국인 학습자 특화",
+    "theological_focus": "신학 특화 콘텐츠",
+    "predicted_engagement": "짧고 집중하기 좋은 분량",
+}
+
+SUGGESTED_APPROACH = {
+    "grammar": "한국어와 비교하며 차이점을 파악하세요",
+    "vocabulary": "예문과 함께 소리 내어 읽으며 익히세요",
+    "theological_terms": "실제 설교 맥락에서 사용법을 연습하세요",
+}
+FOLLOW_UP_SUGGESTIONS = {
+    "grammar": ["연습 문제 풀기", "실제 문장에서 적용해보기"],
+    "vocabulary": ["관련 어휘 복습하기", "실제 대화에서 사용해보기"],
+    "theological_terms": ["설교문에 용어 적용해보기", "관련 성경 구절 읽기"],
+}
+
+THEOLOGICAL_CATEGORIES = {
+    "theology", "theological_core", "christology", "soteriology", "biblical_terms",
+    "prayer_devotion", "faith_concepts", "church_life", "church_activity", "church_basics",
+}
+
+# 기본 학습자 설정 (프론트엔드 RecommendationSettings 기본값과 동일)
+DEFAULT_PREFERENCES: Dict[str, Any] = {
+    "preferred_content_types": ["theological_terms", "grammar"],
+    "difficulty_preference": "appropriate",
+    "theological_focus_level": 80,
+    "learning_style_weights": {"visual": 25, "auditory": 25, "kinesthetic": 25, "reading_writing": 25},
+    "korean_specific_challenges": True,
+}
+DIFFICULTY_SHIFT = {"easy": -0.5, "appropriate": 0.0, "challenging": 0.5}
+LEVEL_SIGMA = 0.6
+
+DEFAULT_SESSION_MINUTES = 30
+# 시간이 지정되지 않았을 때 세션 유형별 기본 예산 (분)
+SESSION_TYPE_MINUTES = {
+    "quick_review": 10,
+    "intensive_study": 45,
+    "assessment_prep": 30,
+    "free_study": DEFAULT_SESSION_MINUTES,
+}
+# 워밍업/복습에 쓰는 짧은 콘텐츠 기준 (분)
+SHORT_CONTENT_MINUTES = 10
+
+
+# ---------------------------------------------------------------------------
+# 콘텐츠 → 특성 행
+# ---------------------------------------------------------------------------
+
+def _engagement(duration: float) -> float:
+    """짧은 콘텐츠일수록 완료 가능성이 높다는 사전 추정"""
+    return 1.0 - min(duration, 90) / 120
+
+
+def _feature_row(
+    content_type: str,
+    skills: List[str],
+    level: str,
+    styles: Dict[str, float],
+    sermon: float,
+    korean: float,
+    theological: float,
+    duration: float,
+) -> np.ndarray:
+    """그룹별 점수가 [0, 1]이 되도록 각 그룹 안의 특성을 정규화"""
+    row = np.zeros(len(COLUMNS), dtype=np.float64)
+    row[COLUMN_INDEX[f"type:{content_type}"]] = 0.5
+    for skill in skills:
+        row[COLUMN_INDEX[f"skill:{skill}"]] = 0.5 / len(skills)
+    row[COLUMN_INDEX[f"level:{level}"]] = 1.0
+    total_style = sum(styles.values())
+    for style, value in styles.items():
+        row[COLUMN_INDEX[f"style:{style}"]] = value / total_style
+    row[COLUMN_INDEX["goal:sermon"]] = sermon
+    row[COLUMN_INDEX["goal:daily"]] = 1.0 - sermon
+    row[COLUMN_INDEX["korean"]] = korean
+    row[COLUMN_INDEX["theological"]] = theological
+    row[COLUMN_INDEX["engagement"]] = _engagement(duration)
+    return row
+
+
+def _lesson_content(lesson_id: str, lesson: Dict[str, Any]) -> Tuple[Dict[str, Any], np.ndarray]:
+    content = lesson.get("content") or {}
+    level = lesson["level"].upper()
+    tags = lesson.get("tags") or []
+    rules = (lesson.get("grammarRules") or {}).get("rules") or []
+    theological_examples = lesson.get("theologicalExamples") or []
+    duration = lesson.get("estimatedDuration") or 30
+    has_examples = bool(lesson.get("examples") or content.get("examples"))
+
+    if lesson.get("theologicalRelevance"):
+        theological = 0.5 + 0.5 * min(len(theological_examples), 5) / 5
+    else:
+        theological = 0.3 if theological_examples else 0.1
+
+    item = {
+        "id": lesson_id,
+        "title": lesson.get("titleKorean") or lesson.get("title", ""),
+        "content_type": "grammar",
+        "difficulty_level": level,
+        "skill_areas": ["grammar", "reading"] if has_examples else ["grammar"],
+        "estimated_duration_minutes": duration,
+        "learning_objectives": lesson.get("objectives") or [rule["title"] for rule in rules[:3] if rule.get("title")],
+        "tags": tags,
+        "theological_relevance": round(theological * 100),
+    }
+    styles = {
+        "visual": 1.0 if any(rule.get("table") for rule in rules) else 0.3,
+        "auditory": 0.2,
+        "kinesthetic": 0.6 if lesson.get("commonMistakes") or content.get("practiceExercises") else 0.2,
+        "reading_writing": 1.0,
+    }
+    row = _feature_row(
+        "grammar", item["skill_areas"], level, styles,
+        sermon=1.0 if "설교" in tags else (0.6 if theological_examples else 0.2),
+        korean=1.0 if lesson.get("koreanInterferenceNotes") or lesson.get("comparisonWithKorean") else 0.6,
+        theological=theological,
+        duration=duration,
+    )
+    return item, row
+
+
+def _vocabulary_topic_content(level: str, topic: Dict[str, Any]) -> Tuple[Dict[str, Any], np.ndarray]:
+    words = topic["words"]
+    theological = 1.0 if topic["id"] in THEOLOGICAL_CATEGORIES else 0.1
+    duration = max(5, len(words))
+    item = {
+        "id": f"vocab_{level.lower()}_{topic['id']}",
+        "title": f"{topic.get('title', topic['id'])} 어휘",
+        "content_type": "vocabulary",
+        "difficulty_level": level,
+        "skill_areas": ["vocabulary", "speaking"],
+        "estimated_duration_minutes": duration,
+        "learning_objectives": [f"{topic.get('title', topic['id'])} 관련 어휘 {len(words)}개 습득"],
+        "tags": ["어휘", level],
+        "theological_relevance": round(theological * 100),
+    }
+    styles = {"visual": 0.5, "auditory": 1.0, "kinesthetic": 0.3, "reading_writing": 0.6}
+    row = _feature_row(
+        "vocabulary", item["skill_areas"], level, styles,
+        sermon=0.8 if theological > 0.5 else 0.1, korean=0.7, theological=theological, duration=duration,
+    )
+    return item, row
+
+
+def _theological_term_contents() -> List[Tuple[Dict[str, Any], np.ndarray]]:
+    """신학 범주 용어를 레벨별 묶음 콘텐츠로 구성"""
+    by_level: Dict[str, List[Dict[str, Any]]] = {}
+    for document in get_term_search_index().documents:
+        level = document["difficulty_level"].upper()
+        if fold(document["category"]) in THEOLOGICAL_CATEGORIES and level in CEFR_LEVELS:
+            by_level.setdefault(level, []).append(document)
+
+    contents = []
+    for level, documents in by_level.items():
+        duration = max(10, math.ceil(len(documents) * 1.5))
+        item = {
+            "id": f"theol_{level.lower()}",
+            "title": f"신학 핵심 어휘 ({level})",
+            "content_type": "theological_terms",
+            "difficulty_level": level,
+            "skill_areas": ["vocabulary", "reading"],
+            "estimated_duration_minutes": duration,
+            "learning_objectives": [f"신학 핵심 용어 {len(documents)}개 습득", "설교문 속 용어 활용"],
+            "tags": ["신학", "어휘", level],
+            "theological_relevance": 100,
+        }
+        styles = {"visual": 0.3, "auditory": 0.5, "kinesthetic": 0.3, "reading_writing": 1.0}
+        row = _feature_row(
+            "theological_terms", item["skill_areas"], level, styles,
+            sermon=0.9, korean=0.5, theological=1.0, duration=duration,
+        )
+        contents.append((item, row))
+    return contents
+
+
+def load_content_catalog() -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """추천 대상 콘텐츠와 특성 행렬"""
+    contents = []
+    for lesson_id, path in lesson_files():
+        lesson = load_json(path)
+        if lesson.get("level", "").upper() in CEFR_LEVELS:
+            contents.append(_lesson_content(lesson_id, lesson))
+    for level in CEFR_LEVELS:
+        for topic in load_json(data_path("vocabulary", f"{level.lower()}.json"))["topics"]:
+            contents.append(_vocabulary_topic_content(level, topic))
+    contents.extend(_theological_term_contents())
+
+    items = [item for item, _ in contents]
+    features = np.vstack([row for _, row in contents])
+    return items, features
+
+
+# ---------------------------------------------------------------------------
+# 학습자 → 가중치 벡터
+# ---------------------------------------------------------------------------
+
+def learner_weights(
+    current_level: str = "A2",
+    preferences: Optional[Dict[str, Any]] = None,
+    weak_skills: Optional[List[str]] = None,
+) -> np.ndarray:
+    """학습자 설정 → 특성 가중치 w (각 값은 [0, 1])"""
+    preferences = {**DEFAULT_PREFERENCES, **(preferences or {})}
+    weak_skills = set(weak_skills or ())
+    w = np.zeros(len(COLUMNS), dtype=np.float64)
+
+    preferred = set(preferences.get("preferred_content_types") or ())
+    for content_type in CONTENT_TYPES:
+        w[COLUMN_INDEX[f"type:{content_type}"]] = 1.0 if content_type in preferred else 0.5
+    for skill in SKILLS:
+        w[COLUMN_INDEX[f"skill:{skill}"]] = 1.0 if skill in weak_skills else 0.4
+
+    level_index = CEFR_LEVELS.index(current_level) if current_level in CEFR_LEVELS else 1
+    target = level_index + DIFFICULTY_SHIFT.get(preferences.get("difficulty_preference"), 0.0)
+    for index, level in enumerate(CEFR_LEVELS):
+        w[COLUMN_INDEX[f"level:{level}"]] = math.exp(-((index - target) ** 2) / (2 * LEVEL_SIGMA ** 2))
+
+    styles = preferences.get("learning_style_weights") or DEFAULT_PREFERENCES["learning_style_weights"]
+    largest = max([styles.get(style, 0) for style in LEARNING_STYLES] + [1e-9])
+    for style in LEARNING_STYLES:
+        w[COLUMN_INDEX[f"style:{style}"]] = styles.get(style, 0) / largest
+
+    w[COLUMN_INDEX["goal:sermon"]] = 1.0
+    w[COLUMN_INDEX["goal:daily"]] = 0.5
+    w[COLUMN_INDEX["korean"]] = 1.0 if preferences.get("korean_specific_challenges") else 0.3
+    w[COLUMN_INDEX["theological"]] = min(max(preferences.get("theological_focus_level", 80) / 100, 0.0), 1.0)
+    w[COLUMN_INDEX["engagement"]] = 1.0
+    return w
+
+
+# ---------------------------------------------------------------------------
+# 점수 계산
+# ---------------------------------------------------------------------------
+
+class RecommendationEngine:
+    """특성 행렬 기반 추천기"""
+
+    def __init__(self, items: List[Dict[str, Any]], features: np.ndarray, curriculum: Optional[CurriculumGraph] = None):
+        self.items = items
+        self.features = features
+        self._by_id = {item["id"]: index for index, item in enumerate(items)}
+        self.durations = np.asarray([item["estimated_duration_minutes"] for item in items], dtype=np.float64)
+        self.minutes = np.ceil(self.durations).astype(np.int64)
+        self.short = self.durations <= SHORT_CONTENT_MINUTES
+        self.levels = np.asarray([CEFR_LEVELS.index(item["difficulty_level"]) for item in items], dtype=np.int64)
+        # 기술 영역별 포함 여부 (skill × item) - 영역별 보완 콘텐츠 선택용
+        self.skill_masks = {
+            skill: np.asarray([skill in item["skill_areas"] for item in items]) for skill in SKILLS
+        }
+        self.planner = SessionPlanner()
+        # 항목별 커리큘럼 노드 번호 (문법 강의가 아니면 -1)
+        self.curriculum = curriculum
+        self.lesson_nodes = np.asarray(
+            [curriculum.index.get(item["id"], -1) if curriculum else -1 for item in items], dtype=np.int64
+        )
+
+    def index_of(self, content_id: str) -> Optional[int]:
+        return self._by_id.get(content_id)
+
+    def score(self, w: np.ndarray, time_available_minutes: Optional[float] = None,
+              group_weights: np.ndarray = GROUP_WEIGHTS) -> np.ndarray:
+        """전체 콘텐츠 점수 (0~1) - 행렬-벡터 곱 한 번"""
+        v = w * (group_weights / group_weights.sum())[COLUMN_GROUP]
+        scores = self.features @ v
+        if time_available_minutes:
+            # 남은 시간에 들어가지 않는 콘텐츠는 절반으로 감점
+            scores = np.where(self.durations > time_available_minutes, scores * 0.5, scores)
+        return scores
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """점수 상위 k개 인덱스 (내림차순) - 전체 정렬 없이 argpartition"""
+        if mask is not None:
+            scores = np.where(mask, scores, -np.inf)
+            k = min(k, int(mask.sum()))
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    def group_scores(self, indices: np.ndarray, w: np.ndarray) -> np.ndarray:
+        """선택된 항목의 그룹별 점수 (len(indices) × 그룹 수)"""
+        return np.add.reduceat(self.features[indices] * w, GROUP_STARTS, axis=1)
+
+    def explain(self, indices: np.ndarray, scores: np.ndarray, w: np.ndarray, learner_level: str,
+                group_weights: np.ndarray = GROUP_WEIGHTS, detailed: bool = True) -> List[Dict[str, Any]]:
+        """반환 항목의 세부 점수, 추천 이유, 개인화 정보"""
+        if len(indices) == 0:
+            return []
+        groups = self.group_scores(indices, w)
+        contributions = groups * group_weights
+        learner_index = CEFR_LEVELS.index(learner_level) if learner_level in CEFR_LEVELS else 1
+
+        results = []
+        for row, index in enumerate(indices.tolist()):
+            item = self.items[index]
+            order = np.argsort(-contributions[row])
+            reasoning = [GROUP_REASONS[GROUP_NAMES[g]] for g in order[:MAX_REASONS] if groups[row, g] >= REASON_THRESHOLD]
+            recommendation_score: Dict[str, Any] = {"total_score": int(round(scores[index] * 100))}
+            if detailed:
+                for g, (_, field, _) in enumerate(SCORE_GROUPS):
+                    recommendation_score[field] = int(round(groups[row, g] * 100))
+            recommendation_score["reasoning"] = reasoning
+
+            entry = {"content_item": item, "recommendation_score": recommendation_score}
+            if detailed:
+                gap = self.levels[index] - learner_index
+                adjusted = "easy" if gap < 0 else ("appropriate" if gap == 0 else "challenging")
+                factor = {"easy": 0.9, "appropriate": 1.0, "challenging": 1.2}[adjusted]
+                entry["personalization_factors"] = {
+                    "adjusted_difficulty": adjusted,
+                    "estimated_completion_time": int(round(item["estimated_duration_minutes"] * factor)),
+                    "suggested_approach": SUGGESTED_APPROACH.get(item["content_type"], ""),
+                    "prerequisite_check": bool(gap <= 1),
+                    "follow_up_suggestions": FOLLOW_UP_SUGGESTIONS.get(item["content_type"], []),
+                }
+            results.append(entry)
+        return results
+
+    def recommend(
+        self,
+        w: np.ndarray,
+        current_level: str = "A2",
+        weak_skills: Optional[List[str]] = None,
+        time_available_minutes: Optional[float] = None,
+        session_type: str = "intensive_study",
+        completed_lessons: int = 0,
+        primary_count: int = 3,
+        alternative_count: int = 3,
+        group_weights: np.ndarray = GROUP_WEIGHTS,
+    ) -> Dict[str, Any]:
+        scores = self.score(w, time_available_minutes, group_weights)
+        ranked = self.top_k(scores, primary_count + alternative_count)
+        primary, alternatives = ranked[:primary_count], ranked[primary_count:]
+
+        # 보완이 필요한 영역: 약점 영역 우선, 그 다음 가중치 순
+        skill_weights = {skill: w[COLUMN_INDEX[f"skill:{skill}"]] for skill in SKILLS}
+        priority_order = sorted(SKILLS, key=lambda skill: (-skill_weights[skill], SKILLS.index(skill)))
+        identified_gaps = [skill for skill in priority_order if skill in set(weak_skills or ())]
+        gap_content = np.empty(0, dtype=np.int64)
+        if identified_gaps:
+            mask = self.skill_masks[identified_gaps[0]].copy()
+            mask[ranked] = False
+            gap_content = self.top_k(scores, 2, mask)
+
+        learner_index = CEFR_LEVELS.index(current_level) if current_level in CEFR_LEVELS else 1
+        explain = lambda indices, detailed=True: self.explain(indices, scores, w, current_level, group_weights, detailed)
+        milestone = self.milestone_path(scores, current_level, completed_lessons)
+
+        return {
+            "primary_recommendations": explain(primary),
+            "alternative_options": explain(alternatives, detailed=False),
+            "skill_gap_analysis": {
+                "identified_gaps": identified_gaps,
+                "priority_order": priority_order[:3],
+                "gap_closing_content": explain(gap_content),
+                "blocking_lessons": milestone["blocking_lessons"],
+            },
+            "learning_path_integration": {
+                "current_milestone": milestone["current_milestone"],
+                "milestone_lesson_id": milestone["milestone_lesson_id"],
+                "remaining_lessons": milestone["remaining_lessons"],
+                "next_milestone_content": explain(milestone["content"]),
+            },
+            "session_plan": self.plan_session(
+                scores,
+                time_available_minutes or SESSION_TYPE_MINUTES.get(session_type, DEFAULT_SESSION_MINUTES),
+                learner_index,
+                explain,
+            ),
+        }
+
+    def milestone_path(self, scores: np.ndarray, current_level: str, completed_lessons: int = 0) -> Dict[str, Any]:
+        """다음 마일스톤(레벨 복습 강의)까지 남은 강의와 지금 바로 학습 가능한 강의
+
+        기록이 없는 이전 레벨 강의는 완료한 것으로 본다.
+        """
+        learner_index = CEFR_LEVELS.index(current_level) if current_level in CEFR_LEVELS else 1
+        next_level = CEFR_LEVELS[min(learner_index + 1, len(CEFR_LEVELS) - 1)]
+        graph = self.curriculum
+        completed = completed_lessons | (graph.levels_below(current_level) if graph else 0)
+        milestone = graph.next_milestone(completed, current_level) if graph else None
+        if milestone is None:
+            # 커리큘럼을 모두 마쳤거나 그래프가 없으면 다음 레벨 콘텐츠
+            return {
+                "current_milestone": f"{next_level} 준비 단계",
+                "milestone_lesson_id": None,
+                "remaining_lessons": 0,
+                "blocking_lessons": [],
+                "content": self.top_k(scores, 2, self.levels == CEFR_LEVELS.index(next_level)),
+            }
+
+        gaps = graph.gaps(completed, milestone)
+        ready = gaps & graph.unlocked(completed)
+        ready_nodes = np.fromiter(iter_bits(ready), dtype=np.int64)
+        milestone_level = graph.nodes[graph.index[milestone]].level
+        milestone_index = CEFR_LEVELS.index(milestone_level)
+        return {
+            "current_milestone": (
+                f"{CEFR_LEVELS[milestone_index + 1]} 준비 단계" if milestone_index + 1 < len(CEFR_LEVELS)
+                else f"{milestone_level} 완성 단계"
+            ),
+            "milestone_lesson_id": milestone,
+            "remaining_lessons": gaps.bit_count(),
+            # 아직 선수 강의가 남아 바로 시작할 수 없는 강의
+            "blocking_lessons": graph.describe(gaps & ~ready),
+            "content": self.top_k(scores, 2, np.isin(self.lesson_nodes, ready_nodes)),
+        }
+
+    def plan_session(self, scores: np.ndarray, budget_minutes: float, learner_index: int, explain) -> Dict[str, Any]:
+        """시간 예산 안에서 점수 합이 최대가 되도록 워밍업/본 학습/복습 배치
+
+        워밍업은 짧은 콘텐츠, 복습은 학습자 레벨 이하의 짧은 콘텐츠 중에서 고른다.
+        같은 점수 벡터와 예산이면 이전 계획을 재사용한다.
+        """
+        budget = int(budget_minutes)
+        review_mask = self.short & (self.levels <= learner_index)
+        plan = self.planner.plan(state_hash(scores, learner_index), scores, self.minutes, budget, self.short, review_mask)
+        as_indices = lambda indices: np.asarray(indices, dtype=np.int64)
+        return {
+            "warm_up_content": explain(as_indices(plan.warm_up)),
+            "main_content": explain(as_indices(plan.main)),
+            "review_content": explain(as_indices(plan.review)),
+            "total_estimated_time": plan.total_minutes,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_recommendation_engine() -> RecommendationEngine:
+    """프로세스 전역 추천기 (최초 호출 시 콘텐츠 특성 행렬 생성)"""
+    return RecommendationEngine(*load_content_catalog(), curriculum=get_curriculum_graph())
@@ -0,0 +1,432 @@
+"""
+설교 초안 저장소 (리비전 이력은 델타 + 주기적 전체 스냅샷)
+
+자동 저장이 몇 초마다 긴 원고 전체를 보내더라도 디스크에는 바뀐 부분만 기록한다.
+- 초안마다 줄 단위 JSON 로그 하나 ({사용자 해시}/{초안 id}.log), 리비전 하나 = 한 줄 추가
+- 리비전 내용은 직전 리비전 대비 델타 [시작, 끝, 삽입 문자열] (공통 접두/접미사를 뺀 나머지)
+- 마지막 스냅샷 이후 리비전이 SNAPSHOT_INTERVAL개가 되거나 델타 누적 크기가 원고 크기를 넘으면 전체 스냅샷
+  → 과거 리비전 복원은 가장 가까운 스냅샷에서 시작해 델타를 최대 SNAPSHOT_INTERVAL개 적용
+- 메모리에는 리비전별 파일 offset과 현재 본문만 유지 (최근 사용자만)
+  → 로그를 읽을 때는 줄 머리(rev, at)만 훑어 offset을 모으고, 본문은 마지막 스냅샷부터만 복원
+- 쓰기는 로그 파일에 배타적 advisory lock을 잡고 파일 크기가 색인과 다르면(다른 프로세스가 기록) 먼저 따라잡음
+- 초안 목록은 (수정 시각, id) 키셋 커서로 페이지 조회 (offset 없이 이어서 조회)
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from bisect import bisect_right, insort
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+from src.lib.data_paths import STATE_DIR
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DRAFT_DIR = os.path.join(STATE_DIR, "sermons")
+
+SNAPSHOT_INTERVAL = 256
+MAX_CACHED_USERS = 256
+
+# 리비전과 함께 기록되는 메타데이터 (델타에는 바뀐 값만, 스냅샷에는 전체)
+META_FIELDS = ("title", "scripture_reference")
+
+Delta = Tuple[int, int, str]
+
+# 로그 줄 머리 - json.dumps 기본 구분자 기준, 본문 문자열 안의 따옴표는 이스케이프되므로 키로만 나타남
+_HEAD_RE = re.compile(rb'\{"rev": (\d+), "at": ([^,}]+)')
+_SNAPSHOT_KEY = b'"full": '
+
+
+class DraftError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """공통 접두사 길이 (슬라이스 비교로 이진 탐색)"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def make_delta(old: str, new: str) -> Delta:
+    """old → new 델타 (한 구간 치환) - 이어지는 편집 한 번이면 편집 크기만큼만 기록됨"""
+    prefix = _common_prefix(old, new)
+    limit = min(len(old), len(new)) - prefix
+    suffix = _common_prefix(old[::-1][:limit], new[::-1][:limit])
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
+
+
+def apply_delta(text: str, delta: Delta) -> str:
+    start, end, inserted = delta
+    if not 0 <= start <= end <= len(text):
+        raise DraftError(400, f"Delta out of range: [{start}, {end}] for length {len(text)}")
+    return text[:start] + inserted + text[end:]
+
+
+def encode_cursor(updated_at: float, draft_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{updated_at!r}|{draft_id}".encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    try:
+        updated_at, draft_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+        return float(updated_at), draft_id
+    except (ValueError, UnicodeError):
+        raise DraftError(400, "Invalid cursor")
+
+
+class SermonDraft:
+    """초안 하나의 리비전 색인과 현재 본문"""
+    __slots__ = ("id", "path", "meta", "created_at", "updated_at", "content", "size",
+                 "offsets", "times", "snapshots", "delta_bytes", "since_snapshot")
+
+    def __init__(self, draft_id: str, path: str):
+        self.id = draft_id
+        self.path = path
+        self.meta: Dict[str, Optional[str]] = {field: None for field in META_FIELDS}
+        self.created_at = 0.0
+        self.updated_at = 0.0
+        self.content = ""
+        self.size = 0                    # 로그 파일 크기
+        self.offsets: List[int] = []     # 리비전 번호 - 1 → 로그 파일 offset
+        self.times: List[float] = []
+        self.snapshots: List[int] = []   # 전체 스냅샷 리비전 번호 (오름차순)
+        self.delta_bytes = 0             # 마지막 스냅샷 이후 델타 누적 크기
+        self.since_snapshot = 0
+
+    @property
+    def revision(self) -> int:
+        return len(self.offsets)
+
+    def _reset(self) -> None:
+        self.meta = {field: None for field in META_FIELDS}
+        self.created_at = self.updated_at = 0.0
+        self.content = ""
+        self.size = 0
+        self.offsets, self.times, self.snapshots = [], [], []
+        self.delta_bytes = self.since_snapshot = 0
+
+    def _scan(self, f) -> bool:
+        """self.size부터 온전한 줄의 offset/시각/스냅샷 여부만 색인 (JSON 디코딩 없음) - 새 줄이 있었는지 반환"""
+        f.seek(self.size)
+        offset = self.size
+        for line in f:
+            match = _HEAD_RE.match(line)
+            if not line.endswith(b"\n") or match is None:
+                break
+            self.offsets.append(offset)
+            self.times.append(float(match.group(2)))
+            if _SNAPSHOT_KEY in line:
+                self.snapshots.append(int(match.group(1)))
+            offset += len(line)
+        grew = offset != self.size
+        self.size = offset
+        return grew
+
+    def _rebuild_head(self) -> None:
+        """현재 본문/메타데이터를 마지막 스냅샷부터 복원"""
+        if not self.offsets:
+            return
+        entries = self._read_entries(self.snapshots[-1], self.revision)
+        self.content, self.meta = self._replay(entries)
+        self.delta_bytes = sum(len(entry["delta"][2]) for entry in entries if "delta" in entry)
+        self.since_snapshot = len(entries) - 1
+        self.created_at = self.times[0]
+        self.updated_at = self.times[-1]
+
+    def load(self) -> None:
+        """로그 색인 생성 (마지막 줄이 중간에 끊겼다면 무시 - 다음 기록 때 잘라냄)"""
+        self._reset()
+        with open(self.path, "rb") as f:
+            self._scan(f)
+        self._rebuild_head()
+
+    def refresh(self) -> None:
+        """다른 프로세스가 기록한 줄 따라잡기 (파일이 줄었으면 다시 읽음, 지워졌으면 FileNotFoundError)"""
+        size = os.path.getsize(self.path)
+        if size == self.size:
+            return
+        if size < self.size:
+            self.load()
+            return
+        with open(self.path, "rb") as f:
+            grew = self._scan(f)
+        if grew:
+            self._rebuild_head()
+
+    @contextmanager
+    def locked(self):
+        """로그 파일 배타적 잠금 - 잠금을 잡은 뒤 색인을 파일에 맞춰 두므로 안에서 revision/content 비교가 안전"""
+        with open(self.path, "ab+") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            if os.fstat(f.fileno()).st_size < self.size:
+                self.load()
+            elif self._scan(f):
+                self._rebuild_head()
+            yield f
+
+    def append(self, f, content: str, meta: Dict[str, Optional[str]], now: float) -> Dict[str, Any]:
+        """새 리비전 기록 (델타 또는 전체 스냅샷 한 줄 추가) - locked()로 연 파일에 기록"""
+        entry: Dict[str, Any] = {"rev": self.revision + 1, "at": now}
+        delta = make_delta(self.content, content)
+        snapshot = (not self.offsets or self.since_snapshot + 1 >= SNAPSHOT_INTERVAL
+                    or self.delta_bytes + len(delta[2]) > len(content))
+        if snapshot:
+            # 스냅샷은 메타데이터 전체를 포함 - 복원 시 스냅샷 이전 줄을 읽지 않도록
+            entry.update(meta)
+            entry["full"] = content
+        else:
+            entry.update({field: value for field, value in meta.items() if value != self.meta[field]})
+            entry["delta"] = list(delta)
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+        # 중간에 끊긴 마지막 줄이 있으면 잘라낸 뒤 추가
+        if os.fstat(f.fileno()).st_size != self.size:
+            f.truncate(self.size)
+        f.write(line)
+        f.flush()
+
+        if snapshot:
+            self.snapshots.append(entry["rev"])
+            self.delta_bytes = self.since_snapshot = 0
+        else:
+            self.delta_bytes += len(delta[2])
+            self.since_snapshot += 1
+        self.offsets.append(self.size)
+        self.times.append(now)
+        self.size += len(line)
+        self.content = content
+        self.meta = dict(meta)
+        if not self.created_at:
+            self.created_at = now
+        self.updated_at = now
+        return {"revision": entry["rev"], "kind": "snapshot" if "full" in entry else "delta", "bytes_written": len(line)}
+
+    def _read_entries(self, first: int, last: int) -> List[Dict[str, Any]]:
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[first - 1])
+            return [json.loads(f.readline()) for _ in range(last - first + 1)]
+
+    @staticmethod
+    def _replay(entries: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Optional[str]]]:
+        """스냅샷 줄 + 이어지는 델타 줄 → 본문/메타데이터"""
+        text = entries[0]["full"]
+        meta = {field: None for field in META_FIELDS}
+        for entry in entries:
+            if "delta" in entry:
+                text = apply_delta(text, tuple(entry["delta"]))
+            meta.update({field: entry[field] for field in META_FIELDS if field in entry})
+        return text, meta
+
+    def at(self, revision: int) -> Tuple[str, Dict[str, Optional[str]]]:
+        """리비전 본문/메타데이터 복원 (가장 가까운 이전 스냅샷 + 델타)"""
+        if revision == self.revision:
+            return self.content, dict(self.meta)
+        if not 1 <= revision <= self.revision:
+            raise DraftError(404, "Revision not found")
+        snapshot = self.snapshots[bisect_right(self.snapshots, revision) - 1]
+        return self._replay(self._read_entries(snapshot, revision))
+
+    def revisions(self, before: Optional[int], limit: int) -> List[Dict[str, Any]]:
+        """리비전 목록 (최신순, before보다 작은 번호부터)"""
+        last = min(before - 1 if before else self.revision, self.revision)
+        first = max(last - limit + 1, 1)
+        if last < 1:
+            return []
+        snapshots = set(self.snapshots[bisect_right(self.snapshots, first - 1):bisect_right(self.snapshots, last)])
+        return [
+            {
+                "revision": revision,
+                "saved_at": self.times[revision - 1],
+                "kind": "snapshot" if revision in snapshots else "delta",
+                "bytes": (self.offsets[revision] if revision < self.revision else self.size) - self.offsets[revision - 1],
+            }
+            for revision in range(last, first - 1, -1)
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            **self.meta,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "revision": self.revision,
+            "length": len(self.content),
+            "preview": self.content[:200],
+        }
+
+
+class UserDrafts:
+    """사용자 한 명의 초안과 (−수정 시각, id) 정렬 키 목록"""
+    __slots__ = ("directory", "drafts", "order")
+
+    def __init__(self, directory: Optional[str]):
+        self.directory = directory
+        self.drafts: Dict[str, SermonDraft] = {}
+        self.order: List[Tuple[float, str]] = []
+        self.sync()
+
+    def sync(self) -> None:
+        """디렉터리와 색인 맞추기 - 새 로그는 읽고, 크기가 바뀐 로그는 따라잡고, 지워진 로그는 제거"""
+        if not self.directory or not os.path.isdir(self.directory):
+            return
+        seen = set()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".log"):
+                continue
+            draft_id = entry.name[:-len(".log")]
+            seen.add(draft_id)
+            draft = self.drafts.get(draft_id)
+            try:
+                if draft is None:
+                    draft = SermonDraft(draft_id, entry.path)
+                    draft.load()
+                    if draft.revision:
+                        self.drafts[draft_id] = draft
+                        self.touch(draft, None)
+                elif entry.stat().st_size != draft.size:
+                    previous = draft.updated_at
+                    draft.refresh()
+                    if draft.updated_at != previous:
+                        self.touch(draft, previous)
+            except FileNotFoundError:
+                seen.discard(draft_id)
+        for draft_id in [draft_id for draft_id in self.drafts if draft_id not in seen]:
+            self.remove(draft_id)
+
+    def remove(self, draft_id: str) -> None:
+        draft = self.drafts.pop(draft_id)
+        self.order.remove((-draft.updated_at, draft_id))
+
+    def touch(self, draft: SermonDraft, previous: Optional[float]) -> None:
+        if previous is not None:
+            self.order.remove((-previous, draft.id))
+        insort(self.order, (-draft.updated_at, draft.id))
+
+    def page(self, cursor: Optional[str], limit: int) -> Tuple[List[SermonDraft], Optional[str]]:
+        """키셋 페이지 - 커서 이후 limit개와 다음 커서"""
+        self.sync()
+        start = 0
+        if cursor:
+            updated_at, draft_id = decode_cursor(cursor)
+            start = bisect_right(self.order, (-updated_at, draft_id))
+        keys = self.order[start:start + limit]
+        drafts = [self.drafts[draft_id] for _, draft_id in keys]
+        has_more = start + limit < len(self.order)
+        return drafts, encode_cursor(drafts[-1].updated_at, drafts[-1].id) if drafts and has_more else None
+
+
+class SermonDraftStore:
+    """사용자별 초안 (최근 사용자만 메모리에 유지)"""
+
+    def __init__(self, directory: Optional[str] = DRAFT_DIR, max_cached: int = MAX_CACHED_USERS):
+        self.directory = directory
+        self.max_cached = max_cached
+        self._users: "OrderedDict[str, UserDrafts]" = OrderedDict()
+
+    def _user_dir(self, user_id: str) -> Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, hashlib.sha1(user_id.encode("utf-8")).hexdigest())
+
+    def user(self, user_id: str) -> UserDrafts:
+        drafts = self._users.get(user_id)
+        if drafts is not None:
+            self._users.move_to_end(user_id)
+            return drafts
+        drafts = UserDrafts(self._user_dir(user_id))
+        self._users[user_id] = drafts
+        while len(self._users) > self.max_cached:
+            self._users.popitem(last=False)
+        return drafts
+
+    def get(self, user_id: str, draft_id: str) -> SermonDraft:
+        """초안 (다른 프로세스가 기록했으면 따라잡음)"""
+        user = self.user(user_id)
+        draft = user.drafts.get(draft_id)
+        if draft is None:
+            raise DraftError(404, "Draft not found")
+        previous = draft.updated_at
+        try:
+            draft.refresh()
+        except FileNotFoundError:
+            user.remove(draft_id)
+            raise DraftError(404, "Draft not found")
+        if draft.updated_at != previous:
+            user.touch(draft, previous)
+        return draft
+
+    def create(self, user_id: str, content: str, meta: Dict[str, Optional[str]]) -> SermonDraft:
+        directory = self._user_dir(user_id)
+        if directory is None:
+            raise DraftError(503, "Draft storage is not configured")
+        os.makedirs(directory, exist_ok=True)
+        user = self.user(user_id)
+        draft_id = uuid.uuid4().hex
+        draft = SermonDraft(draft_id, os.path.join(directory, draft_id + ".log"))
+        with draft.locked() as f:
+            draft.append(f, content, meta, time.time())
+        user.drafts[draft_id] = draft
+        user.touch(draft, None)
+        return draft
+
+    def save(self, user_id: str, draft_id: str, meta: Dict[str, Optional[str]], content: Optional[str] = None,
+             delta: Optional[Delta] = None, base_revision: Optional[int] = None) -> Dict[str, Any]:
+        """자동 저장 - 전체 본문 또는 base_revision 기준 델타, 바뀐 것이 없으면 기록하지 않음
+
+        로그 잠금 안에서 파일 기준 최신 리비전과 비교하므로 다른 프로세스의 저장과도 409로 충돌을 알림
+        """
+        user = self.user(user_id)
+        draft = self.get(user_id, draft_id)
+        previous = draft.updated_at
+        with draft.locked() as f:
+            if base_revision is not None and base_revision != draft.revision:
+                raise DraftError(409, f"Draft was saved elsewhere (current revision {draft.revision})")
+            if delta is not None:
+                if base_revision is None:
+                    raise DraftError(400, "base_revision is required with a delta")
+                content = apply_delta(draft.content, delta)
+            if content is None:
+                content = draft.content
+            meta = {field: value if value is not None else draft.meta[field] for field, value in meta.items()}
+            if content == draft.content and meta == draft.meta:
+                result = {"revision": draft.revision, "kind": "unchanged", "bytes_written": 0}
+            else:
+                result = draft.append(f, content, meta, time.time())
+        if draft.updated_at != previous:
+            user.touch(draft, previous)
+        return result
+
+    def delete(self, user_id: str, draft_id: str) -> None:
+        user = self.user(user_id)
+        self.get(user_id, draft_id)
+        try:
+            os.unlink(user.drafts[draft_id].path)
+        except FileNotFoundError:
+            pass
+        user.remove(draft_id)
+
+
+@lru_cache(maxsize=1)
+def get_sermon_draft_store() -> SermonDraftStore:
+    """프로세스 전역 설교 초안 저장소"""
+    return SermonDraftStore()
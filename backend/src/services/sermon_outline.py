@@ -0,0 +1,354 @@
+"""
+설교 개요 생성 (문단 분석 캐시 + 어휘 겹침 기반 구간 나누기)
+
+원고를 문단으로 나누고, 문단별 분석(문장, 신학 용어, 기본형, 복잡도)을 문단 내용 해시로 캐시한다.
+- 분석은 HuSpaCy NLP 서버(/analyze)에 바뀐 문단만 동시에 요청, 서버를 쓸 수 없으면 로컬 토큰화로 대체
+  (로컬 분석은 스레드에서 실행, 결과는 서버가 다시 살아나면 재계산)
+- 비교는 악센트를 접은 기본형으로 하고, 개요의 용어는 원문/사전 표기("örök")로 표시
+- 이웃 문단을 현재 구간의 기본형/신학 용어 묶음과 코사인 유사도로 비교해 임계값 아래에서 새 구간 시작
+- 40분 설교 원고를 다시 개요로 만들 때 대부분의 문단은 캐시에서 바로 가져오므로 구간 나누기만 다시 수행
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+from src.lib.data_paths import PRISMA_DIR, load_json
+from src.lib.text_folding import fold
+from src.services.bible_verses import find_references
+from src.services.term_search import stem_candidates, tokenize
+from src.services.vocabulary_store import get_vocabulary_store
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+NLP_URL = os.getenv("HUNGARIAN_NLP_URL", "http://localhost:8001")
+NLP_ENABLED = os.getenv("ENABLE_HUNGARIAN_NLP", "true").lower() == "true"
+NLP_TIMEOUT_SECONDS = 5.0
+NLP_CONCURRENCY = 8
+# NLP 서버 호출이 실패하면 이 시간 동안은 바로 로컬 분석 사용
+NLP_RETRY_SECONDS = 30.0
+
+MAX_CACHED_PARAGRAPHS = 20000
+MAX_SECTIONS = 8
+# 문단과 현재 구간의 유사도가 이보다 낮으면 새 구간 (신학 용어는 가중치 2)
+SECTION_THRESHOLD = 0.12
+THEOLOGICAL_WEIGHT = 2.0
+KEY_TERM_COUNT = 5
+SUMMARY_LENGTH = 120
+
+# 내용어 품사 (UD) - 구간 유사도 계산에 사용
+CONTENT_POS = {"NOUN", "PROPN", "VERB", "ADJ"}
+# 로컬 분석 시 제외하는 헝가리어 기능어 (악센트 폴딩 후 형태)
+STOPWORDS = {
+    "a", "az", "egy", "es", "is", "de", "hogy", "nem", "meg", "el", "ki", "be", "fel", "le",
+    "mert", "mint", "ha", "vagy", "ez", "azt", "ezt", "van", "volt", "lesz", "csak", "mar",
+    "mi", "ti", "o", "en", "te", "ok", "aki", "ami", "amely", "akik", "amit", "pedig", "sem",
+    "igen", "nincs", "minden", "itt", "ott", "most", "majd", "mikor", "amikor", "ugy",
+    "errol", "arrol", "ezert", "azert", "ebben", "abban", "ezek", "azok", "neki", "nekunk",
+}
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_LEVEL_BY_LENGTH = ((8, "A1"), (12, "A2"), (16, "B1"))
+
+
+def paragraph_hash(paragraph: str) -> str:
+    return hashlib.blake2b(paragraph.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """빈 줄 기준 문단 (앞뒤 공백 제거, 빈 문단 제외)"""
+    return [paragraph.strip() for paragraph in _PARAGRAPH_RE.split(text) if paragraph.strip()]
+
+
+@lru_cache(maxsize=1)
+def theological_surfaces() -> Dict[str, str]:
+    """신학 용어 표제어 + 신학/성경/기도/예배 분류 어휘 - 악센트 폴딩 형태 → 사전 표기 (소문자)"""
+    terms = load_json(os.path.join(PRISMA_DIR, "theological_terms_extended.json"))["theological_terms"]
+    words = [term["hungarian"] for term in terms] + [
+        word.hungarian for word in get_vocabulary_store().words
+        if word.category in ("THEOLOGICAL_CORE", "BIBLICAL_TERMS", "PRAYER_DEVOTION", "WORSHIP_LITURGY")
+    ]
+    surfaces: Dict[str, str] = {}
+    for word in words:
+        if " " not in word:
+            surfaces.setdefault(fold(word), word.lower())
+    return surfaces
+
+
+def _complexity_level(average_sentence_length: float) -> str:
+    for limit, level in _LEVEL_BY_LENGTH:
+        if average_sentence_length < limit:
+            return level
+    return "B2"
+
+
+class ParagraphAnalysis:
+    """문단 하나의 분석 결과 (내용 해시로 캐시)"""
+    __slots__ = ("hash", "sentences", "lemmas", "terms", "references", "complexity", "source", "surfaces")
+
+    def __init__(self, digest: str, sentences: List[str], lemmas: Counter, terms: List[str],
+                 references: List[str], complexity: str, source: str, surfaces: Dict[str, str]):
+        self.hash = digest
+        # 접힌 기본형 → 표시용 표기
+        self.surfaces = surfaces
+        self.sentences = sentences
+        self.lemmas = lemmas
+        self.terms = terms
+        self.references = references
+        self.complexity = complexity
+        self.source = source
+
+    def features(self) -> Counter:
+        """구간 유사도 계산용 가중 기본형 빈도"""
+        weighted = Counter({lemma: float(count) for lemma, count in self.lemmas.items()})
+        for term in self.terms:
+            weighted[term] = weighted.get(term, 0.0) + THEOLOGICAL_WEIGHT
+        return weighted
+
+
+def _references(paragraph: str) -> List[str]:
+    return list(dict.fromkeys(reference.label for reference in find_references(paragraph)))
+
+
+def local_analysis(paragraph: str, digest: str) -> ParagraphAnalysis:
+    """NLP 서버 없이 토큰화/접미사 제거로 근사한 분석"""
+    sentences = [sentence for sentence in _SENTENCE_RE.split(paragraph) if sentence.strip()]
+    known = theological_surfaces()
+    # 원문 단어의 접힌 형태 → 원문 표기 (처음 나온 표기)
+    words: Dict[str, str] = {}
+    for word in _WORD_RE.findall(paragraph):
+        words.setdefault(fold(word), word.lower())
+    lemmas: Counter = Counter()
+    terms = []
+    surfaces: Dict[str, str] = {}
+    tokens = tokenize(paragraph)
+    for token in tokens:
+        if token in STOPWORDS or len(token) < 3 or token.isdigit():
+            continue
+        lemma = token if token in known else next((stem for stem in stem_candidates(token) if stem in known), token)
+        lemmas[lemma] += 1
+        surfaces.setdefault(lemma, known.get(lemma) or words.get(lemma, lemma))
+        if lemma in known and lemma not in terms:
+            terms.append(lemma)
+    average = len(tokens) / len(sentences) if sentences else 0.0
+    return ParagraphAnalysis(
+        digest, sentences, lemmas, terms, _references(paragraph), _complexity_level(average), "local", surfaces
+    )
+
+
+def nlp_analysis(paragraph: str, digest: str, response: Dict[str, Any]) -> ParagraphAnalysis:
+    """NLP 서버 /analyze 응답 → 분석 결과"""
+    known = theological_surfaces()
+    lemmas: Counter = Counter()
+    terms = []
+    surfaces: Dict[str, str] = {}
+    for token in response.get("tokens", []):
+        surface = token.get("lemma") or token.get("text", "")
+        lemma = fold(surface)
+        if not lemma or token.get("pos") not in CONTENT_POS:
+            continue
+        lemmas[lemma] += 1
+        surfaces.setdefault(lemma, known.get(lemma) or surface.lower())
+        if (token.get("is_theological_term") or lemma in known) and lemma not in terms:
+            terms.append(lemma)
+    sentences = [sentence["text"] for sentence in response.get("sentences", [])]
+    complexity = response.get("metadata", {}).get("complexity_level") or _complexity_level(
+        len(response.get("tokens", [])) / len(sentences) if sentences else 0.0
+    )
+    return ParagraphAnalysis(digest, sentences, lemmas, terms, _references(paragraph), complexity, "nlp", surfaces)
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(value * b.get(key, 0.0) for key, value in a.items())
+    if not dot:
+        return 0.0
+    return dot / (math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values())))
+
+
+def segment_sections(analyses: List[ParagraphAnalysis], max_sections: int = MAX_SECTIONS) -> List[List[int]]:
+    """연속 문단을 구간으로 묶음 - 현재 구간 묶음과의 유사도가 임계값 아래면 새 구간
+
+    구간이 max_sections보다 많으면 경계 유사도가 가장 높은 이웃 구간부터 합친다.
+    """
+    if not analyses:
+        return []
+    sections: List[List[int]] = [[0]]
+    boundaries: List[float] = []
+    bag = analyses[0].features()
+    for index in range(1, len(analyses)):
+        features = analyses[index].features()
+        similarity = _cosine(features, bag)
+        if similarity < SECTION_THRESHOLD:
+            sections.append([index])
+            boundaries.append(similarity)
+            bag = features
+        else:
+            sections[-1].append(index)
+            bag.update(features)
+    while len(sections) > max_sections:
+        merge = max(range(len(boundaries)), key=boundaries.__getitem__)
+        sections[merge].extend(sections.pop(merge + 1))
+        boundaries.pop(merge)
+    return sections
+
+
+def _section_title(position: int, count: int) -> str:
+    if count >= 3 and position == 0:
+        return "서론"
+    if count >= 3 and position == count - 1:
+        return "결론"
+    body_index = position if count >= 3 else position + 1
+    return f"본론 {body_index}" if count > 1 else "본론"
+
+
+def _summary(analysis: ParagraphAnalysis) -> str:
+    sentence = analysis.sentences[0] if analysis.sentences else ""
+    return sentence if len(sentence) <= SUMMARY_LENGTH else sentence[:SUMMARY_LENGTH - 1] + "…"
+
+
+def build_outline(analyses: List[ParagraphAnalysis]) -> List[Dict[str, Any]]:
+    """구간별 개요 항목 (하위 항목은 문단 요약)"""
+    sections = segment_sections(analyses)
+    outline = []
+    for position, members in enumerate(sections):
+        lemmas: Counter = Counter()
+        terms: List[str] = []
+        references: List[str] = []
+        surfaces: Dict[str, str] = {}
+        for index in members:
+            lemmas.update(analyses[index].lemmas)
+            for lemma, surface in analyses[index].surfaces.items():
+                surfaces.setdefault(lemma, surface)
+            terms.extend(term for term in analyses[index].terms if term not in terms)
+            references.extend(reference for reference in analyses[index].references if reference not in references)
+        key_terms = terms[:KEY_TERM_COUNT] + [
+            lemma for lemma, _ in lemmas.most_common(KEY_TERM_COUNT * 2) if lemma not in terms
+        ][:max(KEY_TERM_COUNT - len(terms), 0)]
+        section_id = str(position + 1)
+        outline.append({
+            "id": section_id,
+            "title": _section_title(position, len(sections)),
+            "content": _summary(analyses[members[0]]),
+            "level": 1,
+            "paragraphs": members,
+            "key_terms": [surfaces.get(lemma, lemma) for lemma in key_terms],
+            "theological_terms": [surfaces.get(term, term) for term in terms],
+            "scripture_references": references,
+            "complexity": max((analyses[index].complexity for index in members), default="A1"),
+            "children": [
+                {"id": f"{section_id}.{offset + 1}", "title": _summary(analyses[index]), "level": 2, "paragraph": index}
+                for offset, index in enumerate(members)
+            ],
+        })
+    return outline
+
+
+class SermonOutliner:
+    """문단 분석 LRU 캐시 + NLP 서버 호출"""
+
+    def __init__(self, nlp_url: Optional[str] = NLP_URL if NLP_ENABLED else None,
+                 max_cached: int = MAX_CACHED_PARAGRAPHS):
+        self.nlp_url = nlp_url if httpx is not None else None
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, ParagraphAnalysis]" = OrderedDict()
+        self._client = None
+        self._nlp_down_until = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def _nlp_available(self) -> bool:
+        return self.nlp_url is not None and time.monotonic() >= self._nlp_down_until
+
+    async def _analyze_remote(self, paragraphs: List[Tuple[str, str]]) -> Optional[List[ParagraphAnalysis]]:
+        """바뀐 문단을 동시에 분석 요청 - 하나라도 실패하면 None (호출자가 로컬 분석으로 대체)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.nlp_url, timeout=NLP_TIMEOUT_SECONDS)
+        semaphore = asyncio.Semaphore(NLP_CONCURRENCY)
+
+        async def analyze(paragraph: str, digest: str) -> ParagraphAnalysis:
+            async with semaphore:
+                response = await self._client.post("/analyze", json={
+                    "text": paragraph, "include_entities": False, "include_dependencies": False,
+                })
+                response.raise_for_status()
+                return nlp_analysis(paragraph, digest, response.json())
+
+        try:
+            return await asyncio.gather(*(analyze(paragraph, digest) for paragraph, digest in paragraphs))
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Warning: NLP server analysis failed, using local analysis for {NLP_RETRY_SECONDS:.0f}s: {e}")
+            self._nlp_down_until = time.monotonic() + NLP_RETRY_SECONDS
+            return None
+
+    async def analyze(self, paragraphs: List[str]) -> Tuple[List[ParagraphAnalysis], int]:
+        """문단별 분석 (캐시에 없거나 로컬 분석뿐인 문단만 새로 계산) - (분석 목록, 새로 계산한 문단 수)"""
+        digests = [paragraph_hash(paragraph) for paragraph in paragraphs]
+        use_nlp = self._nlp_available()
+        pending: Dict[str, str] = {}
+        for paragraph, digest in zip(paragraphs, digests):
+            cached = self._cache.get(digest)
+            if cached is not None and (cached.source == "nlp" or not use_nlp):
+                self._cache.move_to_end(digest)
+                self.hits += 1
+            elif digest not in pending:
+                pending[digest] = paragraph
+                self.misses += 1
+
+        if pending:
+            items = [(paragraph, digest) for digest, paragraph in pending.items()]
+            analyses = await self._analyze_remote(items) if use_nlp else None
+            if analyses is None:
+                # 긴 원고의 로컬 분석이 이벤트 루프를 막지 않도록 스레드에서 실행
+                analyses = await asyncio.to_thread(
+                    lambda: [local_analysis(paragraph, digest) for paragraph, digest in items]
+                )
+            for analysis in analyses:
+                self._cache[analysis.hash] = analysis
+                self._cache.move_to_end(analysis.hash)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return [self._cache[digest] for digest in digests], len(pending)
+
+    async def outline(self, text: str) -> Dict[str, Any]:
+        paragraphs = split_paragraphs(text)
+        analyses, recomputed = await self.analyze(paragraphs)
+        return {
+            "outline": build_outline(analyses),
+            "paragraph_count": len(paragraphs),
+            "recomputed_paragraphs": recomputed,
+            "analysis_source": "nlp" if analyses and all(a.source == "nlp" for a in analyses) else "local",
+        }
+
+    async def close(self) -> None:
+        """NLP 서버 연결 종료 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cached_paragraphs": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "nlp_url": self.nlp_url,
+            "nlp_available": self._nlp_available(),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_sermon_outliner() -> SermonOutliner:
+    """프로세스 전역 개요 생성기 (문단 분석 캐시 공유)"""
+    return SermonOutliner()
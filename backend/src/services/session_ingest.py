@@ -0,0 +1,544 @@
+"""
+학습 세션 이벤트 수집 파이프라인
+
+모바일 클라이언트가 몰아서 보내는 세션/하트비트 이벤트를 요청 경로에서는 로그 파일에만 기록하고,
+백그라운드 작업자가 묶어서 분석 저장소에 반영한다.
+- 요청: 검증 → 선행 기록 로그(WAL)에 한 번 쓰고 fsync → 제한 크기 큐에 추가 (가득 차면 거절)
+- 작업자: 큐에서 최대 MAX_BATCH개씩 꺼내 AnalyticsStore.append 한 번으로 반영 후 체크포인트 기록
+  (체크포인트는 빈틈없이 반영된 마지막 순번까지만 전진, 디스크 기록이 실패하면 같은 묶음을 잠시 후 재시도)
+- 반영할 수 없는 항목은 묶음을 항목별로 나눠 다시 반영하면서 격리 로그로 옮기고 거절 건수로 집계 (나머지 항목은 계속 반영)
+- 시작 시 체크포인트 이후의 로그 항목을 다시 반영 - 세션마다 WAL 순번을 멱등 키로 저장소에 함께 기록하므로
+  저장소 반영과 체크포인트 사이에 중단되었던 항목은 건너뜀
+- 하트비트: 세션 종료 이벤트 없이 SESSION_IDLE_SECONDS 동안 하트비트가 끊긴 세션은 첫/마지막 하트비트 간격으로 세션 기록
+  (진행 중인 하트비트 세션은 체크포인트에 함께 저장, 멱등 키는 마지막 하트비트의 순번)
+- 워커 여러 개: 모든 프로세스가 같은 로그에 기록하고(파일 잠금으로 순번 조율), 담당 잠금을 잡은 프로세스 하나만
+  로그를 따라 읽어 저장소에 반영
+"""
+
+import asyncio
+import heapq
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Callable
+
+from src.lib.file_lock import acquire_lock, file_lock, release_lock
+from src.services.analytics_store import ANALYTICS_DIR, AnalyticsStore, get_analytics_store, session_record, unix_timestamp
+from src.services.recommendation_engine import CONTENT_TYPES
+
+WAL_PATH = os.path.join(ANALYTICS_DIR, "ingest.wal")
+CHECKPOINT_PATH = os.path.join(ANALYTICS_DIR, "ingest.checkpoint")
+QUARANTINE_PATH = os.path.join(ANALYTICS_DIR, "ingest.rejected")
+OWNER_LOCK_PATH = os.path.join(ANALYTICS_DIR, "ingest.owner")
+
+MAX_QUEUE_EVENTS = 10000
+MAX_BATCH = 2000
+MAX_REQUEST_EVENTS = 1000
+SESSION_IDLE_SECONDS = 30 * 60
+TAIL_SECONDS = 1
+OWNER_RETRY_SECONDS = 5
+RETRY_SECONDS = 5
+
+EVENT_SESSION = "session"
+EVENT_HEARTBEAT = "heartbeat"
+
+
+class IngestError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def parse_events(body: bytes, content_type: str) -> List[Dict[str, Any]]:
+    """요청 본문 → 이벤트 목록 (JSON 객체, JSON 배열, NDJSON)"""
+    try:
+        if "ndjson" in content_type or "jsonl" in content_type:
+            events = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            payload = json.loads(body or b"null")
+            events = payload if isinstance(payload, list) else [payload]
+    except ValueError as e:
+        raise IngestError(400, f"Invalid JSON: {e}")
+    if not events:
+        raise IngestError(400, "No events")
+    if len(events) > MAX_REQUEST_EVENTS:
+        raise IngestError(413, f"Too many events (max {MAX_REQUEST_EVENTS})")
+    return events
+
+
+def validate_event(event: Any) -> Dict[str, Any]:
+    """이벤트 검증 후 로그/저장소에 기록할 형태로 변환 (잘못된 값은 ValueError)"""
+    if not isinstance(event, dict):
+        raise ValueError("Event must be an object")
+    event_type = event.get("type", EVENT_SESSION)
+    if event_type == EVENT_SESSION:
+        if "duration_minutes" not in event:
+            raise ValueError("duration_minutes is required")
+        return {"type": EVENT_SESSION, "session_id": event.get("session_id"), **session_record(event)}
+    if event_type == EVENT_HEARTBEAT:
+        session_id = event.get("session_id")
+        if not isinstance(session_id, str) or not session_id:
+            raise ValueError("session_id is required for heartbeat events")
+        content_types = list(event.get("content_types") or [])
+        for content_type in content_types:
+            if content_type not in CONTENT_TYPES:
+                raise ValueError(f"Unknown content type: {content_type}")
+        return {
+            "type": EVENT_HEARTBEAT,
+            "session_id": session_id,
+            "timestamp": unix_timestamp(event.get("timestamp") or time.time(), "timestamp"),
+            "content_types": content_types,
+        }
+    raise ValueError(f"Unknown event type: {event_type}")
+
+
+class WriteAheadLog:
+    """줄 단위 JSON 로그 - 요청 하나의 이벤트를 한 번의 write + fsync로 기록
+
+    워커 여러 개가 같은 로그에 기록: 잠금 파일의 배타적 잠금 안에서 다른 프로세스가 기록한 줄을 먼저 읽어
+    순번을 이어가고, 그 줄은 on_foreign 콜백(수집 담당 프로세스만 설정)으로 넘김.
+    모두 반영된 로그는 비우는 대신 빈 파일로 교체 - 다른 프로세스는 inode가 바뀐 것을 보고 처음부터 읽음
+    """
+
+    def __init__(self, path: str, checkpoint_path: str):
+        self.path = path
+        self.checkpoint_path = checkpoint_path
+        self.lock_path = path + ".lock"
+        self._lock = threading.Lock()
+        # 다른 프로세스가 기록한 항목을 받는 콜백 (잠금 안에서 순번 순서대로 호출)
+        self.on_foreign: Optional[Callable[[List[Tuple[int, str, Dict[str, Any]]]], None]] = None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        with self._locked():
+            self.checkpoint, self.open_sessions = self._read_checkpoint()
+            self.last_seq = self.checkpoint
+            entries, valid_bytes = self._read()
+            for seq, _, _ in entries:
+                self.last_seq = max(self.last_seq, seq)
+            # 중간에 끊긴 마지막 줄 제거 - 이후 기록이 깨진 줄 뒤에 이어 붙지 않도록
+            os.ftruncate(self._fd, valid_bytes)
+            # 이 프로세스가 읽었거나 기록한 바이트 수
+            self._offset = valid_bytes
+
+    @contextmanager
+    def _locked(self):
+        """프로세스 안(스레드 잠금)과 프로세스 사이(파일 잠금) 모두 배타적 - 다른 프로세스가 로그를 교체했으면 다시 엶"""
+        with self._lock, file_lock(self.lock_path):
+            try:
+                rotated = os.stat(self.path).st_ino != os.fstat(self._fd).st_ino
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                os.close(self._fd)
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._offset = 0
+                self.last_seq = max(self.last_seq, self._read_checkpoint()[0])
+            yield
+
+    def _read_checkpoint(self) -> Tuple[int, List[List[Any]]]:
+        """(반영된 마지막 순번, 진행 중인 하트비트 세션) - 예전 형식(순번만)도 읽음"""
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.loads(f.read() or "0")
+        except (OSError, ValueError):
+            return 0, []
+        if isinstance(checkpoint, int):
+            return checkpoint, []
+        return int(checkpoint["seq"]), checkpoint.get("open_sessions", [])
+
+    def committed_seq(self) -> int:
+        """체크포인트 파일 기준 반영된 마지막 순번 (다른 프로세스가 반영 중일 때의 대기 항목 수 추정용)"""
+        return self._read_checkpoint()[0]
+
+    def _read(self, offset: int = 0) -> Tuple[List[Tuple[int, str, Dict[str, Any]]], int]:
+        """offset 이후 체크포인트 다음 항목과 온전한 줄 끝 위치 (마지막 줄이 중간에 끊겼다면 무시)"""
+        entries = []
+        valid_bytes = offset
+        if not os.path.exists(self.path):
+            return entries, valid_bytes
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+                if entry["seq"] > self.checkpoint:
+                    entries.append((entry["seq"], entry["user"], entry["event"]))
+        return entries, valid_bytes
+
+    def _catch_up(self) -> None:
+        """(잠금 안에서) 다른 프로세스가 기록한 줄을 읽어 순번을 맞추고 on_foreign으로 넘김"""
+        size = os.fstat(self._fd).st_size
+        if size == self._offset:
+            return
+        entries, valid_bytes = self._read(self._offset)
+        if valid_bytes < size:
+            # 기록 도중 중단된 프로세스가 남긴 깨진 줄 - 이후 기록이 그 뒤에 이어 붙지 않도록 제거
+            os.ftruncate(self._fd, valid_bytes)
+        self._offset = valid_bytes
+        for seq, _, _ in entries:
+            self.last_seq = max(self.last_seq, seq)
+        if entries and self.on_foreign is not None:
+            self.on_foreign(entries)
+
+    def replay(self) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """체크포인트를 다시 읽고 그 이후 항목 전체 반환 - 이후 tail()은 새로 기록된 줄만 넘김"""
+        with self._locked():
+            self.checkpoint, self.open_sessions = self._read_checkpoint()
+            entries, self._offset = self._read()
+            for seq, _, _ in entries:
+                self.last_seq = max(self.last_seq, seq)
+        return entries
+
+    def tail(self) -> None:
+        """다른 프로세스가 기록한 줄 따라잡기 (블로킹 - 스레드에서 호출)"""
+        with self._locked():
+            self._catch_up()
+
+    def append(self, user_id: str, events: List[Dict[str, Any]],
+               on_written: Optional[Callable[[List[int]], None]] = None) -> List[int]:
+        """이벤트 기록 후 디스크 동기화까지 완료되면 반환 (블로킹 - 스레드에서 호출)
+
+        on_written: 순번을 받는 콜백 - 잠금 안에서 호출하므로 콜백 호출 순서가 순번 순서와 같음
+        """
+        with self._locked():
+            self._catch_up()
+            first = self.last_seq + 1
+            lines = [
+                json.dumps({"seq": first + i, "user": user_id, "event": event}, ensure_ascii=False) + "\n"
+                for i, event in enumerate(events)
+            ]
+            data = "".join(lines).encode("utf-8")
+            os.write(self._fd, data)
+            os.fsync(self._fd)
+            self._offset += len(data)
+            self.last_seq = first + len(events) - 1
+            seqs = list(range(first, first + len(events)))
+            if on_written is not None:
+                on_written(seqs)
+        return seqs
+
+    def commit(self, seq: int, open_sessions: List[List[Any]]) -> None:
+        """seq까지 저장소에 반영됨 (진행 중인 하트비트 세션과 함께 기록) - 모두 반영됐으면 로그를 빈 파일로 교체"""
+        with self._locked():
+            self._catch_up()
+            temp_path = self.checkpoint_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"seq": seq, "open_sessions": open_sessions}, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.checkpoint_path)
+            self.checkpoint = seq
+            self.open_sessions = open_sessions
+            if seq >= self.last_seq and self._offset:
+                temp_path = self.path + ".tmp"
+                os.close(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+                os.replace(temp_path, self.path)
+                os.close(self._fd)
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._offset = 0
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class SessionIngestPipeline:
+    """WAL + 제한 크기 큐 + 묶음 반영 작업자
+
+    owner_lock_path: 워커 여러 개 중 이 잠금을 잡은 프로세스 하나만 저장소에 반영 (None이면 항상 담당).
+    나머지 프로세스는 로그에 기록만 하고, 담당 프로세스가 종료되면 잠금을 넘겨받음
+    """
+
+    def __init__(self, store: AnalyticsStore, wal: WriteAheadLog, max_queue: int = MAX_QUEUE_EVENTS,
+                 owner_lock_path: Optional[str] = None):
+        self.store = store
+        self.wal = wal
+        self.max_queue = max_queue
+        self.owner_lock_path = owner_lock_path
+        self.owner = owner_lock_path is None
+        self._owner_fd: Optional[int] = None
+        self._queue: "asyncio.Queue[Tuple[int, str, Dict[str, Any]]]" = asyncio.Queue()
+        # WAL 기록 중인 요청이 차지한 큐 자리
+        self._reserved = 0
+        # (사용자, 세션 id) → [첫 하트비트, 마지막 하트비트, 콘텐츠 유형, 마지막 하트비트 순번]
+        self._open_sessions: Dict[Tuple[str, str], List[Any]] = {}
+        # 큐 순서는 순번 순서와 다를 수 있음 - 반영된 순번을 모아 빈틈없이 이어진 곳까지만 체크포인트 전진
+        self._committed = 0
+        self._load_checkpoint()
+        self._applied_seqs: List[int] = []
+        # 반영에 실패해 재시도할 묶음과 (복구 중 실패했다면) 이미 저장소에 들어간 멱등 키
+        self._pending: List[Tuple[int, str, Dict[str, Any]]] = []
+        self._recorded: Optional[set] = None
+        self.applied = 0
+        self.rejected = 0
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        if not self.owner:
+            # 다른 프로세스가 반영 중 - 로그에 기록됐지만 아직 체크포인트 전인 항목 수
+            return max(0, self.wal.last_seq - self.wal.committed_seq())
+        return self._queue.qsize() + len(self._pending)
+
+    def _load_checkpoint(self) -> None:
+        self._committed = self.wal.checkpoint
+        self._open_sessions = {
+            (user_id, session_id): [first, last, set(content_types), seq]
+            for user_id, session_id, first, last, content_types, seq in self.wal.open_sessions
+        }
+
+    def claim(self) -> bool:
+        """수집 담당 잠금 시도 - 잡으면 다른 프로세스가 기록한 로그 항목도 큐로 받음"""
+        if not self.owner:
+            self._owner_fd = acquire_lock(self.owner_lock_path, blocking=False)
+            if self._owner_fd is not None:
+                loop = asyncio.get_running_loop()
+                self.wal.on_foreign = lambda entries: loop.call_soon_threadsafe(self._enqueue_entries, entries)
+                self.owner = True
+        return self.owner
+
+    def recover(self) -> int:
+        """체크포인트 이후 로그 항목을 바로 반영 (이미 저장소에 들어간 멱등 키는 건너뜀)
+
+        반영할 수 없는 항목은 격리하고, 디스크 기록이 실패하면 작업자가 재시도하도록 남김 - 시작을 막지 않음
+        담당을 넘겨받은 경우에도 쓰므로 체크포인트를 파일에서 다시 읽음
+        """
+        entries = self.wal.replay()
+        self._load_checkpoint()
+        floor = min([self._committed + 1] + [session[3] for session in self._open_sessions.values()])
+        recorded = self.store.ingest_keys(floor)
+        for key, session in list(self._open_sessions.items()):
+            if session[3] in recorded:
+                del self._open_sessions[key]
+        if entries:
+            try:
+                self._apply(entries, recorded)
+            except OSError as e:
+                self.failures += 1
+                print(f"Warning: session ingest recovery failed, retrying in background: {e!r}")
+                self._pending = self._unapplied(entries)
+                self._recorded = recorded
+        return len(entries)
+
+    async def submit(self, user_id: str, events: List[Dict[str, Any]]) -> int:
+        """로그에 기록하고 큐에 넣은 뒤 반환 (큐가 가득 차면 IngestError 429)"""
+        if self.depth + self._reserved + len(events) > self.max_queue:
+            self.rejected += len(events)
+            raise IngestError(429, "Ingestion queue is full, retry later")
+        loop = asyncio.get_running_loop()
+
+        def enqueue(seqs: List[int]) -> None:
+            # WAL 잠금 안에서 예약 - 큐 순서가 순번 순서와 같고, 요청이 취소되어도 기록된 이벤트는 큐에 들어감
+            # 담당 프로세스가 아니면 로그에만 남김 (담당 프로세스가 로그에서 읽어 반영)
+            if self.owner:
+                loop.call_soon_threadsafe(self._enqueue, user_id, seqs, events)
+
+        self._reserved += len(events)
+        try:
+            await asyncio.to_thread(self.wal.append, user_id, events, enqueue)
+        finally:
+            self._reserved -= len(events)
+        return len(events)
+
+    def _enqueue(self, user_id: str, seqs: List[int], events: List[Dict[str, Any]]) -> None:
+        for seq, event in zip(seqs, events):
+            self._queue.put_nowait((seq, user_id, event))
+
+    def _enqueue_entries(self, entries: List[Tuple[int, str, Dict[str, Any]]]) -> None:
+        for entry in entries:
+            self._queue.put_nowait(entry)
+
+    def _apply(self, entries: List[Tuple[int, str, Dict[str, Any]]], recorded: Optional[set] = None) -> None:
+        """묶음 반영 - 디스크 기록 실패(OSError)는 그대로 올려 묶음 전체를 재시도,
+        그 밖의 실패는 항목별로 나눠 반영하고 반영할 수 없는 항목만 격리
+        """
+        try:
+            self._apply_batch(entries, recorded)
+        except OSError:
+            raise
+        except Exception as e:
+            if len(entries) > 1:
+                for entry in sorted(entries, key=lambda entry: entry[0]):
+                    self._apply([entry], recorded)
+                return
+            self._quarantine(entries[0], e)
+
+    def _unapplied(self, entries: List[Tuple[int, str, Dict[str, Any]]]) -> List[Tuple[int, str, Dict[str, Any]]]:
+        applied = set(self._applied_seqs)
+        return [entry for entry in entries if entry[0] > self._committed and entry[0] not in applied]
+
+    def _quarantine(self, entry: Tuple[int, str, Dict[str, Any]], error: Exception) -> None:
+        """반영할 수 없는 항목을 격리 로그에 남기고 반영된 것으로 처리 (체크포인트가 멈추지 않도록)"""
+        seq, user_id, event = entry
+        self.rejected += 1
+        print(f"Warning: dropping session ingest entry {seq}: {error!r}")
+        try:
+            with open(QUARANTINE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"seq": seq, "user": user_id, "event": event, "error": repr(error)},
+                                   ensure_ascii=False, default=str) + "\n")
+        except OSError as e:
+            print(f"Warning: failed to write ingest quarantine: {e}")
+        heapq.heappush(self._applied_seqs, seq)
+        self._checkpoint()
+
+    def _apply_batch(self, entries: List[Tuple[int, str, Dict[str, Any]]], recorded: Optional[set] = None) -> None:
+        """묶음 반영 - 저장소 추가가 성공한 뒤에만 하트비트 세션 상태를 바꾸므로 실패하면 그대로 재시도 가능
+
+        recorded: 이미 저장소에 들어간 멱등 키 (복구 시) - 해당 세션 이벤트는 건너뛰고,
+        해당 하트비트로 끝난 세션은 이미 기록된 것으로 보고 닫음
+        """
+        recorded = recorded or set()
+        records, keys = [], []
+        # 이번 묶음에서 바뀐 하트비트 세션 (None이면 닫힘)
+        touched: Dict[Tuple[str, str], Optional[List[Any]]] = {}
+        for seq, user_id, event in sorted(entries, key=lambda entry: entry[0]):
+            key = (user_id, event.get("session_id"))
+            if event["type"] == EVENT_HEARTBEAT:
+                if seq in recorded:
+                    touched[key] = None
+                    continue
+                session = touched[key] if key in touched else self._open_sessions.get(key)
+                if session is None:
+                    session = [event["timestamp"], event["timestamp"], set(), seq]
+                else:
+                    session = [min(session[0], event["timestamp"]), max(session[1], event["timestamp"]), set(session[2]), seq]
+                session[2].update(event["content_types"])
+                touched[key] = session
+            else:
+                # 종료 이벤트가 온 세션은 하트비트 기록 폐기
+                touched[key] = None
+                if seq not in recorded:
+                    records.append((user_id, {name: value for name, value in event.items() if name not in ("type", "session_id")}))
+                    keys.append(seq)
+        self.store.append(records, keys)
+        for key, session in touched.items():
+            if session is None:
+                self._open_sessions.pop(key, None)
+            else:
+                self._open_sessions[key] = session
+        self.applied += len(entries)
+        for seq, _, _ in entries:
+            heapq.heappush(self._applied_seqs, seq)
+        self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """빈틈없이 반영된 마지막 순번과 진행 중인 하트비트 세션 기록 (실패하면 다음 묶음에서 다시 기록)"""
+        while self._applied_seqs and self._applied_seqs[0] <= self._committed + 1:
+            self._committed = max(self._committed, heapq.heappop(self._applied_seqs))
+        open_sessions = [
+            [user_id, session_id, first, last, sorted(content_types, key=CONTENT_TYPES.index), seq]
+            for (user_id, session_id), (first, last, content_types, seq) in self._open_sessions.items()
+        ]
+        try:
+            self.wal.commit(self._committed, open_sessions)
+        except OSError as e:
+            print(f"Warning: failed to write ingest checkpoint: {e}")
+
+    def close_idle_sessions(self, now: Optional[float] = None) -> int:
+        """하트비트가 끊긴 세션을 세션 기록으로 변환 (멱등 키: 마지막 하트비트 순번)"""
+        now = time.time() if now is None else now
+        idle = [key for key, session in self._open_sessions.items() if now - session[1] >= SESSION_IDLE_SECONDS]
+        if not idle:
+            return 0
+        records, keys = [], []
+        for key in idle:
+            first, last, content_types, seq = self._open_sessions[key]
+            if last > first:
+                try:
+                    record = session_record({
+                        "started_at": first,
+                        "duration_minutes": min((last - first) / 60, 24 * 60),
+                        "content_types": sorted(content_types, key=CONTENT_TYPES.index),
+                    })
+                except (ValueError, TypeError, OverflowError) as e:
+                    # 예전 체크포인트에 남은 잘못된 하트비트 세션 - 기록하지 않고 닫음
+                    self.rejected += 1
+                    print(f"Warning: dropping heartbeat session {key}: {e!r}")
+                    continue
+                records.append((key[0], record))
+                keys.append(seq)
+        self.store.append(records, keys)
+        for key in idle:
+            del self._open_sessions[key]
+        self._checkpoint()
+        return len(records)
+
+    async def run(self) -> None:
+        """큐가 빌 때까지 MAX_BATCH개씩 묶어 반영 - 디스크 기록이 실패하면 기록 후 같은 묶음을 재시도
+
+        담당이 아닌 프로세스는 OWNER_RETRY_SECONDS마다 담당 잠금을 다시 시도하고, 넘겨받으면 로그를 복구한 뒤 반영 시작
+        """
+        while not self.owner:
+            await asyncio.sleep(OWNER_RETRY_SECONDS)
+            if self.claim():
+                self.recover()
+        while True:
+            tail = False
+            if not self._pending:
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), timeout=TAIL_SECONDS))
+                except asyncio.TimeoutError:
+                    # 한가할 때 다른 프로세스가 기록한 줄 확인 (바쁠 때는 체크포인트 기록마다 따라잡음)
+                    tail = self.owner_lock_path is not None
+            while len(self._pending) < MAX_BATCH and not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+            try:
+                if tail:
+                    await asyncio.to_thread(self.wal.tail)
+                if self._pending:
+                    self._apply(self._pending, self._recorded)
+                    self._pending = []
+                    self._recorded = None
+                self.close_idle_sessions()
+            except Exception as e:
+                self.failures += 1
+                # 항목별로 나눠 반영하던 중 실패했다면 이미 반영된 항목은 재시도하지 않음
+                self._pending = self._unapplied(self._pending)
+                print(f"Warning: session ingest batch failed, retrying in {RETRY_SECONDS}s: {e!r}")
+                await asyncio.sleep(RETRY_SECONDS)
+
+    def start(self) -> None:
+        if self.claim():
+            self.recover()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """작업자 중지 후 남은 큐 반영 (담당 프로세스만) - 담당 잠금은 프로세스 종료와 함께 풀림"""
+        if self._task:
+            self._task.cancel()
+        if not self.owner:
+            return
+        batch = self._pending
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        self._pending = []
+        if batch:
+            self._apply(batch, self._recorded)
+        release_lock(self._owner_fd)
+        self._owner_fd = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.depth,
+            "max_queue": self.max_queue,
+            "applied_events": self.applied,
+            "rejected_events": self.rejected,
+            "failed_batches": self.failures,
+            "open_sessions": len(self._open_sessions),
+            "owner": self.owner,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_ingest_pipeline() -> SessionIngestPipeline:
+    """프로세스 전역 수집 파이프라인"""
+    return SessionIngestPipeline(get_analytics_store(), WriteAheadLog(WAL_PATH, CHECKPOINT_PATH), owner_lock_path=OWNER_LOCK_PATH)
@@ -0,0 +1,156 @@
+"""
+학습 세션 계획 (시간 예산 배낭 문제)
+
+점수가 매겨진 후보 콘텐츠를 워밍업/본 학습/복습 구간에 배치해
+시간 예산(분) 안에서 점수 합이 최대가 되도록 한다.
+- 상태: (워밍업 채움 여부, 복습 채움 여부) × 사용 시간 → 0/1 배낭 DP를 NumPy로 벡터화
+- 후보: 점수 상위 일부 + 워밍업/복습 가능 상위 항목으로 제한 (DP 비용 O(후보 × 4 × 예산))
+- (학습자 상태 해시, 예산) 기준으로 결과를 메모이제이션
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import List, Any, Tuple
+
+import numpy as np
+
+MIN_BUDGET_MINUTES = 5
+MAX_BUDGET_MINUTES = 180
+
+MAIN_CANDIDATES = 32
+SEGMENT_CANDIDATES = 4
+# 워밍업/복습 구간을 채우는 계획을 우선 (점수는 0~1 범위)
+SEGMENT_BONUS = 1.0
+
+# DP 선택 코드
+_SKIP, _MAIN, _WARM_UP, _REVIEW = 0, 1, 2, 3
+_WARM_UP_BIT, _REVIEW_BIT = 1, 2
+
+MAX_CACHED_PLANS = 4096
+
+
+class SessionPlan:
+    __slots__ = ("warm_up", "main", "review", "total_minutes")
+
+    def __init__(self, warm_up: List[int], main: List[int], review: List[int], total_minutes: int):
+        self.warm_up = warm_up
+        self.main = main
+        self.review = review
+        self.total_minutes = total_minutes
+
+
+def state_hash(*parts: Any) -> str:
+    """학습자 상태(점수 벡터 등) → 캐시 키"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.tobytes() if isinstance(part, np.ndarray) else repr(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _candidates(scores: np.ndarray, durations: np.ndarray, budget: int,
+                warm_up_mask: np.ndarray, review_mask: np.ndarray) -> np.ndarray:
+    fits = durations <= budget
+
+    def top(mask: np.ndarray, k: int) -> np.ndarray:
+        masked = np.where(mask & fits, scores, -np.inf)
+        k = min(k, int(np.isfinite(masked).sum()))
+        return np.argpartition(-masked, k - 1)[:k] if k > 0 else np.empty(0, dtype=np.int64)
+
+    return np.unique(np.concatenate([
+        top(np.ones_like(fits), MAIN_CANDIDATES),
+        top(warm_up_mask, SEGMENT_CANDIDATES),
+        top(review_mask, SEGMENT_CANDIDATES),
+    ]))
+
+
+def pack_session(
+    scores: np.ndarray,
+    durations: np.ndarray,
+    budget_minutes: int,
+    warm_up_mask: np.ndarray,
+    review_mask: np.ndarray,
+) -> SessionPlan:
+    """워밍업 1개, 복습 1개, 나머지 본 학습으로 점수 합 최대 배치"""
+    budget = int(min(max(budget_minutes, MIN_BUDGET_MINUTES), MAX_BUDGET_MINUTES))
+    candidates = _candidates(scores, durations, budget, warm_up_mask, review_mask)
+    width = budget + 1
+
+    # dp[state, c] = 사용 시간 c분 이하에서 얻을 수 있는 최대 점수 합
+    dp = np.full((4, width), -np.inf)
+    dp[0] = 0.0
+    choices = np.zeros((len(candidates), 4, width), dtype=np.int8)
+
+    for position, index in enumerate(candidates.tolist()):
+        value = float(scores[index])
+        duration = int(durations[index])
+        if duration > budget:
+            continue
+        previous = dp
+        dp = previous.copy()
+        choice = choices[position]
+
+        options = [(_MAIN, state, state) for state in range(4)]
+        if warm_up_mask[index]:
+            options += [(_WARM_UP, state, state | _WARM_UP_BIT) for state in range(4) if not state & _WARM_UP_BIT]
+        if review_mask[index]:
+            options += [(_REVIEW, state, state | _REVIEW_BIT) for state in range(4) if not state & _REVIEW_BIT]
+
+        for code, source, target in options:
+            candidate = previous[source, :width - duration] + value
+            better = candidate > dp[target, duration:]
+            dp[target, duration:] = np.where(better, candidate, dp[target, duration:])
+            choice[target, duration:] = np.where(better, code, choice[target, duration:])
+
+    bonus = np.asarray([SEGMENT_BONUS * bin(state).count("1") for state in range(4)])
+    state = int(np.argmax(dp[:, budget] + bonus))
+    capacity = budget
+
+    warm_up: List[int] = []
+    main: List[int] = []
+    review: List[int] = []
+    for position in range(len(candidates) - 1, -1, -1):
+        code = int(choices[position, state, capacity])
+        if code == _SKIP:
+            continue
+        index = int(candidates[position])
+        capacity -= int(durations[index])
+        if code == _MAIN:
+            main.append(index)
+        elif code == _WARM_UP:
+            warm_up.append(index)
+            state &= ~_WARM_UP_BIT
+        else:
+            review.append(index)
+            state &= ~_REVIEW_BIT
+
+    main.sort(key=lambda index: -scores[index])
+    total = int(durations[warm_up + main + review].sum()) if warm_up or main or review else 0
+    return SessionPlan(warm_up, main, review, total)
+
+
+class SessionPlanner:
+    """(상태 해시, 예산) 기준 LRU 메모이제이션"""
+
+    def __init__(self, max_entries: int = MAX_CACHED_PLANS):
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[Tuple[str, int], SessionPlan]" = OrderedDict()
+
+    def plan(
+        self,
+        key: str,
+        scores: np.ndarray,
+        durations: np.ndarray,
+        budget_minutes: int,
+        warm_up_mask: np.ndarray,
+        review_mask: np.ndarray,
+    ) -> SessionPlan:
+        cache_key = (key, int(budget_minutes))
+        plan = self._plans.get(cache_key)
+        if plan is not None:
+            self._plans.move_to_end(cache_key)
+            return plan
+        plan = pack_session(scores, durations, budget_minutes, warm_up_mask, review_mask)
+        self._plans[cache_key] = plan
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+        return plan
@@ -0,0 +1,155 @@
+"""
+신학 용어 가중 무작위 추출
+
+(카테고리, 난이도)별 doc_id 배열과 Walker 별칭(alias) 테이블을 미리 만들어 두고,
+요청마다 전체 용어를 훑지 않고 N개를 추출한다.
+- 버킷 선택: 버킷 가중치(크기 × 약점 가중치)로 요청마다 작은 별칭 테이블 생성 - O(B)
+- 버킷 내 추출: 미리 계산한 별칭 테이블 - 추출 1회당 O(1)
+"""
+
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from src.services.term_search import fold, get_term_search_index
+
+# 약점 카테고리에 곱하는 기본 가중치
+WEAKNESS_BOOST = 3.0
+
+# 중복 없는 추출에서 별칭 테이블 재시도 대신 전체 추출로 전환하는 비율
+_DENSE_SAMPLE_RATIO = 0.5
+
+
+def build_alias_table(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Walker/Vose 별칭 테이블 생성 - O(M)"""
+    count = len(weights)
+    scaled = np.asarray(weights, dtype=np.float64) * count / weights.sum()
+    probability = np.ones(count, dtype=np.float64)
+    alias = np.arange(count, dtype=np.int32)
+
+    small = [i for i in range(count) if scaled[i] < 1.0]
+    large = [i for i in range(count) if scaled[i] >= 1.0]
+    while small and large:
+        low, high = small.pop(), large.pop()
+        probability[low] = scaled[low]
+        alias[low] = high
+        scaled[high] = scaled[high] + scaled[low] - 1.0
+        (small if scaled[high] < 1.0 else large).append(high)
+    return probability, alias
+
+
+def alias_draw(probability: np.ndarray, alias: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+    """별칭 테이블에서 size개 인덱스 추출 (복원 추출)"""
+    columns = rng.integers(0, len(probability), size=size)
+    accept = rng.random(size) < probability[columns]
+    return np.where(accept, columns, alias[columns])
+
+
+class TermSampler:
+    """(카테고리, 난이도) 버킷 기반 가중 추출기
+
+    모든 버킷의 별칭 테이블을 하나의 연속 배열에 이어 붙여 두므로,
+    여러 버킷에 걸친 추출도 한 번의 벡터 연산으로 처리된다.
+    """
+
+    def __init__(self, documents: List[Dict[str, Any]], rng: Optional[np.random.Generator] = None):
+        self.documents = documents
+        self.rng = rng or np.random.default_rng()
+
+        grouped: Dict[Tuple[str, str], Tuple[List[int], List[float]]] = {}
+        for doc_id, document in enumerate(documents):
+            key = (fold(document["category"]), document["difficulty_level"].upper())
+            ids, weights = grouped.setdefault(key, ([], []))
+            ids.append(doc_id)
+            weights.append(float(document.get("usage_frequency") or 1.0))
+
+        self._bucket_keys: List[Tuple[str, str]] = list(grouped)
+        self._bucket_index = {key: index for index, key in enumerate(self._bucket_keys)}
+
+        doc_ids, weights, probabilities, aliases, offsets, sizes = [], [], [], [], [], []
+        offset = 0
+        for key in self._bucket_keys:
+            ids, bucket_weights = grouped[key]
+            bucket_weights = np.asarray(bucket_weights, dtype=np.float64)
+            probability, alias = build_alias_table(bucket_weights)
+            doc_ids.append(np.asarray(ids, dtype=np.int32))
+            weights.append(bucket_weights / bucket_weights.sum())
+            probabilities.append(probability)
+            aliases.append(alias + offset)
+            offsets.append(offset)
+            sizes.append(len(ids))
+            offset += len(ids)
+
+        self._doc_ids = np.concatenate(doc_ids)
+        self._weights = np.concatenate(weights)      # 버킷 내 정규화된 가중치
+        self._probability = np.concatenate(probabilities)
+        self._alias = np.concatenate(aliases)
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._sizes = np.asarray(sizes, dtype=np.int64)
+
+    def _matching_buckets(self, category: str, level: str) -> np.ndarray:
+        if category and level:
+            index = self._bucket_index.get((category, level))
+            return np.asarray([] if index is None else [index], dtype=np.int64)
+        return np.asarray([
+            index for index, key in enumerate(self._bucket_keys)
+            if (not category or key[0] == category) and (not level or key[1] == level)
+        ], dtype=np.int64)
+
+    def sample(
+        self,
+        count: int,
+        category: Optional[str] = None,
+        difficulty_level: Optional[str] = None,
+        weakness: Optional[Dict[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """조건에 맞는 용어 count개를 중복 없이 추출
+
+        weakness는 {카테고리: 가중치} 형태로, 해당 카테고리 버킷이 더 자주 뽑히도록 한다.
+        """
+        category = fold(category) if category and category != "all" else ""
+        level = difficulty_level.upper() if difficulty_level and difficulty_level != "all" else ""
+        buckets = self._matching_buckets(category, level)
+        if len(buckets) == 0 or count <= 0:
+            return []
+
+        bucket_weights = self._sizes[buckets].astype(np.float64)
+        if weakness:
+            folded = {fold(key): value for key, value in weakness.items()}
+            bucket_weights *= [folded.get(self._bucket_keys[index][0], 1.0) for index in buckets]
+
+        available = int(self._sizes[buckets].sum())
+        count = min(count, available)
+        if count >= available * _DENSE_SAMPLE_RATIO:
+            return self._dense_sample(buckets, bucket_weights, count)
+
+        bucket_probability, bucket_alias = build_alias_table(bucket_weights)
+        chosen: Dict[int, None] = {}
+        while len(chosen) < count:
+            # 중복으로 버려지는 만큼을 감안해 부족분보다 조금 더 뽑음
+            needed = (count - len(chosen)) * 2
+            drawn_buckets = buckets[alias_draw(bucket_probability, bucket_alias, needed, self.rng)]
+            columns = self._offsets[drawn_buckets] + (self.rng.random(needed) * self._sizes[drawn_buckets]).astype(np.int64)
+            accept = self.rng.random(needed) < self._probability[columns]
+            positions = np.where(accept, columns, self._alias[columns])
+            for doc_id in self._doc_ids[positions].tolist():
+                chosen.setdefault(doc_id, None)
+                if len(chosen) >= count:
+                    break
+
+        return [self.documents[doc_id] for doc_id in chosen]
+
+    def _dense_sample(self, buckets: np.ndarray, bucket_weights: np.ndarray, count: int) -> List[Dict[str, Any]]:
+        """후보 대부분을 뽑는 경우 - 재시도 대신 한 번에 비복원 추출"""
+        ranges = [np.arange(self._offsets[index], self._offsets[index] + self._sizes[index]) for index in buckets]
+        positions = np.concatenate(ranges)
+        weights = self._weights[positions] * np.repeat(bucket_weights, self._sizes[buckets])
+        picked = self.rng.choice(self._doc_ids[positions], size=count, replace=False, p=weights / weights.sum())
+        return [self.documents[int(doc_id)] for doc_id in picked]
+
+
+@lru_cache(maxsize=1)
+def get_term_sampler() -> TermSampler:
+    """검색 색인과 같은 문서 목록을 공유하는 프로세스 전역 추출기"""
+    return TermSampler(get_term_search_index().documents)
@@ -0,0 +1,289 @@
+"""
+신학 용어/어휘 전문 검색 엔진
+
+서버 시작 시 신학 용어 및 어휘 JSON으로 역색인을 만들고 BM25로 순위를 매긴다.
+- 악센트 폴딩 (üdvösség == udvosseg)
+- 헝가리어 격어미/한국어 조사 제거 후 어간 매칭 (Istenben → isten, 하나님의 → 하나님)
+- 마지막 검색어는 접두사 확장 (입력 중 자동완성)
+"""
+
+import math
+import os
+import re
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+from src.lib.data_paths import PRISMA_DIR, load_json
+from src.lib.text_folding import fold
+from src.services.vocabulary_store import VocabularyWord, get_vocabulary_store
+
+# 필드별 가중치 (BM25 tf 계산 시 반영)
+FIELD_WEIGHTS = {
+    "hungarian_term": 3.0,
+    "korean_translation": 3.0,
+    "synonyms": 1.5,
+    "related_terms": 1.5,
+    "definition_hungarian": 1.0,
+    "definition_korean": 1.0,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 쿼리 토큰 확장 종류별 가중치
+EXACT_WEIGHT = 1.0
+STEM_WEIGHT = 0.8
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 32
+# 색인 인스턴스별로 유지하는 (쿼리, 필터) → 순위 캐시 크기
+MAX_CACHED_RANKINGS = 1024
+
+# 헝가리어 표제어/한국어 뜻과 쿼리 전체가 일치하면 최상위로 올리기 위한 가산점
+TITLE_MATCH_BONUS = 10.0
+
+# 헝가리어 격어미/복수/소유 접미사 (악센트 폴딩 후 형태, 긴 것부터 매칭)
+HUNGARIAN_SUFFIXES = sorted({
+    "bol", "rol", "tol", "ban", "ben", "ba", "be", "nak", "nek", "val", "vel",
+    "hoz", "hez", "ig", "ert", "kent", "ra", "re", "on", "en", "ot", "et", "at",
+    "ul", "nal", "nel", "ek", "ok", "ak", "k", "t", "ja", "je", "ai", "ei",
+    "unk", "tok", "tek", "juk", "jok", "ink", "aink", "eink",
+}, key=len, reverse=True)
+
+# 한국어 조사 (긴 것부터 매칭)
+KOREAN_PARTICLES = sorted({
+    "에서", "으로", "에게", "께서", "까지", "부터", "처럼", "보다", "이나",
+    "의", "을", "를", "이", "가", "은", "는", "에", "로", "과", "와", "도", "만",
+}, key=len, reverse=True)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(fold(text))
+
+
+def stem_candidates(token: str) -> List[str]:
+    """접미사(조사) 하나를 떼어낸 어간 후보"""
+    if _HANGUL_RE.search(token):
+        suffixes, min_length = KOREAN_PARTICLES, 1
+    else:
+        suffixes, min_length = HUNGARIAN_SUFFIXES, 3
+
+    candidates = []
+    for suffix in suffixes:
+        if token.endswith(suffix) and len(token) - len(suffix) >= min_length:
+            candidates.append(token[:-len(suffix)])
+    return candidates
+
+
+# ---------------------------------------------------------------------------
+# 데이터 소스 → 검색 문서 변환
+# ---------------------------------------------------------------------------
+
+def _term_document(term: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": term["id"],
+        "hungarian_term": term["hungarian"],
+        "korean_translation": term["korean_meaning"],
+        "category": term.get("category", ""),
+        "difficulty_level": term.get("difficulty_level", ""),
+        "definition_hungarian": term.get("definition_hungarian", ""),
+        "definition_korean": term.get("definition_korean", ""),
+        "usage_examples": term.get("example_sentences", []),
+        "biblical_references": term.get("biblical_references", []),
+        "pronunciation_guide": term.get("pronunciation_ipa", ""),
+        "related_terms": term.get("related_terms", []),
+        "synonyms": term.get("synonyms", []),
+        "usage_frequency": term.get("usage_frequency"),
+        "is_favorite": False,
+    }
+
+
+def _vocabulary_document(word: VocabularyWord) -> Dict[str, Any]:
+    return {
+        "id": word.id,
+        "hungarian_term": word.hungarian,
+        "korean_translation": word.korean,
+        "category": word.category or word.topic,
+        "difficulty_level": word.level,
+        "definition_hungarian": "",
+        "definition_korean": word.usage,
+        "usage_examples": [hungarian for hungarian, _ in word.examples],
+        "biblical_references": [],
+        "pronunciation_guide": word.pronunciation,
+        # "isteni (신성한)" 형식에서 헝가리어 부분만 사용
+        "related_terms": [related.split(" (")[0] for related in word.related],
+        "synonyms": [],
+        "is_favorite": False,
+    }
+
+
+def load_search_documents() -> List[Dict[str, Any]]:
+    """신학 용어 + 통합 어휘 저장소를 검색 문서로 변환 (같은 헝가리어 표제어는 신학 용어를 우선)"""
+    documents = [
+        _term_document(term)
+        for term in load_json(os.path.join(PRISMA_DIR, "theological_terms_extended.json"))["theological_terms"]
+    ]
+    documents.extend(_vocabulary_document(word) for word in get_vocabulary_store().words)
+
+    unique = []
+    seen = set()
+    for document in documents:
+        key = fold(document["hungarian_term"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(document)
+    return unique
+
+
+# ---------------------------------------------------------------------------
+# 역색인
+# ---------------------------------------------------------------------------
+
+class TermSearchIndex:
+    """필드 가중 BM25 역색인"""
+
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self.documents = documents
+        self._categories = [fold(d["category"]) for d in documents]
+        self._levels = [d["difficulty_level"].upper() for d in documents]
+        self._ids = {d["id"]: doc_id for doc_id, d in enumerate(documents)}
+
+        # 정규화된 표제어/뜻 → doc_id 목록
+        self._titles: Dict[str, List[int]] = defaultdict(list)
+        for doc_id, document in enumerate(documents):
+            for field in ("hungarian_term", "korean_translation"):
+                self._titles[" ".join(tokenize(document[field]))].append(doc_id)
+
+        term_frequencies: Dict[str, Dict[int, float]] = defaultdict(dict)
+        lengths = []
+        for doc_id, document in enumerate(documents):
+            length = 0.0
+            for field, weight in FIELD_WEIGHTS.items():
+                value = document[field]
+                text = " ".join(value) if isinstance(value, list) else value
+                for token in tokenize(text):
+                    postings = term_frequencies[token]
+                    postings[doc_id] = postings.get(doc_id, 0.0) + weight
+                    length += weight
+            lengths.append(length)
+
+        average_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+        total = len(documents)
+
+        # 토큰별 (doc_id, BM25 점수) 목록을 미리 계산 - 조회 시에는 합산만 수행
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        for token, postings in term_frequencies.items():
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            scored = []
+            for doc_id, tf in postings.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+                scored.append((doc_id, idf * tf * (BM25_K1 + 1) / (tf + norm)))
+            self._postings[token] = scored
+
+        self._vocabulary = sorted(self._postings)
+        # (쿼리, 분류, 레벨) → 순위 (LRU)
+        self._rankings: "OrderedDict[Tuple[str, str, str], Tuple[int, ...]]" = OrderedDict()
+
+    def get(self, term_id: str) -> Optional[Dict[str, Any]]:
+        """id로 문서 조회"""
+        doc_id = self._ids.get(term_id)
+        return self.documents[doc_id] if doc_id is not None else None
+
+    def _prefix_matches(self, prefix: str) -> List[str]:
+        matches = []
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and len(matches) < MAX_PREFIX_EXPANSIONS:
+            token = self._vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            if token != prefix:
+                matches.append(token)
+            position += 1
+        return matches
+
+    def _expand(self, token: str, allow_prefix: bool) -> List[Tuple[str, float]]:
+        """쿼리 토큰 → (색인 토큰, 가중치) 목록"""
+        expansions = []
+        if token in self._postings:
+            expansions.append((token, EXACT_WEIGHT))
+        for stem in stem_candidates(token):
+            if stem in self._postings:
+                expansions.append((stem, STEM_WEIGHT))
+        if allow_prefix:
+            expansions.extend((match, PREFIX_WEIGHT) for match in self._prefix_matches(token))
+        return expansions
+
+    def _ranked(self, query: str, category: str, level: str) -> Tuple[int, ...]:
+        """정규화된 쿼리/필터에 대한 전체 순위 (doc_id 튜플, 인스턴스별 LRU 캐시)"""
+        key = (query, category, level)
+        ranked = self._rankings.get(key)
+        if ranked is not None:
+            self._rankings.move_to_end(key)
+            return ranked
+        ranked = self._rank(query, category, level)
+        self._rankings[key] = ranked
+        while len(self._rankings) > MAX_CACHED_RANKINGS:
+            self._rankings.popitem(last=False)
+        return ranked
+
+    def _rank(self, query: str, category: str, level: str) -> Tuple[int, ...]:
+        allowed = None
+        if category or level:
+            allowed = {
+                doc_id for doc_id in range(len(self.documents))
+                if (not category or self._categories[doc_id] == category)
+                and (not level or self._levels[doc_id] == level)
+            }
+
+        tokens = tokenize(query)
+        if not tokens:
+            candidates = range(len(self.documents)) if allowed is None else sorted(allowed)
+            return tuple(candidates)
+
+        scores: Dict[int, float] = defaultdict(float)
+        for index, token in enumerate(tokens):
+            # 쿼리 토큰 하나가 여러 색인 토큰으로 확장되어도 문서당 최고 점수만 반영
+            best: Dict[int, float] = {}
+            for expanded, weight in self._expand(token, allow_prefix=index == len(tokens) - 1):
+                for doc_id, score in self._postings[expanded]:
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    weighted = score * weight
+                    if weighted > best.get(doc_id, 0.0):
+                        best[doc_id] = weighted
+            for doc_id, score in best.items():
+                scores[doc_id] += score
+
+        for doc_id in self._titles.get(query, ()):
+            if doc_id in scores:
+                scores[doc_id] += TITLE_MATCH_BONUS
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return tuple(doc_id for doc_id, _ in ranked)
+
+    def search(
+        self,
+        query: str = "",
+        category: Optional[str] = None,
+        difficulty_level: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """검색 결과 한 페이지와 전체 결과 수 반환"""
+        ranked = self._ranked(
+            " ".join(tokenize(query or "")),
+            fold(category) if category and category != "all" else "",
+            difficulty_level.upper() if difficulty_level and difficulty_level != "all" else "",
+        )
+        page = ranked[offset:offset + limit]
+        return [self.documents[doc_id] for doc_id in page], len(ranked)
+
+
+@lru_cache(maxsize=1)
+def get_term_search_index() -> TermSearchIndex:
+    """프로세스 전역 검색 색인 (최초 호출 시 한 번만 생성)"""
+    return TermSearchIndex(load_search_documents())
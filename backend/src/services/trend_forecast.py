@@ -0,0 +1,196 @@
+"""
+기술 영역별 학습 추세 예측
+
+주별 합계 이력에 사용자 × 기술 영역 × 지표(점수, 완료율)별 직선 추세를 한 번에 맞춘다.
+- 적합: 세션 수 가중 최소제곱 + Huber 가중치 재계산 (이상치 세션 주간의 영향 제한)
+- 모든 사용자를 (사용자, 영역, 지표, 주) 배열 하나로 묶어 NumPy로 동시에 계산
+- 결과는 사용자별로 캐시하고, 세션이 추가된 사용자만 무효화해 백그라운드에서 다시 적합
+- 요청 처리 중에는 적합하지 않고 캐시된 결과만 읽는다
+"""
+
+import asyncio
+import datetime
+import math
+import time
+from functools import lru_cache
+from typing import Optional, List, Dict, Any
+
+import numpy as np
+
+from src.lib.data_paths import CEFR_LEVELS
+from src.services.analytics_store import AnalyticsStore, ROLLUP_FIELDS, current_bucket, get_analytics_store
+from src.services.curriculum_graph import CurriculumGraph
+from src.services.recommendation_engine import SKILLS
+
+HISTORY_WEEKS = 12
+HORIZON_WEEKS = 4
+HUBER_ITERATIONS = 3
+HUBER_K = 1.345
+BATCH_SIZE = 1024
+
+# 무효화된 사용자 재적합 주기 (초) - 날짜가 바뀌면 전체 사용자 재적합
+REFRESH_INTERVAL_SECONDS = 60
+
+# 예측 지표 → 합계 지표
+METRICS = (("score", "accuracy"), ("progress", "completion"))
+
+_SESSIONS = ROLLUP_FIELDS.index("sessions")
+_GRAMMAR = ROLLUP_FIELDS.index("grammar")
+_METRIC_FIELDS = [ROLLUP_FIELDS.index(field) for _, field in METRICS]
+
+
+def fit_trends(values: np.ndarray, weights: np.ndarray, iterations: int = HUBER_ITERATIONS):
+    """마지막 축(시간)을 따라 가중 직선 적합 - 앞쪽 축 전체를 한 번에
+
+    values, weights: (..., T), weight 0은 결측. 반환: (마지막 시점 값, 기울기, 잔차 척도)
+    """
+    steps = values.shape[-1]
+    x = np.arange(steps, dtype=np.float64) - (steps - 1) / 2
+    w = weights.astype(np.float64)
+    for _ in range(iterations):
+        sw = w.sum(-1)
+        swx = (w * x).sum(-1)
+        swy = (w * values).sum(-1)
+        swxx = (w * x * x).sum(-1)
+        swxy = (w * x * values).sum(-1)
+        denominator = sw * swxx - swx ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(denominator > 1e-9, (sw * swxy - swx * swy) / denominator, 0.0)
+            intercept = np.where(sw > 0, (swy - slope * swx) / sw, 0.0)
+            residual = values - (intercept[..., None] + slope[..., None] * x)
+            # 가중 평균 절대 잔차 → 정규분포 기준 표준편차 추정
+            scale = np.where(sw > 0, 1.2533 * (weights * np.abs(residual)).sum(-1) / np.maximum(weights.sum(-1), 1e-9), 0.0)
+            limit = HUBER_K * np.maximum(scale, 1e-6)[..., None]
+            w = weights * np.where(np.abs(residual) <= limit, 1.0, limit / np.abs(residual))
+    last = intercept + slope * x[-1]
+    return last, slope, scale
+
+
+def confidence(observed_weeks: np.ndarray, scale: np.ndarray, steps: int = HISTORY_WEEKS) -> np.ndarray:
+    """관측 주 비율이 높고 잔차가 작을수록 높은 신뢰도 (0~100)"""
+    return np.round(100 * np.sqrt(observed_weeks / steps) / (1 + scale / 20)).astype(np.int64)
+
+
+class TrendForecaster:
+    """사용자별 예측 캐시"""
+
+    def __init__(self, store: AnalyticsStore):
+        self.store = store
+        self._forecasts: Dict[str, Dict[str, Any]] = {}
+        self._stale: set = set()
+        self.refreshed_day: Optional[int] = None
+        store.subscribe(self.invalidate)
+
+    def invalidate(self, user_ids: List[str]) -> None:
+        self._stale.update(user_ids)
+
+    @property
+    def stale_count(self) -> int:
+        return len(self._stale)
+
+    def refresh(self, user_ids: Optional[List[str]] = None) -> int:
+        """주어진 사용자(기본값: 전체)를 BATCH_SIZE명씩 묶어 다시 적합"""
+        day = current_bucket("day") if user_ids is None else None
+        if user_ids is None:
+            user_ids = self.store.user_ids()
+        self._stale.difference_update(user_ids)
+        for start in range(0, len(user_ids), BATCH_SIZE):
+            self._fit_batch(user_ids[start:start + BATCH_SIZE])
+        if day is not None:
+            # 전체 재적합이 끝까지 성공했을 때만 기록 - 실패하면 다음 주기에 다시 시도
+            self.refreshed_day = day
+        return len(user_ids)
+
+    def refresh_stale(self) -> int:
+        return self.refresh(list(self._stale))
+
+    def _fit_batch(self, user_ids: List[str]) -> None:
+        history = self.store.history(user_ids, "week", HISTORY_WEEKS)
+        sessions = history[..., _SESSIONS]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(sessions[..., None] > 0, history[..., _METRIC_FIELDS] / sessions[..., None], 0.0)
+        # (사용자, 영역, 주, 지표) → (사용자, 영역, 지표, 주)
+        values = np.moveaxis(means, -1, -2)
+        weights = np.broadcast_to(np.sqrt(sessions)[..., None, :], values.shape)
+        last, slope, scale = fit_trends(values, weights)
+        forecast = np.clip(last + slope * HORIZON_WEEKS, 0, 100)
+        observed = (sessions > 0).sum(-1)
+        confidences = confidence(observed[..., None], scale)
+        # 주당 학습한 문법 개념 수 (관측 기간 평균) - 마일스톤 예측용
+        lessons_per_week = history[:, 0, :, _GRAMMAR].sum(-1) / HISTORY_WEEKS
+
+        fitted_at = time.time()
+        for row, user_id in enumerate(user_ids):
+            estimates = {}
+            for slot, skill in enumerate(SKILLS, start=1):
+                if observed[row, slot] == 0:
+                    continue
+                estimate = {"observed_weeks": int(observed[row, slot])}
+                for metric, (name, _) in enumerate(METRICS):
+                    estimate[name] = int(round(forecast[row, slot, metric]))
+                    estimate[f"{name}_trend_per_week"] = round(float(slope[row, slot, metric]), 2)
+                estimate["confidence"] = int(confidences[row, slot, 0])
+                estimates[skill] = estimate
+            self._forecasts[user_id] = {
+                "estimates": estimates,
+                "lessons_per_week": round(float(lessons_per_week[row]), 2),
+                "confidence": int(confidences[row, 0, 0]),
+                "fitted_at": fitted_at,
+            }
+
+    def get(self, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """캐시된 예측 (세션이 추가돼 재적합 대기 중이면 stale 표시)"""
+        forecast = self._forecasts.get(user_id) if user_id else None
+        if forecast is None:
+            return None
+        return {**forecast, "stale": user_id in self._stale}
+
+
+def milestone_predictions(forecast: Optional[Dict[str, Any]], graph: CurriculumGraph, completed: int,
+                          current_level: str, count: int = 2, today: Optional[datetime.date] = None) -> List[Dict[str, Any]]:
+    """다음 레벨 복습 강의들까지 남은 강의 수 ÷ 주당 학습 속도로 완료 예상일 계산"""
+    today = today or datetime.date.today()
+    rate = forecast["lessons_per_week"] if forecast else 0.0
+    predictions = []
+    remaining = 0
+    for _ in range(count):
+        milestone = graph.next_milestone(completed, current_level)
+        if milestone is None:
+            break
+        gaps = graph.gaps(completed, milestone)
+        level = graph.nodes[graph.index[milestone]].level
+        # 이전 마일스톤까지 남은 강의를 포함한 누적 강의 수
+        remaining += gaps.bit_count()
+        weeks = math.ceil(remaining / rate) if rate > 0 else None
+        predictions.append({
+            "milestone": f"{level} 완료",
+            "milestone_lesson_id": milestone,
+            "remaining_lessons": gaps.bit_count(),
+            "estimated_date": (today + datetime.timedelta(weeks=weeks)).isoformat() if weeks is not None else None,
+            "confidence": forecast["confidence"] if forecast and weeks is not None else 0,
+        })
+        completed |= gaps
+        current_level = CEFR_LEVELS[min(CEFR_LEVELS.index(level) + 1, len(CEFR_LEVELS) - 1)]
+    return predictions
+
+
+async def run_forecast_refresh(forecaster: TrendForecaster, interval: float = REFRESH_INTERVAL_SECONDS) -> None:
+    """백그라운드 재적합 - 날짜가 바뀌면 전체, 그 외에는 무효화된 사용자만
+
+    적합은 CPU 작업이므로 스레드에서 실행 (요청 처리는 캐시된 결과를 계속 읽음), 실패해도 기록 후 다음 주기에 재시도
+    """
+    while True:
+        try:
+            if forecaster.refreshed_day != current_bucket("day"):
+                await asyncio.to_thread(forecaster.refresh)
+            elif forecaster.stale_count:
+                await asyncio.to_thread(forecaster.refresh_stale)
+        except Exception as e:
+            print(f"Warning: forecast refresh failed: {e!r}")
+        await asyncio.sleep(interval)
+
+
+@lru_cache(maxsize=1)
+def get_trend_forecaster() -> TrendForecaster:
+    """프로세스 전역 예측기"""
+    return TrendForecaster(get_analytics_store())
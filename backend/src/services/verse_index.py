@@ -0,0 +1,140 @@
+"""
+문법 항목 → 성경 구절 역색인 (예문 검색)
+
+구절의 grammarTopics, 단어별 분석(grammarAnalysis)의 relatedLesson/lemma를 키로
+구절 번호(BibleVerseStore 행 번호) 정렬 배열을 미리 만들어 둔다.
+- "과거시제 + 장소격, B1 이하"처럼 여러 조건은 짧은 목록부터 교집합 (긴 목록은 searchsorted로 탐색)
+- 레벨 조건도 "해당 레벨 이하 구절" 목록으로 만들어 같은 방식으로 교집합
+- relatedLessonTitle("A2-과거시제 기본")은 강의 목차의 제목과 맞춰 강의 id로도 조회 가능
+"""
+
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterable
+
+import numpy as np
+
+from src.lib.data_paths import CEFR_LEVELS
+from src.lib.text_folding import fold
+from src.services.bible_verses import BibleVerseStore, get_bible_verse_store
+from src.services.lesson_catalog import LessonEntry, get_lesson_catalog
+
+# 색인 키 종류
+TOPIC = "topic"
+LESSON = "lesson"
+LEMMA = "lemma"
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+_LESSON_TITLE_RE = re.compile(r"^(A1|A2|B1|B2)-(.+)$")
+
+
+def _normalize(value: str) -> str:
+    return re.sub(r"\s+", "", fold(value))
+
+
+def _lesson_ids(title: str, entries: List[LessonEntry]) -> List[str]:
+    """"A2-과거시제 기본" → 제목이 "과거시제 기본"으로 시작하는 강의 id (같은 레벨 우선)"""
+    match = _LESSON_TITLE_RE.match(title.strip())
+    level, name = (match.group(1), match.group(2)) if match else ("", title)
+    prefix = _normalize(name)
+    matches = [entry for entry in entries if _normalize(entry.title_korean).startswith(prefix)]
+    same_level = [entry.id for entry in matches if entry.level == level]
+    return same_level or [entry.id for entry in matches]
+
+
+def intersect_postings(postings: Iterable[np.ndarray]) -> np.ndarray:
+    """정렬된 구절 번호 배열들의 교집합 (짧은 배열부터, 결과를 긴 배열에서 이진 탐색)"""
+    result = None
+    for posting in sorted(postings, key=len):
+        if result is None:
+            result = posting
+            continue
+        if len(result) == 0:
+            break
+        positions = np.searchsorted(posting, result)
+        found = positions < len(posting)
+        found[found] = posting[positions[found]] == result[found]
+        result = result[found]
+    return _EMPTY if result is None else result
+
+
+class VerseGrammarIndex:
+    """(종류, 정규화 값) → 구절 번호 정렬 배열"""
+
+    def __init__(self, store: BibleVerseStore, lessons: List[LessonEntry]):
+        self.store = store
+        postings: Dict[str, Dict[str, set]] = {TOPIC: defaultdict(set), LESSON: defaultdict(set), LEMMA: defaultdict(set)}
+        self.labels: Dict[str, Dict[str, str]] = {TOPIC: {}, LESSON: {}, LEMMA: {}}
+        lesson_ids: Dict[str, List[str]] = {}
+
+        for row, verse in enumerate(store.verses):
+            for topic in verse.get("grammarTopics", []):
+                self._add(postings, TOPIC, topic, row)
+            for word in verse.get("grammarAnalysis", []):
+                if word.get("lemma"):
+                    self._add(postings, LEMMA, word["lemma"], row)
+                title = word.get("relatedLessonTitle")
+                if title:
+                    self._add(postings, LESSON, title, row)
+                    if title not in lesson_ids:
+                        lesson_ids[title] = _lesson_ids(title, lessons)
+                    for lesson_id in lesson_ids[title]:
+                        self._add(postings, LESSON, lesson_id, row)
+
+        self.postings: Dict[str, Dict[str, np.ndarray]] = {
+            kind: {key: np.array(sorted(rows), dtype=np.int32) for key, rows in keyed.items()}
+            for kind, keyed in postings.items()
+        }
+        levels = np.array([
+            CEFR_LEVELS.index(verse["difficulty"]) if verse.get("difficulty") in CEFR_LEVELS else len(CEFR_LEVELS)
+            for verse in store.verses
+        ], dtype=np.int8)
+        # 레벨 이하 구절 목록 (행 번호 순이므로 이미 정렬됨)
+        self.up_to_level = {level: np.flatnonzero(levels <= code).astype(np.int32) for code, level in enumerate(CEFR_LEVELS)}
+
+    def _add(self, postings: Dict[str, Dict[str, set]], kind: str, value: str, row: int) -> None:
+        key = _normalize(value)
+        postings[kind][key].add(row)
+        self.labels[kind].setdefault(key, value)
+
+    def posting(self, kind: str, value: str) -> np.ndarray:
+        return self.postings[kind].get(_normalize(value), _EMPTY)
+
+    def query(
+        self,
+        topics: Iterable[str] = (),
+        lessons: Iterable[str] = (),
+        lemmas: Iterable[str] = (),
+        max_level: Optional[str] = None,
+    ) -> np.ndarray:
+        """모든 조건을 만족하는 구절 번호 (조건이 없으면 레벨 조건만)"""
+        postings = [self.posting(TOPIC, topic) for topic in topics]
+        postings += [self.posting(LESSON, lesson) for lesson in lessons]
+        postings += [self.posting(LEMMA, lemma) for lemma in lemmas]
+        if max_level:
+            postings.append(self.up_to_level.get(max_level.upper(), _EMPTY))
+        if not postings:
+            return np.arange(len(self.store), dtype=np.int32)
+        return intersect_postings(postings)
+
+    def examples(self, limit: int = 20, **conditions) -> Dict[str, Any]:
+        """조건에 맞는 예문 구절 (구절 순서) 및 전체 개수"""
+        rows = self.query(**conditions)
+        return {
+            "verses": [self.store.verses[row] for row in rows[:limit].tolist()],
+            "total_count": len(rows),
+        }
+
+    def facets(self, kind: str) -> List[Dict[str, Any]]:
+        """종류별 키와 구절 수 (구절 수 내림차순)"""
+        return sorted(
+            ({"key": self.labels[kind][key], "verse_count": len(rows)} for key, rows in self.postings[kind].items()),
+            key=lambda item: (-item["verse_count"], item["key"]),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_verse_grammar_index() -> VerseGrammarIndex:
+    """프로세스 전역 구절 역색인 (최초 호출 시 한 번만 생성)"""
+    return VerseGrammarIndex(get_bible_verse_store(), get_lesson_catalog().entries)
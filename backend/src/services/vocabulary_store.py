@@ -0,0 +1,325 @@
+"""
+통합 어휘 저장소
+
+레벨별 단어장(vocabulary/{a1..b2}.json: hu/ko/pron/pos/exHu)과 핵심 어휘(core-vocabulary-100.json,
+vocabulary-additional-80.json: hungarian/korean/wordType/examples)를 서버 시작 시 한 번 읽어
+하나의 형식으로 정규화한다. 조회/검색/퀴즈/SRS가 같은 사본을 공유한다.
+- 단어 레코드는 __slots__ 객체, 품사/분류/레벨/주제 문자열은 intern 처리해 단어 간에 공유
+- 각 소스 레코드는 표기와 레벨을 그대로 유지 (레벨 단어장 응답은 원본과 같음)
+- 같은 헝가리어 표제어(악센트·대소문자 무시)의 첫 레코드가 대표 레코드 - 다른 소스의 빈 항목으로 보충하고,
+  다른 소스의 id는 canonical_id()에서 대표 id로 변환 (SRS 카드 통합용)
+- 레벨/주제/분류별 색인은 레코드 번호 배열 (NumPy int32)
+"""
+
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
+
+from src.lib.data_paths import CEFR_LEVELS, data_path, load_json
+from src.lib.text_folding import fold
+
+# 핵심 어휘의 영문 품사 → 단어장 품사 표기 (src/api/vocabulary.ts의 mapWordTypeToKorean과 같은 표기)
+WORD_TYPE_LABELS = {
+    "NOUN": "명사",
+    "VERB": "동사",
+    "ADJECTIVE": "형용사",
+    "ADVERB": "부사",
+    "PRONOUN": "대명사",
+    "PREPOSITION": "전치사",
+    "CONJUNCTION": "접속사",
+    "INTERJECTION": "감탄사",
+    "PARTICLE": "조사",
+    "NUMERAL": "수사",
+    "PHRASE": "표현",
+    "DETERMINER": "관사",
+}
+
+# 단어장 주제가 없는 핵심 어휘의 분류 → 주제 제목
+CATEGORY_TITLES = {
+    "DAILY_LIFE": "일상 생활",
+    "THEOLOGICAL_CORE": "핵심 신학 용어",
+    "TIME": "시간",
+    "NUMBERS": "숫자",
+    "FAMILY": "가족",
+    "FOOD": "음식",
+    "EMOTIONS": "감정",
+    "TRAVEL": "여행",
+    "PRAYER_DEVOTION": "기도와 경건",
+    "BIBLICAL_TERMS": "성경 용어",
+    "WORSHIP_LITURGY": "예배와 전례",
+}
+
+CORE_VOCABULARY_FILES = ("core-vocabulary-100.json", "vocabulary-additional-80.json")
+
+# "Minden nap imádkozom. (매일 기도한다.)" → 헝가리어, 한국어
+_INLINE_EXAMPLE_RE = re.compile(r"^(.*?)\s*\(([^()]*)\)\s*$")
+
+
+def _intern(value: Optional[str]) -> str:
+    return sys.intern(value or "")
+
+
+class VocabularyWord:
+    """정규화된 단어 한 개 (examples: (헝가리어, 한국어) 튜플의 튜플)"""
+
+    __slots__ = (
+        "index", "id", "hungarian", "korean", "pronunciation", "pos", "category", "level", "topic",
+        "examples", "related", "usage",
+    )
+
+    def __init__(self, index: int, word_id: str, hungarian: str, korean: str, pronunciation: str, pos: str,
+                 category: str, level: str, topic: str, examples: Tuple[Tuple[str, str], ...],
+                 related: Tuple[str, ...], usage: str):
+        self.index = index
+        self.id = word_id
+        self.hungarian = hungarian
+        self.korean = korean
+        self.pronunciation = pronunciation
+        self.pos = pos
+        self.category = category
+        self.level = level
+        self.topic = topic
+        self.examples = examples
+        self.related = related
+        self.usage = usage
+
+    def merge(self, other: "VocabularyWord") -> None:
+        """같은 표제어의 다른 소스 레코드에서 비어 있는 항목 보충"""
+        for field in ("pronunciation", "pos", "category", "topic", "usage", "examples", "related"):
+            if not getattr(self, field):
+                setattr(self, field, getattr(other, field))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "hungarian": self.hungarian,
+            "korean": self.korean,
+            "pronunciation": self.pronunciation,
+            "pos": self.pos,
+            "category": self.category,
+            "level": self.level,
+            "topic": self.topic,
+            "examples": [{"hungarian": hu, "korean": ko} for hu, ko in self.examples],
+            "related_words": list(self.related),
+            "usage": self.usage,
+        }
+
+    def to_card(self) -> Dict[str, str]:
+        """단어장 화면 형식 (src/api/vocabulary.ts 응답의 words 항목)"""
+        example_hu, example_ko = self.examples[0] if self.examples else ("", "")
+        return {
+            "hu": self.hungarian,
+            "ko": self.korean,
+            "pron": self.pronunciation,
+            "pos": self.pos,
+            "exHu": example_hu,
+            "exKo": example_ko,
+        }
+
+
+class VocabularyTopic:
+    """주제 (word_ids: 레벨 단어장에 실린 단어의 소스 id - 단어장 순서 그대로)"""
+
+    __slots__ = ("id", "title", "emoji", "level", "word_ids")
+
+    def __init__(self, topic_id: str, title: str, emoji: str, level: str, word_ids: Tuple[str, ...] = ()):
+        self.id = topic_id
+        self.title = title
+        self.emoji = emoji
+        self.level = level
+        self.word_ids = word_ids
+
+
+def _core_words(filename: str) -> List[VocabularyWord]:
+    words = []
+    for word in load_json(data_path(filename))["vocabulary"]:
+        if "examples" in word:
+            examples = tuple((example["hungarian"], example.get("korean", "")) for example in word["examples"])
+        elif word.get("example"):
+            match = _INLINE_EXAMPLE_RE.match(word["example"])
+            examples = (match.groups() if match else (word["example"], ""),)
+        else:
+            examples = ()
+        category = _intern(word.get("category"))
+        words.append(VocabularyWord(
+            -1, word["id"], word["hungarian"], word["korean"], "",
+            _intern(WORD_TYPE_LABELS.get(word.get("wordType"), word.get("wordType"))),
+            category, _intern((word.get("level") or "A1").upper()), _intern(category.lower()),
+            examples, tuple(word.get("relatedWords", ())), word.get("usage", ""),
+        ))
+    return words
+
+
+def _level_words(level: str) -> Tuple[List[VocabularyWord], List[VocabularyTopic], Dict[str, str]]:
+    corpus = load_json(data_path("vocabulary", f"{level.lower()}.json"))
+    words, topics = [], []
+    for topic in corpus["topics"]:
+        topic_id = _intern(topic["id"])
+        first = len(words)
+        for position, word in enumerate(topic["words"]):
+            words.append(VocabularyWord(
+                -1, f"{level.lower()}-{topic_id}-{position + 1:03d}", word["hu"], word["ko"], word.get("pron", ""),
+                _intern(word.get("pos")), "", _intern(level), topic_id,
+                ((word["exHu"], word.get("exKo", "")),) if word.get("exHu") else (), (), "",
+            ))
+        topics.append(VocabularyTopic(
+            topic_id, topic["title"], topic.get("emoji", ""), level, tuple(word.id for word in words[first:])
+        ))
+    return words, topics, {"title": corpus.get("title", ""), "description": corpus.get("description", "")}
+
+
+class VocabularyStore:
+    """모든 어휘 소스를 합친 단어 목록과 색인"""
+
+    def __init__(self, sources: List[List[VocabularyWord]], topics: List[VocabularyTopic],
+                 level_info: Optional[Dict[str, Dict[str, str]]] = None):
+        self.words: List[VocabularyWord] = []
+        self.level_info = level_info or {}
+        # 소스 id → 레코드 번호
+        self._ids: Dict[str, int] = {}
+        # 접힌 표제어 → 대표 레코드 번호
+        by_headword: Dict[str, int] = {}
+        headword_of: List[int] = []
+        topic_members: Dict[str, List[int]] = defaultdict(list)
+
+        for source in sources:
+            for word in source:
+                word.index = len(self.words)
+                self.words.append(word)
+                canonical = by_headword.setdefault(fold(word.hungarian), word.index)
+                if canonical != word.index:
+                    self.words[canonical].merge(word)
+                headword_of.append(canonical)
+                self._ids.setdefault(word.id, word.index)
+                topic_members[word.topic].append(word.index)
+
+        self._headwords = by_headword
+        # 레코드 번호 → 대표 레코드 번호 (퀴즈에서 같은 표제어를 오답 보기로 쓰지 않도록)
+        self.headword_of = np.asarray(headword_of, dtype=np.int32)
+        self.topics: Dict[str, VocabularyTopic] = {topic.id: topic for topic in topics}
+        for topic_id in topic_members:
+            if topic_id not in self.topics:
+                category = topic_id.upper()
+                self.topics[topic_id] = VocabularyTopic(
+                    topic_id, CATEGORY_TITLES.get(category, category), "📚", self.words[topic_members[topic_id][0]].level
+                )
+
+        self.levels = np.array([CEFR_LEVELS.index(word.level) for word in self.words], dtype=np.int8)
+        self._pos_labels = sorted({word.pos for word in self.words})
+        self.pos_codes = np.array([self._pos_labels.index(word.pos) for word in self.words], dtype=np.int16)
+        self.by_topic = {topic_id: np.asarray(members, dtype=np.int32) for topic_id, members in topic_members.items()}
+        self.by_level = {level: np.flatnonzero(self.levels == code).astype(np.int32) for code, level in enumerate(CEFR_LEVELS)}
+        categories: Dict[str, List[int]] = defaultdict(list)
+        for word in self.words:
+            if word.category:
+                categories[word.category].append(word.index)
+        self.by_category = {category: np.asarray(members, dtype=np.int32) for category, members in categories.items()}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word_id: str) -> bool:
+        return word_id in self._ids
+
+    def get(self, word_id: str) -> Optional[VocabularyWord]:
+        """소스 id로 조회"""
+        index = self._ids.get(word_id)
+        return self.words[index] if index is not None else None
+
+    def canonical_id(self, word_id: str) -> str:
+        """소스 id → 같은 표제어의 대표 id (어휘가 아니면 그대로)"""
+        index = self._ids.get(word_id)
+        return self.words[self.headword_of[index]].id if index is not None else word_id
+
+    def lookup(self, hungarian: str) -> Optional[VocabularyWord]:
+        """헝가리어 표제어로 조회 (악센트·대소문자 무시)"""
+        index = self._headwords.get(fold(hungarian.strip()))
+        return self.words[index] if index is not None else None
+
+    def select(self, level: Optional[str] = None, topic: Optional[str] = None) -> np.ndarray:
+        """레벨/주제 조건을 만족하는 레코드 번호"""
+        selected = np.arange(len(self.words), dtype=np.int32)
+        if level:
+            selected = self.by_level.get(level.upper(), selected[:0])
+        if topic:
+            selected = np.intersect1d(selected, self.by_topic.get(topic, selected[:0]))
+        return selected
+
+    def level_topics(self, level: str) -> Dict[str, Any]:
+        """레벨 단어장 (주제별 단어 목록 - src/api/vocabulary.ts 응답 형식, 단어장 원본의 표기와 순서)"""
+        level = level.upper()
+        info = self.level_info.get(level, {})
+        topics = []
+        for topic in self.topics.values():
+            members = [self.words[self._ids[word_id]] for word_id in topic.word_ids]
+            if topic.level == level and members:
+                topics.append({
+                    "id": topic.id,
+                    "title": topic.title,
+                    "emoji": topic.emoji,
+                    "words": [word.to_card() for word in members],
+                })
+        return {
+            "level": level.lower(),
+            "title": info.get("title", f"{level} 필수 어휘"),
+            "description": info.get("description", ""),
+            "topics": topics,
+        }
+
+    def quiz(self, count: int, level: Optional[str] = None, topic: Optional[str] = None,
+             direction: str = "hu_ko", choices: int = 4, rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
+        """객관식 문항 - 오답 보기는 같은 레벨(가능하면 같은 품사)의 다른 뜻에서 추출"""
+        rng = rng or np.random.default_rng()
+        pool = self.select(level, topic)
+        if len(pool) == 0:
+            return []
+        targets = rng.choice(pool, size=min(count, len(pool)), replace=False)
+        prompt_field, answer_field = ("hungarian", "korean") if direction == "hu_ko" else ("korean", "hungarian")
+
+        questions = []
+        for target in targets.tolist():
+            word = self.words[target]
+            answer = getattr(word, answer_field)
+            level_pool = self.by_level[word.level]
+            others = level_pool[self.headword_of[level_pool] != self.headword_of[target]]
+            candidates = others[self.pos_codes[others] == self.pos_codes[target]]
+            if len(candidates) < choices - 1:
+                candidates = others
+            options = [answer]
+            for index in rng.permutation(candidates).tolist():
+                option = getattr(self.words[index], answer_field)
+                if option not in options:
+                    options.append(option)
+                if len(options) == choices:
+                    break
+            rng.shuffle(options)
+            questions.append({
+                "word_id": word.id,
+                "prompt": getattr(word, prompt_field),
+                "pronunciation": word.pronunciation,
+                "options": options,
+                "answer_index": options.index(answer),
+            })
+        return questions
+
+
+def load_vocabulary_store() -> VocabularyStore:
+    """핵심 어휘(풍부한 설명) → 레벨 단어장 순으로 합침"""
+    sources = [_core_words(filename) for filename in CORE_VOCABULARY_FILES]
+    topics, level_info = [], {}
+    for level in CEFR_LEVELS:
+        words, level_topics, info = _level_words(level)
+        sources.append(words)
+        topics.extend(level_topics)
+        level_info[level] = info
+    return VocabularyStore(sources, topics, level_info)
+
+
+@lru_cache(maxsize=1)
+def get_vocabulary_store() -> VocabularyStore:
+    """프로세스 전역 어휘 저장소 (최초 호출 시 한 번만 생성)"""
+    return load_vocabulary_store()
@@ -0,0 +1,360 @@
+"""
+FSRS 스케줄러 단위 테스트 (tests/unit/fsrsAlgorithm.test.ts 포팅)
+
+TS 테스트의 카드 하나짜리 시나리오를 ReviewDeck 열 연산으로 그대로 옮기고,
+대기열 순서와 묶음 크기 회귀 테스트를 더했다.
+실행: backend 디렉터리에서 python -m pytest tests/unit
+"""
+
+import calendar
+import math
+
+import numpy as np
+import pytest
+
+from src.services.fsrs_scheduler import (
+    CardState, DAY_SECONDS, DEFAULT_WEIGHTS, FSRSParameters, FSRSScheduler, NEW_CARD_PRIORITY, Rating, ReviewDeck,
+)
+
+
+def ts(iso: str) -> float:
+    """'2024-01-01T10:00:00Z' → epoch 초"""
+    return float(calendar.timegm(tuple(map(int, iso[:10].split("-"))) + tuple(map(int, iso[11:19].split(":")))))
+
+
+T0 = ts("2024-01-01T10:00:00Z")
+
+
+def make_deck(count: int = 1, now: float = T0, parameters: FSRSParameters = None, **columns) -> ReviewDeck:
+    """새 카드 count장 + 열 값 덮어쓰기 (TS의 { ...createCard(), stability: 30 })"""
+    deck = ReviewDeck(FSRSScheduler(parameters))
+    deck.add_cards([f"card{i}" for i in range(count)], now)
+    for name, value in columns.items():
+        deck.columns[name][:] = value
+    return deck
+
+
+def review(deck: ReviewDeck, rating: Rating, at: float = T0, row: int = 0) -> ReviewDeck:
+    deck.review(np.asarray([row]), np.asarray([int(rating)]), np.asarray([at]))
+    return deck
+
+
+def value(deck: ReviewDeck, name: str, row: int = 0) -> float:
+    return deck.columns[name][row].item()
+
+
+# ========== 카드 생성 및 초기화 ==========
+
+def test_new_card_initial_values():
+    deck = make_deck()
+    assert value(deck, "state") == CardState.NEW
+    for name in ("reps", "lapses", "stability", "difficulty", "elapsed_days", "scheduled_days"):
+        assert value(deck, name) == 0
+    assert math.isnan(value(deck, "last_review"))
+    assert value(deck, "due") == T0
+
+
+def test_multiple_cards_consistent():
+    deck = make_deck(10)
+    assert (deck.columns["state"] == CardState.NEW).all()
+    assert (deck.columns["reps"] == 0).all()
+    assert (deck.columns["lapses"] == 0).all()
+
+
+# ========== 복습 처리 및 상태 전환 ==========
+
+def test_first_review_good():
+    deck = review(make_deck(), Rating.GOOD)
+    assert value(deck, "state") == CardState.REVIEW
+    assert value(deck, "reps") == 1
+    assert value(deck, "lapses") == 0
+    assert value(deck, "last_review") == T0
+    assert value(deck, "stability") > 0
+    assert value(deck, "difficulty") > 0
+    assert value(deck, "scheduled_days") > 0
+    assert value(deck, "due") > T0
+
+
+def test_first_review_again():
+    deck = review(make_deck(), Rating.AGAIN)
+    assert value(deck, "state") == CardState.LEARNING
+    assert value(deck, "reps") == 1
+    assert value(deck, "lapses") == 1
+    assert value(deck, "stability") > 0
+    assert value(deck, "scheduled_days") > 0
+
+
+def test_learning_to_review():
+    deck = review(make_deck(), Rating.AGAIN)
+    assert value(deck, "state") == CardState.LEARNING
+    review(deck, Rating.GOOD)
+    assert value(deck, "state") == CardState.REVIEW
+    assert value(deck, "reps") == 2
+
+
+def test_review_to_relearning():
+    deck = review(make_deck(), Rating.GOOD)
+    assert value(deck, "state") == CardState.REVIEW
+    review(deck, Rating.AGAIN)
+    assert value(deck, "state") == CardState.RELEARNING
+    assert value(deck, "lapses") == 1
+
+
+@pytest.mark.parametrize("rating", list(Rating))
+def test_all_ratings(rating):
+    deck = review(make_deck(), rating)
+    assert value(deck, "reps") == 1
+    assert value(deck, "stability") > 0
+    assert value(deck, "difficulty") > 0
+    assert value(deck, "scheduled_days") > 0
+    if rating == Rating.AGAIN:
+        assert value(deck, "lapses") == 1
+        assert value(deck, "state") == CardState.LEARNING
+    else:
+        assert value(deck, "lapses") == 0
+        assert value(deck, "state") == CardState.REVIEW
+
+
+# ========== 안정성 및 난이도 계산 ==========
+
+def test_stability_increases_with_successful_reviews():
+    initial_stability = value(review(make_deck(), Rating.GOOD), "stability")
+    deck = review(review(make_deck(), Rating.GOOD), Rating.GOOD)
+    assert value(deck, "stability") > initial_stability
+
+
+def test_stability_decreases_after_again():
+    deck = review(make_deck(), Rating.GOOD)
+    before_failure = value(deck, "stability")
+    review(deck, Rating.AGAIN)
+    assert value(deck, "stability") < before_failure
+
+
+def test_difficulty_follows_rating_pattern():
+    easy = make_deck()
+    for _ in range(5):
+        review(easy, Rating.EASY)
+    hard = make_deck()
+    for rating in (Rating.AGAIN, Rating.HARD, Rating.AGAIN):
+        review(hard, rating)
+    assert value(hard, "difficulty") > value(easy, "difficulty")
+
+
+def test_difficulty_bounds():
+    deck = make_deck()
+    for _ in range(10):
+        review(deck, Rating.EASY)
+    assert value(deck, "difficulty") <= 10
+    deck = make_deck()
+    for _ in range(10):
+        review(deck, Rating.AGAIN)
+    assert value(deck, "difficulty") >= 1
+
+
+# ========== 스케줄링 및 간격 계산 ==========
+
+def test_higher_stability_longer_interval():
+    high = review(make_deck(stability=30, state=CardState.REVIEW), Rating.GOOD)
+    low = review(make_deck(stability=3, state=CardState.REVIEW), Rating.GOOD)
+    assert value(high, "scheduled_days") > value(low, "scheduled_days")
+
+
+def test_maximum_interval():
+    parameters = FSRSParameters(maximum_interval=365)
+    deck = review(make_deck(parameters=parameters, stability=1000, state=CardState.REVIEW), Rating.EASY)
+    assert value(deck, "scheduled_days") <= 365
+
+
+def test_schedule_preview_has_all_ratings():
+    schedule = make_deck().preview(0, T0)
+    assert set(schedule) == {rating.name.lower() for rating in Rating}
+    assert schedule["easy"]["scheduled_days"] >= schedule["again"]["scheduled_days"]
+
+
+def test_elapsed_days():
+    deck = review(make_deck(), Rating.GOOD, ts("2024-01-01T10:00:00Z"))
+    review(deck, Rating.GOOD, ts("2024-01-05T10:00:00Z"))
+    assert value(deck, "elapsed_days") == 4
+
+
+# ========== 기억 가능성 및 만료 계산 ==========
+
+def test_retention():
+    retention = FSRSScheduler.retention(np.full(3, 10.0), np.asarray([0.0, 10.0, 20.0]))
+    assert retention[0] == 1
+    assert retention[1] == pytest.approx(0.9, abs=0.005)
+    assert 0 < retention[2] < retention[1]
+
+
+def test_due_cards():
+    now = ts("2024-01-10T10:00:00Z")
+    deck = make_deck(2)
+    deck.columns["due"][:] = [ts("2024-01-09T10:00:00Z"), ts("2024-01-11T10:00:00Z")]
+    rows, _ = deck.due_queue(now, 10)
+    assert rows.tolist() == [0]
+
+
+# ========== 우선순위 및 성숙도 계산 ==========
+
+def test_maturity():
+    deck = make_deck(3)
+    deck.columns["state"][:] = [CardState.NEW, CardState.LEARNING, CardState.REVIEW]
+    deck.columns["stability"][:] = [0, 5, 30]
+    maturity = FSRSScheduler.maturity(deck.columns)
+    assert maturity[0] == 0
+    assert 0 < maturity[1] < 1
+    assert maturity[2] == 1
+
+
+def test_priority_lower_is_first():
+    now = ts("2024-01-10T10:00:00Z")
+    deck = make_deck(3)
+    deck.columns["state"][:] = [CardState.NEW, CardState.REVIEW, CardState.REVIEW]
+    deck.columns["due"][:] = [T0, ts("2024-01-08T10:00:00Z"), ts("2024-01-11T10:00:00Z")]
+    deck.columns["stability"][:] = [0, 5, 10]
+    new_card, overdue_card, recent_card = deck.scheduler.priority(deck.columns, now)
+    assert new_card == NEW_CARD_PRIORITY
+    assert overdue_card < recent_card
+    assert overdue_card < new_card
+
+
+def test_due_queue_serves_most_overdue_first():
+    now = ts("2024-03-01T10:00:00Z")
+    deck = make_deck(3, state=CardState.REVIEW, stability=5)
+    deck.card_ids[:] = ["fresh", "forgotten", "new"]
+    deck.columns["due"][:] = [now - DAY_SECONDS, now - 38 * DAY_SECONDS, now]
+    deck.columns["state"][2] = CardState.NEW
+    rows, priority = deck.due_queue(now, 1)
+    assert [deck.card_ids[row] for row in rows] == ["forgotten"]
+    rows, priority = deck.due_queue(now, 3)
+    assert [deck.card_ids[row] for row in rows] == ["forgotten", "fresh", "new"]
+    assert (np.diff(priority) > 0).all()
+
+
+def test_optimal_batch_size():
+    deck = make_deck(100, now=ts("2024-01-01T10:00:00Z"))
+    now = ts("2024-01-10T10:00:00Z")
+    batch_30 = deck.optimal_batch_size(30, now)
+    batch_60 = deck.optimal_batch_size(60, now)
+    assert batch_60 > batch_30 > 0
+    assert batch_60 <= len(deck)
+
+
+def test_optimal_batch_size_without_new_cards():
+    now = ts("2024-01-10T10:00:00Z")
+    deck = make_deck(100, state=CardState.REVIEW, stability=5)
+    assert deck.optimal_batch_size(60, now) == 100
+    deck.add_cards([f"new{i}" for i in range(10)], now + DAY_SECONDS)
+    assert deck.optimal_batch_size(60, now) == 100 + 5
+
+
+# ========== 통계 및 분석 ==========
+
+def test_stats():
+    deck = make_deck(5)
+    deck.columns["state"][:] = [CardState.NEW, CardState.NEW, CardState.LEARNING, CardState.REVIEW, CardState.REVIEW]
+    deck.columns["stability"][:] = [0, 0, 5, 15, 25]
+    deck.columns["difficulty"][:] = [0, 0, 6, 4, 3]
+    stats = deck.stats()
+    assert (stats["total"], stats["new"], stats["learning"], stats["review"]) == (5, 2, 1, 2)
+    assert stats["averageStability"] == pytest.approx(15, abs=0.5)
+    assert stats["averageDifficulty"] == pytest.approx(4.33, abs=0.05)
+    assert 0 < stats["maturityRate"] <= 1
+
+
+def test_stats_empty():
+    stats = ReviewDeck(FSRSScheduler()).stats()
+    assert stats == {
+        "total": 0, "new": 0, "learning": 0, "review": 0,
+        "averageStability": 0, "averageDifficulty": 0, "maturityRate": 0,
+    }
+
+
+# ========== 파라미터 ==========
+
+def test_custom_parameters():
+    parameters = FSRSParameters(request_retention=0.8, maximum_interval=100)
+    assert parameters.w.tolist() == list(DEFAULT_WEIGHTS)
+    deck = review(make_deck(parameters=parameters), Rating.GOOD)
+    assert value(deck, "scheduled_days") <= 100
+
+
+# ========== 경계값 및 예외 상황 ==========
+
+def test_very_old_review():
+    deck = review(make_deck(), Rating.GOOD, ts("2020-01-01T10:00:00Z"))
+    review(deck, Rating.GOOD, ts("2024-01-01T10:00:00Z"))
+    assert value(deck, "elapsed_days") > 1000
+    assert value(deck, "stability") > 0
+    assert value(deck, "difficulty") > 0
+
+
+def test_rapid_successive_reviews():
+    deck = make_deck()
+    for i in range(5):
+        review(deck, Rating.GOOD, T0 + i * 3600)
+    assert value(deck, "reps") == 5
+    assert value(deck, "stability") > 0
+    assert value(deck, "difficulty") > 0
+
+
+def test_future_review_date():
+    future = ts("2030-01-01T10:00:00Z")
+    deck = review(make_deck(), Rating.GOOD, future)
+    assert value(deck, "last_review") == future
+    assert value(deck, "reps") == 1
+    assert value(deck, "stability") > 0
+
+
+def test_consistency_through_reviews():
+    deck = make_deck()
+    lapses = 0
+    for reps, rating in enumerate((Rating.GOOD, Rating.HARD, Rating.AGAIN, Rating.GOOD, Rating.EASY), start=1):
+        review(deck, rating)
+        lapses += rating == Rating.AGAIN
+        assert value(deck, "reps") == reps
+        assert value(deck, "lapses") == lapses
+        assert value(deck, "stability") > 0
+        assert 1 <= value(deck, "difficulty") <= 10
+
+
+def test_batched_reviews_match_sequential():
+    ratings = [Rating.GOOD, Rating.AGAIN, Rating.HARD, Rating.EASY]
+    times = [T0 + i * DAY_SECONDS for i in range(len(ratings))]
+    sequential = make_deck()
+    for rating, at in zip(ratings, times):
+        review(sequential, rating, at)
+    batched = make_deck()
+    batched.review(np.zeros(len(ratings), dtype=np.int64), np.asarray([int(r) for r in ratings]), np.asarray(times))
+    for name in sequential.columns:
+        np.testing.assert_array_equal(batched.columns[name], sequential.columns[name])
+
+
+# ========== 실제 사용 시나리오 ==========
+
+def test_typical_learning_session():
+    deck = make_deck(10)
+    for day in range(7):
+        review_date = T0 + day * DAY_SECONDS
+        for index in range(10):
+            if deck.columns["due"][index] <= review_date:
+                rating = (Rating.AGAIN if index % 4 == 0 else Rating.HARD if index % 3 == 0
+                          else Rating.GOOD if index % 2 == 0 else Rating.EASY)
+                review(deck, rating, review_date, index)
+    stats = deck.stats()
+    assert stats["total"] == 10
+    assert stats["new"] < 10
+
+
+def test_forgetting_and_relearning():
+    deck = review(make_deck(), Rating.GOOD)
+    assert value(deck, "state") == CardState.REVIEW
+    for _ in range(3):
+        review(deck, Rating.GOOD)
+    high_stability = value(deck, "stability")
+    review(deck, Rating.AGAIN)
+    assert value(deck, "state") == CardState.RELEARNING
+    assert value(deck, "stability") < high_stability
+    review(deck, Rating.GOOD)
+    assert value(deck, "state") == CardState.REVIEW
+    assert value(deck, "lapses") == 1